@@ -0,0 +1,18 @@
+"""
+Audio package - sound playback and synthesis, optionally in a separate host process
+"""
+
+
+def get_audio_engine():
+    """
+    Get the shared audio engine, importing the audio modules on first use
+
+    Simulation code calls this instead of importing AudioEngine at module
+    level, so loading entities (e.g. in tools/mining_simulator.py) doesn't
+    pull in the audio stack and numpy.
+
+    Returns:
+        The engine of the configured backend (see AudioEngine.get_instance)
+    """
+    from audio.audio_engine import AudioEngine
+    return AudioEngine.get_instance()
@@ -1,65 +1,231 @@
+"""
+Audio Engine - plays sounds and synthesized tones through pyo
+
+Sample playback uses a fixed pool of reusable voices. Every timed event
+(voice releases, delayed chord notes) runs on a single scheduler thread, so
+no thread is started per sound.
+
+The number of mixer objects is bounded no matter how many events happen:
+samples are capped per sound and in total (stealing voices beyond that),
+identical triggers close together merge into one louder voice, and
+synthesized sounds are skipped while too many are playing.
+
+Sound files are loaded on first use (see SoundCache), so creating the engine
+only boots the audio server; a background thread preloads the short sounds.
+Mining sounds are synthesized once per variant and cached (see OreSoundCache).
+Sounds given a position are attenuated, panned and culled in one batch per
+frame when update_listener() is called (see SpatialAudio).
+
+The backend is picked with the VSG_AUDIO_BACKEND environment variable:
+    process  - the sound device, driven from a child process (default, see AudioHost)
+    pyo      - the sound device, in the game process
+    offline  - pyo without a device; render() writes what was played to a WAV file
+    null     - no audio at all, calls are only recorded (see NullAudioEngine)
+pyo is imported when the engine boots, not when this module is imported.
+"""
+
+import os
 import threading
-import weakref
-
-import pyo
-from pyo import Server, Sine, Fader, Phasor, SfPlayer, TableRead, SndTable
-from pyo.lib import generators, filters
+import time
 
+from audio.ore_sounds import OreSoundCache
+from audio.resample_cache import ResampleCache
 from audio.sound_bank import SoundBank
+from audio.sound_cache import SoundCache, SOUND_MEMORY_BUDGET
+from audio.spatial_audio import SpatialAudio, CENTER_PAN
+from audio.voice_pool import VoicePool, STEAL_OLDEST
+from audio.voice_scheduler import VoiceScheduler
+
+# Audio Constants - Easy to tune
+VOICE_POOL_SIZE = 32             # Sample voices that can play at once
+VOICE_STEAL_POLICY = STEAL_OLDEST  # Which voice to reuse when a limit is reached (STEAL_OLDEST or STEAL_QUIETEST)
+DEFAULT_SOUND_VOICE_LIMIT = 4    # Voices one sound may use at once, unless listed below
+SOUND_VOICE_LIMITS = {
+    SoundBank.LASER_BEAM: 8,     # One per laser beam on screen
+    SoundBank.WARNING: 1,
+}
+MERGE_WINDOW = 0.05              # Seconds within which identical triggers merge into one louder voice
+MAX_MERGED_VOLUME = 1.0          # Volume cap of a merged voice
+STREAMED_SOUNDS = (SoundBank.LASER_BEAM,)  # Loops played from disk (long sounds also stream, see SoundCache)
+PRELOAD_SOUNDS = tuple(SoundBank)  # Loaded in the background at startup (streamed sounds are skipped)
+SERVER_SAMPLE_RATE = 44100       # Sample rate of the audio server, and of the converted sound files
+PREPITCHED_SHIFTS = (1.25, 1.5)  # pitch_shift values played from their own pre-pitched tables
+SYNTH_OBJECT_LIMIT = 256         # Live synthesized pyo objects (tones, chords) - new ones are skipped beyond this
+
+# Audio backends
+AUDIO_BACKEND_ENV = "VSG_AUDIO_BACKEND"
+BACKEND_PROCESS = "process"
+BACKEND_PYO = "pyo"
+BACKEND_OFFLINE = "offline"
+BACKEND_NULL = "null"
+DEFAULT_AUDIO_BACKEND = BACKEND_PROCESS
+
+
+def get_audio_backend():
+    """Get the backend selected by VSG_AUDIO_BACKEND"""
+    backend = os.environ.get(AUDIO_BACKEND_ENV, DEFAULT_AUDIO_BACKEND).strip().lower()
+    if backend not in (BACKEND_PROCESS, BACKEND_PYO, BACKEND_OFFLINE, BACKEND_NULL):
+        print(f"Warning: Unknown audio backend '{backend}', using {DEFAULT_AUDIO_BACKEND}")
+        backend = DEFAULT_AUDIO_BACKEND
+    return backend
 
 
 class AudioEngine:
     _instance = None
 
-    def __init__(self):
+    def __init__(self, backend=BACKEND_PYO):
+        """
+        Boot the audio server
+
+        Args:
+            backend: BACKEND_PYO or BACKEND_OFFLINE
+        """
         if AudioEngine._instance is not None:
             raise RuntimeError("Use AudioEngine.get_instance() instead of creating directly.")
         
-        self.server = Server().boot()
-        self.server.start()
-
-        # Strong references to prevent GC
-        self._active = []
+        from pyo import Server
+        
+        self.backend = backend
+        if backend == BACKEND_OFFLINE:
+            # Offline servers process audio only while render() runs
+            self.server = Server(sr=SERVER_SAMPLE_RATE, audio="offline").boot()
+        else:
+            self.server = Server(sr=SERVER_SAMPLE_RATE).boot()
+            self.server.start()
+
+        # Strong references to prevent GC of synthesized objects (tones, chords)
+        self._active = {}   # id(obj) -> obj - pyo objects are not hashable
+        self._active_lock = threading.Lock()
+        
+        # Reusable sample voices, and the thread that releases them when they end
+        self.voices = VoicePool(
+            VOICE_POOL_SIZE,
+            sound_limits=SOUND_VOICE_LIMITS,
+            default_sound_limit=DEFAULT_SOUND_VOICE_LIMIT,
+            steal_policy=VOICE_STEAL_POLICY,
+            merge_window=MERGE_WINDOW,
+            max_merged_volume=MAX_MERGED_VOLUME
+        )
+        self.scheduler = VoiceScheduler()
+        
+        # Sound files load on first use; the short ones are preloaded in the background
+        # Tables are converted to the server rate once and kept on disk
+        self.sounds = SoundCache(
+            budget_bytes=SOUND_MEMORY_BUDGET,
+            streamed_sounds=STREAMED_SOUNDS,
+            is_playing=self.voices.is_playing,
+            resampler=ResampleCache(self.server.getSamplingRate()),
+            prepitched_shifts=PREPITCHED_SHIFTS
+        )
+        self.sounds.preload(PRELOAD_SOUNDS)
+        
+        # Procedural mining sounds, rendered on first use
+        self.ore_sounds = OreSoundCache(self._make_table, self.server.getSamplingRate())
         
-        # Load all sound files into memory
-        self.sound_tables = {}
-        for sound in SoundBank:
-            try:
-                self.sound_tables[sound] = SndTable(sound.value)
-            except:
-                print(f"Failed to load sound: {sound.name} from {sound.value}")
+        # Positioned sounds, mixed once per frame
+        self.spatial = SpatialAudio()
 
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
-            cls._instance = AudioEngine()
+            backend = get_audio_backend()
+            if backend == BACKEND_NULL:
+                from audio.null_audio_engine import NullAudioEngine
+                cls._instance = NullAudioEngine()
+            elif backend == BACKEND_PROCESS:
+                from audio.audio_host import RemoteAudioEngine
+                cls._instance = RemoteAudioEngine()
+            else:
+                cls._instance = AudioEngine(backend)
         return cls._instance
 
-    def get_sound(self, sound_bank_item: SoundBank) -> SndTable:
-        """Get a loaded sound table by its SoundBank enum."""
-        return self.sound_tables.get(sound_bank_item)
+    def render(self, path, duration):
+        """
+        Render the sounds started so far to a WAV file (offline backend only)
+
+        The voice scheduler runs on wall-clock time, so sounds should be
+        started before rendering and releases during the render are not
+        sample accurate. Meant for short scripted scenes and benchmarks.
+
+        Args:
+            path: WAV file to write
+            duration: Seconds of audio to render
+
+        Returns:
+            float: Wall-clock seconds the render took
+        """
+        if self.backend != BACKEND_OFFLINE:
+            raise RuntimeError("render() needs the offline audio backend")
+        self.server.recordOptions(dur=duration, filename=path, fileformat=0, sampletype=0)
+        start = time.perf_counter()
+        self.server.start()   # Blocks until the whole duration is rendered
+        return time.perf_counter() - start
+
+    def is_ready(self):
+        """Check if the sound tables have been preloaded (the loading screen waits for this)"""
+        return self.sounds.is_preloaded()
+
+    def get_sound(self, sound_bank_item: SoundBank):
+        """Get the sound table of a SoundBank item, loading it if needed (None if it can't be loaded)."""
+        return self.sounds.get_table(sound_bank_item)
+
+    @staticmethod
+    def _make_table(samples):
+        """Wrap rendered samples in a pyo table"""
+        from pyo import DataTable
+        return DataTable(size=len(samples), init=samples.tolist())
 
     def _track(self, obj, dur=None):
-        self._active.append(obj)
+        """Keep a synthesized object alive, and stop it after dur seconds if given"""
+        with self._active_lock:
+            self._active[id(obj)] = obj
 
         if dur:
-            def _stop_and_release():
-                import time
-                time.sleep(dur)
-                obj.stop()
-                try:
-                    self._active.remove(obj)
-                except ValueError:
-                    pass  # Already removed or not found
+            self.scheduler.schedule(dur, self._stop_and_release, obj)
+
+    def _synth_budget_left(self, objects):
+        """Check that a synthesized sound of this many objects fits under SYNTH_OBJECT_LIMIT"""
+        with self._active_lock:
+            return len(self._active) + objects <= SYNTH_OBJECT_LIMIT
+
+    def _stop_and_release(self, obj):
+        """Scheduler callback - stop a tracked object and let it be collected"""
+        obj.stop()
+        with self._active_lock:
+            self._active.pop(id(obj), None)
 
-            threading.Thread(target=_stop_and_release, daemon=True).start()
+    def stop_all(self):
+        """Stop every sample voice"""
+        self.voices.stop_all()
+
+    def set_master_volume(self, volume):
+        """Set the volume of everything the engine plays"""
+        self.server.setAmp(volume)
+
+    def shutdown(self):
+        """Stop every sound and the scheduler thread"""
+        self.scheduler.shutdown(run_pending=True)
+        self.voices.stop_all()
 
     def play_sine(self, freq=440, amp=0.1, dur=None):
+        if not self._synth_budget_left(1):
+            return None
+        from pyo import Sine
         osc = Sine(freq=freq, mul=amp).out()
         self._track(osc, dur)
         return osc
 
-    def play_sound(self, sound: SoundBank, volume=1.0, loop=False, duration=None, pitch_shift=1.0):
+    def update_listener(self, x, y):
+        """
+        Play the positioned sounds queued this frame, as heard from a position
+        
+        Args:
+            x, y: Listener position (the player's ship)
+        """
+        self.spatial.flush(x, y)
+
+    def play_sound(self, sound: SoundBank, volume=1.0, loop=False, duration=None, pitch_shift=1.0,
+                   position=None, pan=CENTER_PAN):
         """
         Play a sound file from the SoundBank.
         
@@ -67,19 +233,67 @@ class AudioEngine:
             sound: SoundBank enum value for the sound to play
             volume: Volume multiplier (0.0 to 1.0)
             loop: Whether to loop the sound
+            duration: Seconds to play for (defaults to the length of the sound, or until stopped if looping)
+            pitch_shift: Playback speed multiplier
+            position: (x, y) of the emitter - queues the sound until update_listener()
+            pan: Stereo position of an unpositioned sound (0 = left, 1 = right)
         
         """
-        table = self.get_sound(sound)
-        if table is None:
+        if position is not None:
+            self.spatial.emit(position, volume, self.play_sound, sound=sound, loop=loop, duration=duration,
+                              pitch_shift=pitch_shift)
+            return
+        
+        if self.sounds.is_streamed(sound):
+            info = self.sounds.info(sound)
+            source = sound.value if info is not None else None
+            length = info.duration if info is not None else 0.0
+        else:
+            source = self.sounds.get_table(sound, pitch_shift)
+            # A table's rate is how many times per second it is read through at its original pitch
+            length = 1.0 / source.getRate() if source is not None else 0.0
+            pitch_shift /= self.sounds.baked_pitch(pitch_shift)
+        if source is None:
             print(f"Sound not found: {sound.name}")
             return
+        self._start_voice(source, sound, length, volume, loop, duration, pitch_shift, pan)
 
-        player = TableRead(table=table, freq=table.getRate() * pitch_shift, loop=loop, mul=volume).out()
+    def play_ore_sound(self, ore_type, hit_type, amount, volume=1.0, position=None, pan=CENTER_PAN):
+        """
+        Play the procedural mining sound of a hit
+        
+        Args:
+            ore_type: InventoryType of the mined ore
+            hit_type: HitType of the hit
+            amount: Amount of ore mined
+            volume: Volume multiplier (0.0 to 1.0)
+            position: (x, y) of the emitter - queues the sound until update_listener()
+            pan: Stereo position of an unpositioned sound (0 = left, 1 = right)
+        """
+        if position is not None:
+            self.spatial.emit(position, volume, self.play_ore_sound, ore_type=ore_type, hit_type=hit_type,
+                              amount=amount)
+            return
+        
+        key = self.ore_sounds.key(ore_type, hit_type, amount)
+        table = self.ore_sounds.get_table(key)
+        self._start_voice(table, key, 1.0 / table.getRate(), volume, False, None, 1.0, pan)
+
+    def _start_voice(self, source, sound, length, volume, loop, duration, pitch_shift, pan):
+        """Start a table or stream on a pooled voice and schedule its release"""
+        voice, generation, merged = self.voices.acquire(source, sound, volume, loop, pitch_shift, time.monotonic(),
+                                                        pan)
+        if merged:
+            # Folded into a voice started moments ago, which already has its release scheduled
+            return
 
         if not duration:
-            duration = table.getSize() / table.getRate()
+            if loop:
+                # Loops without a duration play until stolen or stopped
+                return
+            duration = length / pitch_shift
         
-        self._track(player, duration)
+        self.scheduler.schedule(duration, self.voices.release, voice, generation)
 
     def play_chord(self, base_freq=440, amp=0.1, spread=0.1, dur=1.0):
         """
@@ -92,8 +306,16 @@ class AudioEngine:
             amp: Amplitude for each note (default 0.1)
             spread: Time between notes in seconds (default 0.1)
             dur: Total duration for each note (default 1.0)
+            
+        Returns:
+            float: Total duration of the chord, or None if too many sounds are playing
         """
-        from pyo import Noise, ButBP, Pan  # Add Pan for stereo
+        # 5 shared objects (bass, bass pan, faders, noise) plus 5 per note
+        if not self._synth_budget_left(20):
+            return None
+        
+        from pyo import Noise, ButBP, Pan, Fader, Sine  # Add Pan for stereo
+        from pyo.lib import generators, filters
 
         # Create frequencies for a major chord (1, 5/4, 3/2)
         freqs = [base_freq, base_freq * 7/4, base_freq * 11/4]
@@ -132,14 +354,11 @@ class AudioEngine:
         pan_positions = [-0.7, 0, 0.7]
 
         for i, freq in enumerate(freqs):
-            # Start each note after a delay
+            # Start each note after a delay, on the scheduler thread
             if i == 0:
                 play_delayed_note(freq, pan_positions[i])
             else:
-                def delayed_note(f, pos, delay):
-                    time.sleep(delay)
-                    play_delayed_note(f, pos)
-                threading.Thread(target=delayed_note, args=(freq, pan_positions[i], i * spread), daemon=True).start()
+                self.scheduler.schedule(i * spread, play_delayed_note, freq, pan_positions[i])
 
         # Track our continuous elements
         self._track(bass, total_dur)
@@ -153,9 +372,7 @@ class AudioEngine:
 
 
 if __name__ == "__main__":
-    import time
     # Example usage
     audio_engine = AudioEngine.get_instance()
-    # audio_engine.play_chord(base_freq=440, amp=0.3, spread=0.1, dur=2.0)
-    audio_engine.play_bling(dur=0.5)
+    audio_engine.play_chord(base_freq=440, amp=0.3, spread=0.1, dur=2.0)
     time.sleep(2.5)
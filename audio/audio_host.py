@@ -0,0 +1,246 @@
+"""
+Audio Host - runs the audio engine in a child process, fed by a command pipe
+
+The game process only packs each call into a fixed-size command and writes it
+to a pipe (positioned sounds are attenuated and culled first, so inaudible
+ones are never sent); pyo, the voice pool and the scheduler thread all live in the child
+process, so mixer work and the child's garbage collection never take time
+from the game loop. A command is smaller than the pipe's atomic write size
+and the write end is non-blocking: when the host falls behind and the pipe
+is full, commands are dropped instead of stalling the frame.
+
+A second pipe runs the other way and carries a single message: the host
+sends it once its sound tables are preloaded, so the loading screen can
+wait for them.
+"""
+
+import multiprocessing
+import os
+import struct
+import threading
+
+from audio.audio_engine import AudioEngine, BACKEND_PYO
+from audio.sound_bank import SoundBank
+from audio.spatial_audio import SpatialAudio, CENTER_PAN
+from game_state.inventory_types import HitType, InventoryType
+
+# Command opcodes
+OP_PLAY_SOUND = 1
+OP_PLAY_SINE = 2
+OP_PLAY_CHORD = 3
+OP_STOP_ALL = 4
+OP_SET_MASTER_VOLUME = 5
+OP_SHUTDOWN = 6
+OP_PLAY_ORE_SOUND = 7
+
+# opcode, two byte arguments (sound id and loop flag, or ore type and hit type), padding,
+# then four float parameters
+COMMAND = struct.Struct("<BBBxffff")
+
+# Sent on the ready pipe once the host's sound tables are preloaded
+READY_MESSAGE = b"ready"
+
+SOUNDS = tuple(SoundBank)
+SOUND_IDS = {sound: index for index, sound in enumerate(SOUNDS)}
+
+# Audio Host Constants - Easy to tune
+AUDIO_HOST_JOIN_TIMEOUT = 1.0   # Seconds to wait for the host to exit on shutdown
+
+
+def run_audio_host(connection, backend=BACKEND_PYO, ready_connection=None):
+    """
+    Child process main loop - boot the engine and run commands until shutdown
+
+    Args:
+        connection: Receiving end of the command pipe
+        backend: Backend of the engine in the child (BACKEND_PYO or BACKEND_OFFLINE)
+        ready_connection: Sending end of the ready pipe, or None
+    """
+    try:
+        engine = AudioEngine(backend)
+    except Exception as e:
+        print(f"Warning: Audio host failed to start: {e}")
+        if ready_connection is not None:
+            # The game sees the pipe close and stops waiting
+            ready_connection.close()
+        return
+    AudioEngine._instance = engine
+
+    if ready_connection is not None:
+        # Commands are run while the tables load, so wait on another thread
+        threading.Thread(target=_report_ready, args=(engine, ready_connection), name="audio-host-ready",
+                         daemon=True).start()
+
+    while True:
+        try:
+            data = connection.recv_bytes()
+        except (EOFError, OSError):
+            # The game closed the pipe or exited
+            break
+        if not _run_commands(engine, data):
+            break
+    engine.shutdown()
+
+
+def _report_ready(engine, ready_connection):
+    """Tell the game once the engine's sound tables are preloaded"""
+    engine.sounds.wait_for_preload()
+    try:
+        ready_connection.send_bytes(READY_MESSAGE)
+    except OSError:
+        pass
+    ready_connection.close()
+
+
+def _run_commands(engine, data):
+    """
+    Run the packed commands of one message
+
+    Returns:
+        bool: False once a shutdown command was seen
+    """
+    for opcode, sound_id, loop, a, b, c, d in COMMAND.iter_unpack(data):
+        try:
+            if opcode == OP_PLAY_SOUND:
+                engine.play_sound(SOUNDS[sound_id], volume=a, loop=bool(loop), duration=b or None, pitch_shift=c,
+                                  pan=d)
+            elif opcode == OP_PLAY_ORE_SOUND:
+                engine.play_ore_sound(InventoryType(sound_id), HitType(loop), a, volume=b, pan=c)
+            elif opcode == OP_PLAY_SINE:
+                engine.play_sine(freq=a, amp=b, dur=c or None)
+            elif opcode == OP_PLAY_CHORD:
+                engine.play_chord(base_freq=a, amp=b, spread=c, dur=d)
+            elif opcode == OP_STOP_ALL:
+                engine.stop_all()
+            elif opcode == OP_SET_MASTER_VOLUME:
+                engine.set_master_volume(a)
+            elif opcode == OP_SHUTDOWN:
+                return False
+        except Exception as e:
+            print(f"Warning: Audio command {opcode} failed: {e}")
+    return True
+
+
+class RemoteAudioEngine:
+    """Same public interface as AudioEngine, playing through an audio host process"""
+
+    backend = "process"
+
+    def __init__(self, host_backend=BACKEND_PYO):
+        """
+        Start the audio host process
+
+        Args:
+            host_backend: Backend of the engine in the host process
+        """
+        # Spawn rather than fork: the game process may already hold a GL context and threads
+        context = multiprocessing.get_context("spawn")
+        receiver, self._connection = context.Pipe(duplex=False)
+        self._ready_connection, ready_sender = context.Pipe(duplex=False)
+        self.process = context.Process(target=run_audio_host, args=(receiver, host_backend, ready_sender),
+                                       name="audio-host", daemon=True)
+        self.process.start()
+        receiver.close()
+        ready_sender.close()
+        self.ready = False
+
+        try:
+            os.set_blocking(self._connection.fileno(), False)
+        except (OSError, AttributeError):
+            # Platforms without non-blocking pipes block when the pipe is full instead of dropping
+            pass
+
+        # Positioned sounds are mixed here, before they are sent
+        self.spatial = SpatialAudio()
+
+        self.sent_count = 0
+        self.dropped_count = 0
+        self._closed = False
+
+    def _send(self, opcode, sound_id=0, loop=False, a=0.0, b=0.0, c=0.0, d=0.0):
+        """Pack and send one command, dropping it if the pipe is full or the host is gone"""
+        if self._closed:
+            return
+        try:
+            self._connection.send_bytes(COMMAND.pack(opcode, sound_id, loop, a, b, c, d))
+            self.sent_count += 1
+        except BlockingIOError:
+            self.dropped_count += 1
+        except (BrokenPipeError, OSError):
+            print("Warning: Audio host is not running, audio is disabled")
+            self._closed = True
+
+    def is_ready(self):
+        """Check if the host has preloaded its sound tables (or is gone, so there is nothing to wait for)"""
+        if not self.ready:
+            try:
+                if self._ready_connection.poll():
+                    self._ready_connection.recv_bytes()
+                    self.ready = True
+            except (EOFError, OSError):
+                self.ready = True
+            if not self.ready and not self.process.is_alive():
+                self.ready = True
+            if self.ready:
+                self._ready_connection.close()
+        return self.ready
+
+    def get_sound(self, sound_bank_item):
+        """Sound tables live in the host process"""
+        return None
+
+    def update_listener(self, x, y):
+        """Send the positioned sounds queued this frame that are audible from a position"""
+        self.spatial.flush(x, y)
+
+    def play_sound(self, sound, volume=1.0, loop=False, duration=None, pitch_shift=1.0, position=None,
+                   pan=CENTER_PAN):
+        """Queue a play_sound call (see AudioEngine.play_sound)"""
+        if position is not None:
+            self.spatial.emit(position, volume, self.play_sound, sound=sound, loop=loop, duration=duration,
+                              pitch_shift=pitch_shift)
+            return
+        self._send(OP_PLAY_SOUND, SOUND_IDS[sound], loop, volume, duration or 0.0, pitch_shift, pan)
+
+    def play_ore_sound(self, ore_type, hit_type, amount, volume=1.0, position=None, pan=CENTER_PAN):
+        """Queue a play_ore_sound call (see AudioEngine.play_ore_sound)"""
+        if position is not None:
+            self.spatial.emit(position, volume, self.play_ore_sound, ore_type=ore_type, hit_type=hit_type,
+                              amount=amount)
+            return
+        self._send(OP_PLAY_ORE_SOUND, ore_type.value, hit_type.value, amount, volume, pan)
+
+    def play_sine(self, freq=440, amp=0.1, dur=None):
+        """Queue a play_sine call - the oscillator lives in the host, so nothing is returned"""
+        self._send(OP_PLAY_SINE, a=freq, b=amp, c=dur or 0.0)
+        return None
+
+    def play_chord(self, base_freq=440, amp=0.1, spread=0.1, dur=1.0):
+        """Queue a play_chord call and return the duration the chord will have"""
+        self._send(OP_PLAY_CHORD, a=base_freq, b=amp, c=spread, d=dur)
+        return dur + 2 * spread
+
+    def stop_all(self):
+        """Queue a stop of every sound"""
+        self._send(OP_STOP_ALL)
+
+    def set_master_volume(self, volume):
+        """Queue a master volume change"""
+        self._send(OP_SET_MASTER_VOLUME, a=volume)
+
+    def shutdown(self):
+        """Stop the host process"""
+        if self._closed:
+            return
+        try:
+            os.set_blocking(self._connection.fileno(), True)
+        except (OSError, AttributeError):
+            pass
+        self._send(OP_SHUTDOWN)
+        self._closed = True
+        self._connection.close()
+        if not self.ready:
+            self._ready_connection.close()
+        self.process.join(AUDIO_HOST_JOIN_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
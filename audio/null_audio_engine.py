@@ -0,0 +1,101 @@
+"""
+Null Audio Engine - AudioEngine stand-in that records calls instead of playing them
+
+Selected with VSG_AUDIO_BACKEND=null. It never imports pyo or opens a sound
+device, so simulations, tools and benchmarks run on machines without audio.
+The recorded calls let them check which sounds the game asked for.
+"""
+
+import time
+from collections import deque
+
+# Null Audio Constants - Easy to tune
+NULL_AUDIO_CALL_HISTORY = 10000   # Calls kept in NullAudioEngine.calls (oldest dropped first)
+
+
+class AudioCall:
+    """One recorded call to the audio engine"""
+
+    __slots__ = ("name", "args", "kwargs", "timestamp")
+
+    def __init__(self, name, args, kwargs):
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.timestamp = time.monotonic()
+
+    def __repr__(self):
+        return f"AudioCall({self.name}, {self.args}, {self.kwargs})"
+
+
+class NullAudioEngine:
+    """Same public interface as AudioEngine, without any audio"""
+
+    backend = "null"
+
+    def __init__(self, history=NULL_AUDIO_CALL_HISTORY):
+        """
+        Initialize the recorder
+
+        Args:
+            history: Number of calls to keep
+        """
+        self.calls = deque(maxlen=history)
+        self.call_count = 0
+
+    def _record(self, name, args, kwargs):
+        self.calls.append(AudioCall(name, args, kwargs))
+        self.call_count += 1
+
+    def is_ready(self):
+        """There is nothing to preload"""
+        return True
+
+    def get_sound(self, sound_bank_item):
+        """No sounds are ever loaded"""
+        return None
+
+    def update_listener(self, x, y):
+        """Positioned sounds are recorded as they are played, so there is nothing to mix"""
+        pass
+
+    def play_sound(self, sound, volume=1.0, loop=False, duration=None, pitch_shift=1.0, position=None, pan=0.5):
+        """Record a play_sound call"""
+        self._record("play_sound", (sound,), {"volume": volume, "loop": loop, "duration": duration,
+                                               "pitch_shift": pitch_shift, "position": position, "pan": pan})
+
+    def play_ore_sound(self, ore_type, hit_type, amount, volume=1.0, position=None, pan=0.5):
+        """Record a play_ore_sound call"""
+        self._record("play_ore_sound", (ore_type, hit_type, amount), {"volume": volume, "position": position,
+                                                                       "pan": pan})
+
+    def play_sine(self, freq=440, amp=0.1, dur=None):
+        """Record a play_sine call"""
+        self._record("play_sine", (), {"freq": freq, "amp": amp, "dur": dur})
+        return None
+
+    def play_chord(self, base_freq=440, amp=0.1, spread=0.1, dur=1.0):
+        """Record a play_chord call and return the duration the chord would have"""
+        self._record("play_chord", (), {"base_freq": base_freq, "amp": amp, "spread": spread, "dur": dur})
+        return dur + 2 * spread
+
+    def stop_all(self):
+        """Record a stop_all call"""
+        self._record("stop_all", (), {})
+
+    def set_master_volume(self, volume):
+        """Record a set_master_volume call"""
+        self._record("set_master_volume", (volume,), {})
+
+    def calls_named(self, name):
+        """Get the recorded calls of one method"""
+        return [call for call in self.calls if call.name == name]
+
+    def clear(self):
+        """Forget the recorded calls"""
+        self.calls.clear()
+        self.call_count = 0
+
+    def shutdown(self):
+        """Nothing to stop"""
+        pass
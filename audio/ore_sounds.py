@@ -0,0 +1,184 @@
+"""
+Ore Sounds - procedural mining sounds, rendered once per variant into wavetables
+
+Each ore type has its own sound profile: an FM tone whose modulation index
+grows with the amount mined, with a tremolo that gets faster and deeper on
+critical hits and a pitch raised by the hit multiplier. Instead of building
+a DSP graph for every hit, each (ore type, hit type, amount bucket) variant
+is rendered once with NumPy and kept as a table in an LRU cache, so playing
+it costs one table reader. Rendered samples can also be kept on disk, keyed
+by a hash of everything that shapes the sound.
+"""
+
+import hashlib
+import os
+from bisect import bisect_left
+from collections import OrderedDict
+
+import numpy as np
+
+from game_state.inventory_types import InventoryType
+
+# Ore Sound Constants - Easy to tune
+ORE_SOUND_DURATION = 0.35                  # Seconds per mining sound
+ORE_SOUND_ATTACK = 0.005                   # Seconds of fade-in
+ORE_SOUND_DECAY = 8.0                      # Exponential decay rate of the envelope (1/s)
+ORE_SOUND_AMOUNT_BUCKETS = (10, 20, 25, 30)  # Upper bounds of the amount buckets - more ore, brighter sound
+ORE_SOUND_FM_INDEX_STEP = 0.6              # Extra FM index per amount bucket
+ORE_SOUND_TREMOLO = {                      # Hit type name -> (tremolo rate Hz, depth 0-1)
+    "normal": (0.0, 0.0),
+    "critical": (14.0, 0.3),
+    "super_critical": (22.0, 0.5),
+}
+ORE_SOUND_CACHE_SIZE = 64                  # Variants kept as tables in memory
+ORE_SOUND_CACHE_DIR = "cache/ore_sounds"   # Rendered samples kept on disk (None to disable)
+ORE_SOUND_VERSION = 1                      # Bump when the synthesis changes, to ignore old disk files
+
+
+class OreSoundProfile:
+    """Synthesis parameters of one ore type"""
+
+    __slots__ = ("base_freq", "mod_ratio", "mod_index")
+
+    def __init__(self, base_freq, mod_ratio, mod_index):
+        """
+        Args:
+            base_freq: Carrier frequency in Hz
+            mod_ratio: Modulator frequency as a multiple of the carrier
+            mod_index: FM index of the smallest amount bucket
+        """
+        self.base_freq = base_freq
+        self.mod_ratio = mod_ratio
+        self.mod_index = mod_index
+
+
+ORE_SOUND_PROFILES = {
+    InventoryType.VELDSPAR: OreSoundProfile(440.0, 1.0, 0.8),      # Plain, round
+    InventoryType.SCORDITE: OreSoundProfile(523.3, 2.0, 1.2),      # Hollow, octave partials
+    InventoryType.PYROXERES: OreSoundProfile(392.0, 1.5, 1.5),     # Warm fifth
+    InventoryType.PLAGIOCLASE: OreSoundProfile(587.3, 3.5, 1.0),   # Glassy, inharmonic
+    InventoryType.OMBER: OreSoundProfile(329.6, 1.41, 2.2),        # Metallic, rare ore
+}
+DEFAULT_ORE_SOUND_PROFILE = OreSoundProfile(440.0, 1.0, 0.8)
+
+
+def amount_bucket(amount):
+    """Index of the amount bucket an amount of ore falls into"""
+    return min(bisect_left(ORE_SOUND_AMOUNT_BUCKETS, amount), len(ORE_SOUND_AMOUNT_BUCKETS) - 1)
+
+
+def render_ore_sound(profile, hit_type, bucket, sample_rate):
+    """
+    Render one mining sound variant
+
+    Args:
+        profile: OreSoundProfile of the ore
+        hit_type: HitType of the hit
+        bucket: Amount bucket (see amount_bucket)
+        sample_rate: Samples per second
+
+    Returns:
+        np.ndarray: Mono float32 samples in [-1, 1]
+    """
+    t = np.arange(int(ORE_SOUND_DURATION * sample_rate), dtype=np.float64) / sample_rate
+    carrier = profile.base_freq * hit_type.multiplier
+    index = profile.mod_index + bucket * ORE_SOUND_FM_INDEX_STEP
+    modulator = np.sin(2 * np.pi * carrier * profile.mod_ratio * t)
+    tone = np.sin(2 * np.pi * carrier * t + index * modulator)
+
+    rate, depth = ORE_SOUND_TREMOLO.get(hit_type.name_display, (0.0, 0.0))
+    tremolo = 1.0 - depth * 0.5 * (1.0 - np.cos(2 * np.pi * rate * t))
+    envelope = np.minimum(1.0, t / ORE_SOUND_ATTACK) * np.exp(-ORE_SOUND_DECAY * t)
+    return (tone * tremolo * envelope).astype(np.float32)
+
+
+def ore_sound_hash(profile, hit_type, bucket, sample_rate):
+    """Hash of every parameter that shapes a variant - the name of its disk cache file"""
+    parameters = (
+        ORE_SOUND_VERSION, sample_rate, ORE_SOUND_DURATION, ORE_SOUND_ATTACK, ORE_SOUND_DECAY,
+        profile.base_freq, profile.mod_ratio, profile.mod_index,
+        hit_type.multiplier, ORE_SOUND_TREMOLO.get(hit_type.name_display),
+        bucket, ORE_SOUND_FM_INDEX_STEP,
+    )
+    return hashlib.sha1(repr(parameters).encode()).hexdigest()
+
+
+class OreSoundCache:
+    """LRU cache of rendered mining sound tables"""
+
+    def __init__(self, make_table, sample_rate, capacity=ORE_SOUND_CACHE_SIZE, cache_dir=ORE_SOUND_CACHE_DIR):
+        """
+        Initialize an empty cache
+
+        Args:
+            make_table: Function float32 samples -> playable table (e.g. a pyo DataTable)
+            sample_rate: Sample rate to render at (the audio server's)
+            capacity: Variants kept in memory
+            cache_dir: Directory of the disk cache, or None to render every miss
+        """
+        self.make_table = make_table
+        self.sample_rate = int(sample_rate)
+        self.capacity = capacity
+        self.cache_dir = cache_dir
+        self._tables = OrderedDict()   # (ore type, hit type, bucket) -> table, least recently used first
+
+        # Counters for tuning the capacity
+        self.hits = 0
+        self.renders = 0
+        self.disk_loads = 0
+
+    def key(self, ore_type, hit_type, amount):
+        """Cache key of the variant played for a hit"""
+        return ore_type, hit_type, amount_bucket(amount)
+
+    def get_table(self, key):
+        """
+        Get the table of a variant, rendering or loading it if needed
+
+        Args:
+            key: Key from key()
+
+        Returns:
+            The table made by make_table
+        """
+        table = self._tables.get(key)
+        if table is not None:
+            self._tables.move_to_end(key)
+            self.hits += 1
+            return table
+
+        table = self.make_table(self._load_samples(*key))
+        self._tables[key] = table
+        if len(self._tables) > self.capacity:
+            self._tables.popitem(last=False)
+        return table
+
+    def _load_samples(self, ore_type, hit_type, bucket):
+        """Read a variant's samples from the disk cache, or render (and store) them"""
+        profile = ORE_SOUND_PROFILES.get(ore_type, DEFAULT_ORE_SOUND_PROFILE)
+        path = None
+        if self.cache_dir:
+            path = os.path.join(self.cache_dir, ore_sound_hash(profile, hit_type, bucket, self.sample_rate) + ".npy")
+            try:
+                samples = np.load(path)
+                self.disk_loads += 1
+                return samples
+            except (OSError, ValueError):
+                pass
+
+        samples = render_ore_sound(profile, hit_type, bucket, self.sample_rate)
+        self.renders += 1
+        if path:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Write to a temporary file first so a crash never leaves a partial file
+                temp_path = f"{path}.tmp.npy"
+                np.save(temp_path, samples)
+                os.replace(temp_path, path)
+            except OSError as e:
+                print(f"Warning: Could not cache ore sound: {e}")
+        return samples
+
+    def clear(self):
+        """Drop every table (the disk cache is kept)"""
+        self._tables.clear()
@@ -0,0 +1,158 @@
+"""
+Resample Cache - sound files converted once to the server's sample rate
+
+pyo reads a table at its file's own rate, so a 48 kHz file on a 44.1 kHz
+server (or any pitch-shifted sound) is interpolated sample by sample while
+it plays. This cache converts each file once to the server rate, optionally
+also at a fixed pitch, and stores the result as a raw float32 file. The files
+are memory-mapped on load, so filling a table from them is a plain copy and
+the table then plays back one to one.
+
+Files are named after a hash of the source file (its packed SHA-256, or the
+path, size and modification time of a loose file), the target rate and the pitch, so editing a sound or changing the
+rate makes a new file instead of reusing a stale one.
+"""
+
+import glob
+import hashlib
+import os
+import wave
+
+import numpy as np
+
+from core.asset_archive import asset_fingerprint, open_asset
+
+# Resample Cache Constants - Easy to tune
+RESAMPLE_CACHE_DIR = "cache/audio"   # Where converted sounds are kept
+RESAMPLE_CACHE_VERSION = 1           # Bump when the conversion changes, to ignore old files
+
+
+def read_wav(path):
+    """
+    Decode a PCM WAV file, from the asset archive or the loose file
+
+    Args:
+        path: WAV file path
+
+    Returns:
+        tuple: (samples, rate) - float32 samples shaped (frames, channels) in [-1, 1]
+
+    Raises:
+        wave.Error, OSError: If the file can't be read (e.g. float WAVs, which wave doesn't support)
+    """
+    with open_asset(path) as wav_file, wave.open(wav_file, "rb") as wav:
+        channels = wav.getnchannels()
+        width = wav.getsampwidth()
+        rate = wav.getframerate()
+        data = wav.readframes(wav.getnframes())
+
+    if width == 1:
+        samples = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        samples = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 3:
+        # Sign-extend 24-bit samples into the top of 32-bit integers
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((len(raw), 4), dtype=np.uint8)
+        padded[:, 1:] = raw
+        samples = padded.view("<i4").ravel().astype(np.float32) / 2147483648.0
+    elif width == 4:
+        samples = np.frombuffer(data, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise wave.Error(f"unsupported sample width: {width}")
+    return samples.reshape(-1, channels), rate
+
+
+def resample(samples, rate, target_rate, pitch_shift=1.0):
+    """
+    Resample audio with linear interpolation (the same interpolation TableRead uses)
+
+    Args:
+        samples: Array shaped (frames, channels)
+        rate: Sample rate of samples
+        target_rate: Sample rate to convert to
+        pitch_shift: Playback speed to bake in (1.5 = higher and shorter)
+
+    Returns:
+        np.ndarray: float32 array shaped (new frames, channels)
+    """
+    step = rate * pitch_shift / target_rate
+    if step == 1.0:
+        return samples.astype(np.float32)
+    frames = max(1, int(len(samples) / step))
+    positions = np.arange(frames, dtype=np.float64) * step
+    source_positions = np.arange(len(samples), dtype=np.float64)
+    out = np.empty((frames, samples.shape[1]), dtype=np.float32)
+    for channel in range(samples.shape[1]):
+        out[:, channel] = np.interp(positions, source_positions, samples[:, channel])
+    return out
+
+
+class ResampleCache:
+    """Sound files converted to one sample rate, kept as memory-mapped float32 files"""
+
+    def __init__(self, target_rate, cache_dir=RESAMPLE_CACHE_DIR):
+        """
+        Initialize the cache
+
+        Args:
+            target_rate: Sample rate of the audio server
+            cache_dir: Directory of the converted files
+        """
+        self.target_rate = int(target_rate)
+        self.cache_dir = cache_dir
+
+        # Counters for checking the cache works
+        self.conversions = 0
+        self.mapped_loads = 0
+
+    def _cache_prefix(self, path, pitch_shift):
+        """File name of a conversion without the channel suffix"""
+        key = (RESAMPLE_CACHE_VERSION, asset_fingerprint(path), self.target_rate, float(pitch_shift))
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, f"{name}-{digest}")
+
+    def get_samples(self, path, pitch_shift=1.0):
+        """
+        Get a sound file at the target rate (and pitch), converting it on first use
+
+        Args:
+            path: Sound file path
+            pitch_shift: Playback speed to bake in
+
+        Returns:
+            np.ndarray: float32 samples shaped (frames, channels) - a read-only
+                memory map when the cache directory is usable - or None if the
+                file can't be decoded
+        """
+        try:
+            prefix = self._cache_prefix(path, pitch_shift)
+        except OSError:
+            return None
+
+        # The channel count is part of the file name, so no header is needed
+        for cached_path in glob.glob(f"{glob.escape(prefix)}-*ch.f32"):
+            channels = int(cached_path[len(prefix) + 1:-len("ch.f32")])
+            self.mapped_loads += 1
+            return np.memmap(cached_path, dtype=np.float32, mode="r").reshape(-1, channels)
+
+        try:
+            samples, rate = read_wav(path)
+        except (wave.Error, EOFError, OSError):
+            return None
+        converted = resample(samples, rate, self.target_rate, pitch_shift)
+        self.conversions += 1
+
+        cached_path = f"{prefix}-{converted.shape[1]}ch.f32"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so a crash never leaves a partial file; the
+            # process id keeps the game and the audio host from writing the same one
+            temp_path = f"{cached_path}.{os.getpid()}.tmp"
+            converted.tofile(temp_path)
+            os.replace(temp_path, cached_path)
+        except OSError as e:
+            print(f"Warning: Could not cache converted sound: {e}")
+            return converted
+        return np.memmap(cached_path, dtype=np.float32, mode="r").reshape(-1, converted.shape[1])
@@ -0,0 +1,223 @@
+"""
+Sound Cache - loads SoundBank tables on first use, within a memory budget
+
+Nothing is decoded at startup. A table is loaded the first time its sound
+plays, or earlier by the background preloader - the loading screen waits
+for it, so every table that fits in the budget is in memory before play. Long sounds are never loaded:
+they stream from disk through SfPlayer. When the loaded tables exceed the
+memory budget, the least recently used ones that are not playing are dropped
+and reload on their next use.
+
+With a ResampleCache, tables are filled from files already converted to the
+server rate (and, for the pitches in prepitched_shifts, already pitched), so
+they play back without per-sample resampling.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Sound Cache Constants - Easy to tune
+SOUND_MEMORY_BUDGET = 6 * 1024 * 1024   # Bytes of decoded samples kept in memory (every table at every prepitched shift)
+STREAM_MIN_DURATION = 5.0                # Sounds at least this long stream from disk
+SAMPLE_BYTES = 4                         # Bytes per decoded sample (pyo uses 32-bit floats)
+
+
+class SoundInfo:
+    """Header information of a sound file, read without decoding it"""
+
+    __slots__ = ("frames", "duration", "rate", "channels")
+
+    def __init__(self, frames, duration, rate, channels):
+        self.frames = frames
+        self.duration = duration
+        self.rate = rate
+        self.channels = channels
+
+    @property
+    def table_bytes(self):
+        """Memory the decoded table would use"""
+        return self.frames * self.channels * SAMPLE_BYTES
+
+
+class SoundCache:
+    """Lazily loaded, budgeted sound tables for SoundBank items"""
+
+    def __init__(self, budget_bytes=SOUND_MEMORY_BUDGET, streamed_sounds=(), stream_min_duration=STREAM_MIN_DURATION,
+                 is_playing=None, resampler=None, prepitched_shifts=()):
+        """
+        Initialize an empty cache
+
+        Args:
+            budget_bytes: Decoded bytes to keep before evicting
+            streamed_sounds: Sounds that always stream from disk
+            stream_min_duration: Sounds at least this many seconds long also stream
+            is_playing: Function sound -> bool, used to avoid evicting tables in use
+            resampler: ResampleCache to load converted samples from (None = decode with pyo)
+            prepitched_shifts: Pitch shifts that get their own pre-pitched table
+        """
+        self.budget_bytes = budget_bytes
+        self.streamed_sounds = set(streamed_sounds)
+        self.stream_min_duration = stream_min_duration
+        self.is_playing = is_playing or (lambda sound: False)
+        self.resampler = resampler
+        self.prepitched_shifts = set(prepitched_shifts) if resampler is not None else set()
+        self._tables = OrderedDict()   # (sound, baked pitch) -> (table, bytes), least recently used first
+        self._info = {}
+        self._failed = set()
+        self._lock = threading.Lock()
+        self._preloader = None
+        self.loaded_bytes = 0
+
+    def info(self, sound):
+        """
+        Get the header information of a sound
+
+        Args:
+            sound: SoundBank item
+
+        Returns:
+            SoundInfo: The sound's length and format, or None if the file can't be read
+        """
+        with self._lock:
+            if sound not in self._info:
+                from pyo import sndinfo
+                header = sndinfo(sound.value) if os.path.exists(sound.value) else None
+                self._info[sound] = SoundInfo(header[0], header[1], header[2], header[3]) if header else None
+            return self._info[sound]
+
+    def is_streamed(self, sound):
+        """Check if a sound plays from disk instead of from a table"""
+        if sound in self.streamed_sounds:
+            return True
+        info = self.info(sound)
+        return info is not None and info.duration >= self.stream_min_duration
+
+    def baked_pitch(self, pitch_shift):
+        """Pitch shift already applied to the table get_table returns for pitch_shift"""
+        return pitch_shift if pitch_shift in self.prepitched_shifts else 1.0
+
+    def get_table(self, sound, pitch_shift=1.0):
+        """
+        Get the table of a sound, loading it if needed
+
+        Args:
+            sound: SoundBank item
+            pitch_shift: Pitch the sound will play at - if it is one of the
+                prepitched shifts, the table is already at that pitch (see baked_pitch)
+
+        Returns:
+            The table (SndTable or DataTable), or None if the sound could not be loaded
+        """
+        key = (sound, self.baked_pitch(pitch_shift))
+        with self._lock:
+            entry = self._tables.get(key)
+            if entry is not None:
+                self._tables.move_to_end(key)
+                return entry[0]
+            if key in self._failed:
+                return None
+
+        # Decode without the lock so the preloader never blocks the game thread
+        try:
+            table, size = self._load(sound, key[1])
+        except Exception:
+            print(f"Failed to load sound: {sound.name} from {sound.value}")
+            with self._lock:
+                self._failed.add(key)
+            return None
+
+        with self._lock:
+            entry = self._tables.get(key)
+            if entry is not None:
+                # Loaded by another thread in the meantime
+                return entry[0]
+            self._tables[key] = (table, size)
+            self.loaded_bytes += size
+            self._evict(keep=key)
+            return table
+
+    def _load(self, sound, pitch_shift):
+        """Make the table of a sound at a baked pitch, returning (table, bytes)"""
+        samples = self.resampler.get_samples(sound.value, pitch_shift) if self.resampler is not None else None
+        if samples is None:
+            # No resampler, or a format it can't decode - pyo reads the file at its own rate
+            from pyo import SndTable
+            table = SndTable(sound.value)
+            info = self.info(sound)
+            return table, info.table_bytes if info is not None else 0
+
+        from pyo import DataTable
+        table = DataTable(size=len(samples), chnls=samples.shape[1])
+        for channel in range(samples.shape[1]):
+            np.asarray(table.getBuffer(channel))[:] = samples[:, channel]
+        return table, samples.size * SAMPLE_BYTES
+
+    def _evict(self, keep):
+        """Drop least recently used tables until the cache fits its budget"""
+        for key in list(self._tables):
+            if self.loaded_bytes <= self.budget_bytes:
+                break
+            if key == keep or self.is_playing(key[0]):
+                continue
+            _, size = self._tables.pop(key)
+            self.loaded_bytes -= size
+
+    def is_loaded(self, sound, pitch_shift=1.0):
+        """Check if the table get_table would return for a sound and pitch is in memory"""
+        with self._lock:
+            return (sound, self.baked_pitch(pitch_shift)) in self._tables
+
+    def preload(self, sounds):
+        """
+        Load tables on a background thread
+
+        Every sound is loaded at its own pitch first, then at each prepitched
+        shift. Streamed sounds are skipped, and so are tables that would not
+        fit in the budget next to what is already loaded - those are listed in
+        a warning, since they will load on the game thread when first played.
+
+        Args:
+            sounds: SoundBank items, most important first
+
+        Returns:
+            threading.Thread: The preloader thread
+        """
+        def _preload():
+            skipped = []
+            for pitch_shift in (1.0,) + tuple(sorted(self.prepitched_shifts)):
+                for sound in sounds:
+                    if self.is_streamed(sound) or self.is_loaded(sound, pitch_shift):
+                        continue
+                    info = self.info(sound)
+                    # A table pitched up is shorter by the pitch shift
+                    if info is not None and self.loaded_bytes + info.table_bytes / pitch_shift > self.budget_bytes:
+                        skipped.append(f"{sound.name} x{pitch_shift}")
+                        continue
+                    self.get_table(sound, pitch_shift)
+            if skipped:
+                print(f"Warning: Sound tables over the memory budget load on first play: {', '.join(skipped)}")
+
+        self._preloader = threading.Thread(target=_preload, name="sound-preloader", daemon=True)
+        self._preloader.start()
+        return self._preloader
+
+    def is_preloaded(self):
+        """Check if the background preloader has finished (True if it was never started)"""
+        return self._preloader is None or not self._preloader.is_alive()
+
+    def wait_for_preload(self, timeout=None):
+        """
+        Block until the background preloader has finished
+
+        Args:
+            timeout: Seconds to wait at most, or None to wait until it is done
+
+        Returns:
+            bool: True if the preloader has finished
+        """
+        if self._preloader is not None:
+            self._preloader.join(timeout)
+        return self.is_preloaded()
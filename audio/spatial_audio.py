@@ -0,0 +1,114 @@
+"""
+Spatial Audio - distance attenuation and panning of positioned sounds, once per frame
+
+Sounds played with a position are not started right away: they are queued
+as emitters, and when the frame ends (update_listener) the gain and pan of
+every queued emitter are computed together with NumPy, relative to the
+listener. Emitters that would be too quiet to hear are dropped there, before
+any audio object is created or any command is sent to the audio host.
+"""
+
+import numpy as np
+
+from core.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Spatial Audio Constants - Easy to tune
+CENTER_PAN = 0.5                    # pyo pan of a centered sound (0 = left, 1 = right)
+SPATIAL_REFERENCE_DISTANCE = 300.0  # Pixels within which sounds play at full volume
+SPATIAL_ROLLOFF = 1.0               # How fast volume falls off beyond the reference distance
+SPATIAL_PAN_WIDTH = SCREEN_WIDTH / 2  # Horizontal offset at which a sound is panned the furthest
+SPATIAL_MAX_PAN = 0.4               # Furthest pan from the center (0.5 would be one speaker only)
+AUDIBILITY_THRESHOLD = 0.002        # Sounds quieter than this after attenuation are not played
+SPATIAL_MAX_PENDING = 256           # Queued emitters that force a mix before the frame ends
+
+
+def spatialize(xs, ys, listener_x, listener_y):
+    """
+    Compute the gain and pan of emitters relative to the listener
+
+    Gain is inverse distance beyond the reference distance; pan follows the
+    horizontal offset.
+
+    Args:
+        xs, ys: Arrays of emitter positions
+        listener_x, listener_y: Listener position
+
+    Returns:
+        tuple: (gains, pans) arrays - gains in [0, 1], pans in pyo's [0, 1]
+    """
+    dx = xs - listener_x
+    distances = np.hypot(dx, ys - listener_y)
+    excess = np.maximum(distances - SPATIAL_REFERENCE_DISTANCE, 0.0)
+    gains = SPATIAL_REFERENCE_DISTANCE / (SPATIAL_REFERENCE_DISTANCE + SPATIAL_ROLLOFF * excess)
+    pans = CENTER_PAN + np.clip(dx / SPATIAL_PAN_WIDTH, -1.0, 1.0) * SPATIAL_MAX_PAN
+    return gains, pans
+
+
+class SpatialAudio:
+    """Queue of positioned sounds, mixed for the listener once per frame"""
+
+    def __init__(self, listener_x=SCREEN_WIDTH / 2, listener_y=SCREEN_HEIGHT / 2):
+        """
+        Initialize an empty queue
+
+        Args:
+            listener_x, listener_y: Listener position until the first update (the screen center)
+        """
+        self.listener_x = listener_x
+        self.listener_y = listener_y
+        self._xs = []
+        self._ys = []
+        self._volumes = []
+        self._plays = []   # (play function, keyword arguments) per emitter
+
+        # Counters for tuning the threshold
+        self.played_count = 0
+        self.culled_count = 0
+
+    def emit(self, position, volume, play, **kwargs):
+        """
+        Queue a positioned sound
+
+        Args:
+            position: (x, y) of the emitter
+            volume: Volume before attenuation
+            play: Function called as play(volume=..., pan=..., **kwargs) if the sound is audible
+            **kwargs: Other arguments for play
+        """
+        self._xs.append(position[0])
+        self._ys.append(position[1])
+        self._volumes.append(volume)
+        self._plays.append((play, kwargs))
+        if len(self._plays) >= SPATIAL_MAX_PENDING:
+            # Nobody is ending frames (e.g. a headless run) - don't let the queue grow
+            self.flush()
+
+    def flush(self, listener_x=None, listener_y=None):
+        """
+        Attenuate and pan every queued emitter and play the audible ones
+
+        Args:
+            listener_x, listener_y: Listener position (defaults to the last one)
+
+        Returns:
+            int: Number of sounds played
+        """
+        if listener_x is not None:
+            self.listener_x = listener_x
+            self.listener_y = listener_y
+        if not self._plays:
+            return 0
+
+        plays = self._plays
+        gains, pans = spatialize(np.array(self._xs, dtype=np.float64), np.array(self._ys, dtype=np.float64),
+                                 self.listener_x, self.listener_y)
+        volumes = np.array(self._volumes, dtype=np.float64) * gains
+        self._xs, self._ys, self._volumes, self._plays = [], [], [], []
+
+        audible = np.flatnonzero(volumes >= AUDIBILITY_THRESHOLD)
+        self.culled_count += len(plays) - len(audible)
+        self.played_count += len(audible)
+        for index in audible.tolist():
+            play, kwargs = plays[index]
+            play(volume=float(volumes[index]), pan=float(pans[index]), **kwargs)
+        return len(audible)
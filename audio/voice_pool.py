@@ -0,0 +1,236 @@
+"""
+Voice Pool - fixed set of reusable sample players
+
+Each voice owns one pyo TableRead (and an SfPlayer for sounds streamed from
+disk) feeding a Pan, created on first use and then re-pointed at a new sound
+every time instead of building a new mixer object. The
+pool is shared between the game thread (starting sounds) and the voice
+scheduler thread (releasing them), so all bookkeeping happens under a lock.
+
+The pool never grows: each sound has its own voice limit, and when a limit
+or the pool is used up a playing voice is stolen (oldest or quietest first).
+A trigger arriving within the merge window of the same sound does not take
+a voice at all - it makes the voice already playing it louder.
+"""
+
+import threading
+from collections import deque
+
+# Voice stealing policies
+STEAL_OLDEST = "oldest"       # Steal the voice that started first
+STEAL_QUIETEST = "quietest"   # Steal the quietest voice, the oldest among equals
+
+# Voice Pool Constants - Easy to tune
+VOICE_INPUT_FADE = 0.005   # Seconds of crossfade when a voice's panner switches player
+
+
+class Voice:
+    """One reusable sample player"""
+
+    __slots__ = ("index", "player", "streamer", "panner", "current", "source", "sound", "volume", "pitch_shift",
+                 "started_at", "generation", "playing")
+
+    def __init__(self, index):
+        """
+        Initialize an idle voice
+
+        Args:
+            index: Position of the voice in its pool
+        """
+        self.index = index
+        self.player = None       # TableRead, created by the first start() of a table
+        self.streamer = None     # SfPlayer, created by the first start() of a streamed sound
+        self.panner = None       # Pan between the player and the output
+        self.current = None      # Whichever of the two is playing
+        self.source = None       # Table or path being played
+        self.sound = None        # SoundBank item being played
+        self.volume = 0.0
+        self.pitch_shift = 1.0
+        self.started_at = 0.0
+        self.generation = 0      # Bumped on every start so stale releases are ignored
+        self.playing = False
+
+    def start(self, source, sound, volume, loop, pitch_shift, now, pan=0.5):
+        """
+        Play a sound on this voice, replacing whatever it played before
+
+        Args:
+            source: SndTable to play, or the path of a file to stream
+            sound: SoundBank item, for bookkeeping
+            volume: Volume multiplier
+            loop: Whether to loop the table
+            pitch_shift: Playback speed multiplier
+            now: Current time (time.monotonic())
+            pan: Stereo position (0 = left, 0.5 = center, 1 = right)
+
+        Returns:
+            int: Generation of this playback, needed to release it
+        """
+        if self.current is not None:
+            self.current.stop()
+        if isinstance(source, str):
+            if self.streamer is None:
+                from pyo import SfPlayer
+                self.streamer = SfPlayer(source, speed=pitch_shift, loop=loop, mul=volume)
+            else:
+                self.streamer.setPath(source)
+                self.streamer.setSpeed(pitch_shift)
+                self.streamer.setLoop(loop)
+                self.streamer.setMul(volume)
+            self.current = self.streamer
+        else:
+            freq = source.getRate() * pitch_shift
+            if self.player is None:
+                from pyo import TableRead
+                self.player = TableRead(table=source, freq=freq, loop=loop, mul=volume)
+            else:
+                self.player.setTable(source)
+                self.player.setFreq(freq)
+                self.player.setLoop(loop)
+                self.player.setMul(volume)
+                self.player.reset()
+            self.current = self.player
+        self.current.play()
+        
+        if self.panner is None:
+            from pyo import Pan
+            self.panner = Pan(self.current, pan=pan)
+        else:
+            self.panner.setInput(self.current, VOICE_INPUT_FADE)
+            self.panner.setPan(pan)
+        self.panner.out()
+
+        self.source = source
+        self.sound = sound
+        self.volume = volume
+        self.pitch_shift = pitch_shift
+        self.started_at = now
+        self.generation += 1
+        self.playing = True
+        return self.generation
+
+    def set_volume(self, volume):
+        """Change the volume of the sound playing on this voice"""
+        self.volume = volume
+        if self.current is not None:
+            self.current.setMul(volume)
+
+    def stop(self):
+        """Silence the voice"""
+        if self.current is not None:
+            self.current.stop()
+            self.current = None
+        if self.panner is not None:
+            self.panner.stop()
+        self.source = None
+        self.sound = None
+        self.playing = False
+
+
+class VoicePool:
+    """Hands out voices from a fixed set, within per-sound limits"""
+
+    def __init__(self, size, sound_limits=None, default_sound_limit=None, steal_policy=STEAL_OLDEST,
+                 merge_window=0.0, max_merged_volume=1.0):
+        """
+        Initialize the pool
+
+        Args:
+            size: Number of voices - the most sounds that can play at once
+            sound_limits: Dict of sound -> most voices that sound may use
+            default_sound_limit: Limit for sounds not in sound_limits (None = the pool size)
+            steal_policy: STEAL_OLDEST or STEAL_QUIETEST
+            merge_window: Seconds within which a repeated trigger of the same
+                sound and pitch is merged into the voice already playing it
+            max_merged_volume: Upper bound of the volume of a merged voice
+        """
+        self.voices = [Voice(index) for index in range(size)]
+        self.sound_limits = dict(sound_limits or {})
+        self.default_sound_limit = default_sound_limit if default_sound_limit is not None else size
+        self.steal_policy = steal_policy
+        self.merge_window = merge_window
+        self.max_merged_volume = max_merged_volume
+        self._free = deque(self.voices)
+        self._lock = threading.Lock()
+        
+        # Counters for tuning the limits
+        self.stolen_count = 0
+        self.merged_count = 0
+
+    def _pick_victim(self, candidates):
+        """Choose the voice to steal among playing voices"""
+        if self.steal_policy == STEAL_QUIETEST:
+            return min(candidates, key=lambda voice: (voice.volume, voice.started_at))
+        return min(candidates, key=lambda voice: voice.started_at)
+
+    def acquire(self, source, sound, volume, loop, pitch_shift, now, pan=0.5):
+        """
+        Start a sound on a voice, merging it into a recent identical trigger if possible
+
+        Args:
+            source, sound, volume, loop, pitch_shift, now, pan: See Voice.start
+
+        Returns:
+            tuple: (voice, generation, merged) - a merged trigger keeps the
+                voice's existing release, so the caller must not schedule another
+        """
+        with self._lock:
+            same_sound = [voice for voice in self.voices if voice.playing and voice.sound == sound]
+
+            # Merge identical triggers: uncorrelated sources add up in power, not amplitude
+            if self.merge_window > 0.0:
+                for voice in same_sound:
+                    # Same table too: a pre-pitched table plays at pitch 1.0 like the original
+                    if (voice.source is source and voice.pitch_shift == pitch_shift
+                            and now - voice.started_at <= self.merge_window):
+                        merged_volume = (voice.volume ** 2 + volume ** 2) ** 0.5
+                        voice.set_volume(min(self.max_merged_volume, merged_volume))
+                        self.merged_count += 1
+                        return voice, voice.generation, True
+
+            if len(same_sound) >= self.sound_limits.get(sound, self.default_sound_limit):
+                voice = self._pick_victim(same_sound)
+                self.stolen_count += 1
+            elif self._free:
+                voice = self._free.popleft()
+            else:
+                voice = self._pick_victim(self.voices)
+                self.stolen_count += 1
+            generation = voice.start(source, sound, volume, loop, pitch_shift, now, pan)
+        return voice, generation, False
+
+    def release(self, voice, generation):
+        """
+        Stop a voice and return it to the pool, unless it was reused since
+
+        Args:
+            voice: The voice to release
+            generation: Generation returned when the sound was started
+
+        Returns:
+            bool: True if the voice was released
+        """
+        with self._lock:
+            if voice.generation != generation or not voice.playing:
+                return False
+            voice.stop()
+            self._free.append(voice)
+            return True
+
+    def is_playing(self, sound):
+        """Check if any voice is playing a sound"""
+        with self._lock:
+            return any(voice.playing and voice.sound == sound for voice in self.voices)
+
+    def active_voices(self):
+        """Get the voices currently playing"""
+        with self._lock:
+            return [voice for voice in self.voices if voice.playing]
+
+    def stop_all(self):
+        """Silence every voice and free them all"""
+        with self._lock:
+            for voice in self.voices:
+                if voice.playing:
+                    voice.stop()
+            self._free = deque(self.voices)
@@ -0,0 +1,133 @@
+"""
+Voice Scheduler - runs audio start/stop events at wall-clock deadlines on one thread
+
+Replaces the thread-per-sound approach: every delayed note and every voice
+release goes into a single priority queue, and one daemon thread sleeps until
+the earliest deadline. Scheduling from any thread is O(log n).
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+
+class ScheduledEvent:
+    """Handle of a scheduled callback"""
+
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Stop the event from running - it is dropped when its deadline comes up"""
+        self.cancelled = True
+        self.callback = None
+        self.args = ()
+
+
+class VoiceScheduler:
+    """Single background thread that runs callbacks at deadlines"""
+
+    def __init__(self, name="audio-scheduler"):
+        """
+        Initialize the scheduler - the thread starts with the first event
+
+        Args:
+            name: Name of the scheduler thread
+        """
+        self.name = name
+        self._queue = []    # Heap of (deadline, sequence, event)
+        self._sequence = itertools.count()  # Keeps events with equal deadlines in order
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def schedule(self, delay, callback, *args):
+        """
+        Call callback(*args) on the scheduler thread after a delay
+
+        Args:
+            delay: Seconds from now
+            callback: Function to call
+            *args: Arguments for the callback
+
+        Returns:
+            ScheduledEvent: Handle that can be cancelled
+        """
+        event = ScheduledEvent(time.monotonic() + max(0.0, delay), callback, args)
+        with self._condition:
+            if not self._running:
+                self._start()
+            heapq.heappush(self._queue, (event.deadline, next(self._sequence), event))
+            # Only wake the thread if the new event is now the earliest one
+            if self._queue[0][2] is event:
+                self._condition.notify()
+        return event
+
+    def pending_events(self):
+        """Number of events waiting to run (including cancelled ones not yet dropped)"""
+        with self._condition:
+            return len(self._queue)
+
+    def shutdown(self, run_pending=False):
+        """
+        Stop the scheduler thread
+
+        Args:
+            run_pending: Run the events still queued (e.g. voice releases) before returning
+        """
+        with self._condition:
+            self._running = False
+            pending = [event for _, _, event in sorted(self._queue)] if run_pending else []
+            self._queue = []
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        for event in pending:
+            self._run_event(event)
+
+    def _start(self):
+        """Start the scheduler thread (called with the condition held)"""
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Scheduler thread - sleep until the earliest deadline and run what is due"""
+        with self._condition:
+            while self._running:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                wait = self._queue[0][0] - time.monotonic()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                _, _, event = heapq.heappop(self._queue)
+                if event.cancelled:
+                    continue
+
+                # Run the callback without the lock so it can schedule more events
+                self._condition.release()
+                try:
+                    self._run_event(event)
+                finally:
+                    self._condition.acquire()
+
+    @staticmethod
+    def _run_event(event):
+        """Run one event, reporting instead of raising so the thread stays alive"""
+        if event.cancelled:
+            return
+        callback, args = event.callback, event.args
+        event.cancel()
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"Warning: Audio event failed: {e}")
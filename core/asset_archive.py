@@ -0,0 +1,243 @@
+"""
+Asset Archive - serves game assets from one packed file, or loose files in development
+
+tools/pack_assets.py packs everything under assets/ into a single archive:
+a small header, a JSON index of (offset, size, sha256) per asset path, then
+the file contents in preload order. The archive is memory-mapped, and the
+kernel is asked to read it ahead sequentially, so on a slow disk a cold start
+costs one sequential read instead of one seek per file. Asset data is handed
+out as memoryviews into the map, without copying.
+
+Without an archive (or for a path it doesn't contain) the loose file under
+assets/ is used. With VSG_LOOSE_ASSETS=1 (development), a loose file modified
+after the archive was written also wins over its packed copy, so editing
+assets needs no repacking. The loose files are checked once, when the archive
+opens; without the flag they are never touched.
+pyo streams sounds and pyglet reads fonts by file name, so those always use
+loose files.
+"""
+
+import io
+import json
+import mmap
+import os
+import struct
+
+# Archive Constants - Easy to tune
+ASSET_ARCHIVE_PATH = "assets.pak"   # Archive location, relative to the working directory
+ARCHIVE_MAGIC = b"VSGPAK"
+ARCHIVE_VERSION = 1
+ARCHIVE_ALIGNMENT = 16              # Asset data starts on multiples of this many bytes
+LOOSE_ASSETS_ENV = "VSG_LOOSE_ASSETS"   # Set to 1 to prefer loose files edited after packing
+
+# Header: magic, version, length of the JSON index that follows
+ARCHIVE_HEADER = struct.Struct("<6sHI")
+
+
+class ArchiveError(Exception):
+    """Raised when an archive file is not a valid asset archive"""
+    pass
+
+
+class AssetArchive:
+    """Read-only, memory-mapped asset archive"""
+
+    def __init__(self, path, check_loose=False):
+        """
+        Open an archive and read its index
+
+        Args:
+            path: Archive file path
+            check_loose: Find the assets whose loose file was modified after
+                the archive was written - those are read from the loose file
+
+        Raises:
+            OSError: If the file can't be opened
+            ArchiveError: If the file is not an archive this version can read
+        """
+        self.path = path
+        with open(path, "rb") as archive_file:
+            self.mtime_ns = os.fstat(archive_file.fileno()).st_mtime_ns
+            self._map = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < ARCHIVE_HEADER.size:
+            raise ArchiveError(f"{path} is too short to be an asset archive")
+        magic, version, index_length = ARCHIVE_HEADER.unpack_from(self._map, 0)
+        if magic != ARCHIVE_MAGIC:
+            raise ArchiveError(f"{path} is not an asset archive")
+        if version != ARCHIVE_VERSION:
+            raise ArchiveError(f"{path} is archive version {version}, expected {ARCHIVE_VERSION}")
+        index_start = ARCHIVE_HEADER.size
+        self.entries = json.loads(bytes(self._map[index_start:index_start + index_length]))["entries"]
+        self.stale = self._find_stale_entries() if check_loose else frozenset()
+
+        # One sequential read-ahead of the whole file instead of a seek per asset
+        if hasattr(self._map, "madvise"):
+            for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+                if hasattr(mmap, advice):
+                    self._map.madvise(getattr(mmap, advice))
+
+    def _find_stale_entries(self):
+        """Keys whose loose file is newer than the archive (edited since the last pack)"""
+        stale = set()
+        for asset_path in self.entries:
+            try:
+                if os.stat(asset_path).st_mtime_ns > self.mtime_ns:
+                    stale.add(asset_path)
+            except OSError:
+                pass  # No loose copy
+        return frozenset(stale)
+
+    def __contains__(self, asset_path):
+        return asset_path in self.entries
+
+    def read(self, asset_path):
+        """
+        Get the contents of an asset without copying it
+
+        Args:
+            asset_path: Path as used by the game (e.g. "assets/spaceship.png")
+
+        Returns:
+            memoryview: The asset's bytes inside the memory map
+
+        Raises:
+            KeyError: If the archive doesn't contain the asset
+        """
+        offset, size, _ = self.entries[asset_path]
+        return memoryview(self._map)[offset:offset + size]
+
+    def fingerprint(self, asset_path):
+        """SHA-256 of an asset's contents, recorded when the archive was packed"""
+        return self.entries[asset_path][2]
+
+
+_archive = None
+_archive_checked = False
+
+
+def get_archive():
+    """Open the asset archive on first use - None if there is none (development)"""
+    global _archive, _archive_checked
+    if not _archive_checked:
+        _archive_checked = True
+        if os.path.exists(ASSET_ARCHIVE_PATH):
+            check_loose = os.environ.get(LOOSE_ASSETS_ENV, "").strip() not in ("", "0")
+            try:
+                _archive = AssetArchive(ASSET_ARCHIVE_PATH, check_loose=check_loose)
+            except (OSError, ValueError, KeyError, ArchiveError) as e:
+                print(f"Warning: Ignoring asset archive {ASSET_ARCHIVE_PATH}: {e}")
+    return _archive
+
+
+def _archive_key(path):
+    """Archive index key of an asset path"""
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def _packed_key(path):
+    """
+    Archive key to read an asset from, or None to use the loose file
+
+    The packed copy is used unless the archive found the loose file was
+    edited since the last pack (only checked with VSG_LOOSE_ASSETS set).
+    """
+    archive = get_archive()
+    if archive is None:
+        return None
+    key = _archive_key(path)
+    if key not in archive or key in archive.stale:
+        return None
+    return key
+
+
+def read_asset(path):
+    """
+    Get the contents of an asset, from the archive if it has an up-to-date copy
+
+    Args:
+        path: Asset path (e.g. "assets/spaceship.png")
+
+    Returns:
+        bytes-like: A memoryview into the archive, or the bytes of the loose file
+
+    Raises:
+        FileNotFoundError: If the asset is in neither
+    """
+    key = _packed_key(path)
+    if key is not None:
+        return get_archive().read(key)
+    with open(path, "rb") as asset_file:
+        return asset_file.read()
+
+
+def open_asset(path):
+    """
+    Open an asset as a binary file object, for decoders that want one (PIL, wave)
+
+    Args:
+        path: Asset path
+
+    Returns:
+        A readable, seekable binary file object
+
+    Raises:
+        FileNotFoundError: If the asset is in neither the archive nor on disk
+    """
+    key = _packed_key(path)
+    if key is not None:
+        # BufferedReader reads straight from the map, only in the chunks the decoder asks for
+        return io.BufferedReader(_MemoryViewRaw(get_archive().read(key)))
+    return open(path, "rb")
+
+
+def asset_fingerprint(path):
+    """
+    Identify the current contents of an asset, for naming derived cache files
+
+    Args:
+        path: Asset path
+
+    Returns:
+        str: The packed SHA-256 from the archive, or size and mtime of the loose file
+
+    Raises:
+        OSError: If the asset is in neither
+    """
+    key = _packed_key(path)
+    if key is not None:
+        return get_archive().fingerprint(key)
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class _MemoryViewRaw(io.RawIOBase):
+    """Raw binary stream over a memoryview"""
+
+    def __init__(self, view):
+        self._view = view
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = max(0, min(len(buffer), len(self._view) - self._position))
+        buffer[:count] = self._view[self._position:self._position + count]
+        self._position += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        else:
+            self._position = len(self._view) + offset
+        return self._position
+
+    def tell(self):
+        return self._position
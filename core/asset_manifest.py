@@ -0,0 +1,107 @@
+"""
+Asset Manifest - image and sound metadata precomputed by tools/build_asset_manifest.py
+
+Simulation code reads image sizes and collision radii from here instead of
+loading textures, so it never needs a window, a GPU or an image decoder.
+The asset preloader reads the list of assets to load from here.
+"""
+
+import json
+import os
+
+# Manifest location - asset paths in the manifest are relative to the repository root
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "manifest.json")
+
+_manifest = None
+
+
+def _load_manifest():
+    """Read the manifest once, on first use"""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH) as manifest_file:
+                _manifest = json.load(manifest_file)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read asset manifest {MANIFEST_PATH}: {e}")
+            print("Run 'python tools/build_asset_manifest.py' to create it")
+            _manifest = {}
+    return _manifest
+
+
+def _load_images():
+    """Image entries of the manifest"""
+    return _load_manifest().get("images", {})
+
+
+def _load_sounds():
+    """Sound entries of the manifest (manifests before version 2 have none)"""
+    return _load_manifest().get("sounds", {})
+
+
+def get_image_paths():
+    """Get the paths of every image in the manifest"""
+    return list(_load_images())
+
+
+def get_sound_paths():
+    """Get the paths of every sound in the manifest"""
+    return list(_load_sounds())
+
+
+def get_sound_info(path):
+    """
+    Get the manifest entry of a sound
+
+    Args:
+        path: Asset path as used by the game (e.g. "assets/audio/warning.wav")
+
+    Returns:
+        dict or None: frames, rate, channels, duration and sha256, or None if
+            the sound is not in the manifest
+    """
+    return _load_sounds().get(path.replace(os.sep, "/"))
+
+
+def get_image_info(path):
+    """
+    Get the manifest entry of an image
+
+    Args:
+        path: Asset path as used by the game (e.g. "assets/asteroid1.png")
+
+    Returns:
+        dict or None: width, height, bbox, radius, sha256 and (for large
+            images) variants, or None if the image is not in the manifest
+    """
+    return _load_images().get(path.replace(os.sep, "/"))
+
+
+def get_image_variants(path):
+    """
+    Get the downscaled variants of an image (see tools/build_texture_variants.py)
+
+    Args:
+        path: Asset path of the full-size image
+
+    Returns:
+        list: Entries with factor, path, width and height, smallest last -
+            empty if the image has none or is not in the manifest
+    """
+    info = get_image_info(path)
+    return info.get("variants", []) if info is not None else []
+
+
+def get_image_radius(path, default=None):
+    """
+    Get the collision radius of an image at scale 1.0
+
+    Args:
+        path: Asset path as used by the game
+        default: Value returned if the image is not in the manifest
+
+    Returns:
+        float: Half the larger side of the image's alpha-trimmed bounds
+    """
+    info = get_image_info(path)
+    return info["radius"] if info is not None else default
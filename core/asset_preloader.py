@@ -0,0 +1,183 @@
+"""
+Asset Preloader - loads every image and sound in the asset manifest before gameplay
+
+Decoding runs on a thread pool: images are read and turned into textures
+(including their hit boxes), and sounds are converted to the audio server's
+sample rate in the resample cache. Only the GPU uploads happen on the main
+thread, a few per frame within a time budget, so a loading screen can keep
+drawing its progress while the rest is decoded.
+
+Full-size images whose variants cover the largest size they are drawn at
+(MAX_DRAW_SCALES) are neither decoded nor kept: the renderers only ever draw a
+variant, and texture_cache loads the full-size image on first use in the rare
+case it is needed.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import arcade
+
+from core import asset_manifest, texture_cache
+
+# Preloader Constants - Easy to tune
+PRELOAD_WORKERS = min(8, os.cpu_count() or 1)   # Decoding threads
+PRELOAD_UPLOAD_BUDGET = 0.008                    # Seconds of texture uploads per frame on the main thread
+
+# Largest scale each image is drawn at, relative to its full size. Images not
+# listed (e.g. asteroids, drawn at up to 0.6) are assumed to be drawn at full size.
+MAX_DRAW_SCALES = {
+    "assets/spaceship.png": 0.5,       # PlayerRenderer TEXTURE_SCALE
+    "assets/mobile_depot.png": 0.25,   # MobileDepotRenderer - 240 px, twice the collision diameter
+}
+
+
+def _decode_texture(path):
+    """Worker - read an image into a texture; no GL calls happen here"""
+    return texture_cache.load_texture(path)
+
+
+def _convert_sound(path):
+    """
+    Worker - convert a sound to the server rate so the audio engine can memory-map it
+
+    The audio modules (and numpy) are imported here rather than at the top of
+    the module, so they load on a worker thread instead of delaying the first
+    frame of the loading screen. The prepitched versions are converted too, so
+    no sound is ever converted during play. Long and streamed sounds are read
+    while playing, so they are skipped.
+    """
+    from audio.audio_engine import PREPITCHED_SHIFTS, SERVER_SAMPLE_RATE, STREAMED_SOUNDS
+    from audio.resample_cache import ResampleCache
+    from audio.sound_cache import STREAM_MIN_DURATION
+
+    info = asset_manifest.get_sound_info(path)
+    if path in {sound.value for sound in STREAMED_SOUNDS} or (info and info["duration"] >= STREAM_MIN_DURATION):
+        return None
+    cache = ResampleCache(SERVER_SAMPLE_RATE)
+    for pitch_shift in PREPITCHED_SHIFTS:
+        cache.get_samples(path, pitch_shift)
+    return cache.get_samples(path)
+
+
+class AssetPreloader:
+    """Decodes manifest assets on worker threads and uploads textures on the main thread"""
+
+    def __init__(self, image_paths=None, sound_paths=None, workers=PRELOAD_WORKERS):
+        """
+        Initialize the preloader
+
+        Args:
+            image_paths: Images to load (defaults to every image and variant in the manifest)
+            sound_paths: Sounds to convert (defaults to every sound in the manifest - streamed ones are skipped)
+            workers: Number of decoding threads
+        """
+        self.image_paths = list(image_paths if image_paths is not None else self._manifest_image_paths())
+        self.sound_paths = list(sound_paths if sound_paths is not None else asset_manifest.get_sound_paths())
+        self.workers = workers
+        self.total_count = len(self.image_paths) + len(self.sound_paths)
+        self.loaded_count = 0
+        self.sounds_left = len(self.sound_paths)
+        self.current_path = None
+        self._completed = deque()   # (path, kind, future) - appended by worker threads
+        self._executor = None
+
+    @staticmethod
+    def _manifest_image_paths():
+        """Manifest images followed by their downscaled variants - full sizes no draw needs are left out"""
+        paths = []
+        variant_paths = []
+        for path in asset_manifest.get_image_paths():
+            variants = asset_manifest.get_image_variants(path)
+            variant_paths.extend(variant["path"] for variant in variants)
+            scale = MAX_DRAW_SCALES.get(path)
+            if variants and scale is not None:
+                info = asset_manifest.get_image_info(path)
+                if texture_cache.choose_variant(path, info["width"] * scale, info["height"] * scale) != path:
+                    continue
+            paths.append(path)
+        return paths + variant_paths
+
+    def start(self):
+        """Queue every asset on the thread pool"""
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-preloader")
+
+        # Sounds first: the audio engine starts once they are converted
+        for path in self.sound_paths:
+            self._submit(path, "sound", _convert_sound, path)
+        for path in self.image_paths:
+            if not texture_cache.has_texture(path):
+                self._submit(path, "image", _decode_texture, path)
+            else:
+                self.loaded_count += 1
+
+    def _submit(self, path, kind, function, *args):
+        """Run one decode on the pool and queue its result for the main thread"""
+        future = self._executor.submit(function, *args)
+        future.add_done_callback(lambda done: self._completed.append((path, kind, done)))
+
+    def update(self, time_budget=PRELOAD_UPLOAD_BUDGET):
+        """
+        Take finished decodes and upload their textures - call once per frame on the main thread
+
+        Args:
+            time_budget: Seconds to spend before returning
+
+        Returns:
+            bool: True once every asset is loaded
+        """
+        atlas = self._default_atlas()
+        deadline = time.perf_counter() + time_budget
+        while self._completed and time.perf_counter() < deadline:
+            path, kind, future = self._completed.popleft()
+            self.current_path = path
+            self.loaded_count += 1
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Warning: Could not preload {path}: {e}")
+                result = None
+
+            if kind == "sound":
+                self.sounds_left -= 1
+            elif result is not None:
+                texture_cache.add_texture(path, result)
+                if atlas is not None:
+                    atlas.add(result)
+
+        if self.done and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        return self.done
+
+    @staticmethod
+    def _default_atlas():
+        """Texture atlas the game draws with, or None without a window"""
+        try:
+            return arcade.get_window().ctx.default_atlas
+        except RuntimeError:
+            return None
+
+    def finish(self):
+        """Block until everything is loaded (for headless runs and tools)"""
+        if self._executor is None and not self.done:
+            self.start()
+        while not self.update(time_budget=1.0):
+            time.sleep(0.001)
+
+    @property
+    def sounds_done(self):
+        """Check if every sound is converted"""
+        return self.sounds_left == 0
+
+    @property
+    def done(self):
+        """Check if every asset is loaded"""
+        return self.loaded_count >= self.total_count
+
+    @property
+    def progress(self):
+        """Fraction of the assets loaded, from 0.0 to 1.0"""
+        return self.loaded_count / self.total_count if self.total_count else 1.0
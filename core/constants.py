@@ -10,6 +10,20 @@ SCREEN_TITLE = "Vanilla Space Game"
 # Game settings
 FPS = 60
 
+# Save game settings
+SAVE_DIRECTORY = "saves"
+QUICKSAVE_PATH = "saves/quicksave.vsg"
+AUTOSAVE_ENABLED = True
+AUTOSAVE_PATH = "saves/autosave.vsg"
+AUTOSAVE_INTERVAL = 300.0         # Seconds of game time between full autosaves (journal compaction)
+AUTOSAVE_FRAME_BUDGET_MS = 2.0    # Main-thread time an autosave may use per frame
+AUTOSAVE_JOURNAL_INTERVAL = 1.0   # Seconds of game time between change journal flushes
+AUTOSAVE_JOURNAL_COMPACT_BYTES = 1024 * 1024  # Journal size that triggers an early full autosave
+
+# Sector paging settings (sector sizes and limits are in game_state/sector_store.py)
+SECTOR_PAGING_ENABLED = False     # Page asteroid sectors in and out around the player
+SECTOR_STORE_PATH = "saves/sectors.db"
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -3,19 +3,29 @@ Main Game Loop - coordinates between input, game state, and rendering systems
 """
 
 import arcade
+from audio import get_audio_engine
 from input.input_system import InputSystem
 from game_state.state_manager import StateManager
 from rendering.renderer import Renderer
+from core import startup_profiler
 from core.constants import BLACK
 
 
 class GameLoop(arcade.View):
     """Main game loop that coordinates all systems"""
     
-    def __init__(self, window):
-        """Initialize the game loop with all systems"""
+    def __init__(self, window, new_game=False):
+        """
+        Initialize the game loop with all systems
+        
+        Args:
+            window: The game window
+            new_game: Start a new world instead of continuing the stored one
+        """
         super().__init__()
         self.window = window
+        self.new_game = new_game
+        self.first_frame_drawn = False
         
         # Initialize the three core systems
         self.input_system = InputSystem()
@@ -27,7 +37,7 @@ class GameLoop(arcade.View):
         
     def _setup_systems(self):
         """Set up and configure all systems"""
-        self.state_manager.initialize()
+        self.state_manager.initialize(new_game=self.new_game)
         self.renderer.initialize()
         
     def on_show_view(self):
@@ -36,11 +46,11 @@ class GameLoop(arcade.View):
         
     def on_update(self, delta_time):
         """Main update loop - process input, update game state"""
-        # Process input and get commands
-        input_commands = self.input_system.process_input()
+        # Held-command mask and queued one-shot commands for this tick
+        input_frame = self.input_system.process_input()
         
         # Update game state based on input and time
-        self.state_manager.update(delta_time, input_commands)
+        self.state_manager.update(delta_time, input_frame)
         
     def on_draw(self):
         """Main render loop - draw everything"""
@@ -49,6 +59,10 @@ class GameLoop(arcade.View):
         # Get current game state and render it
         current_state = self.state_manager.get_current_state()
         self.renderer.render(current_state)
+
+        if not self.first_frame_drawn:
+            self.first_frame_drawn = True
+            startup_profiler.finish_startup()
         
     def on_key_press(self, key, modifiers):
         """Handle key press events"""
@@ -65,7 +79,22 @@ class GameLoop(arcade.View):
             current_state = self.state_manager.get_current_state()
             ui_handled = self.renderer.handle_mouse_click(x, y, current_state)
             
-            # If UI didn't handle it, could add other mouse handling here
+            # Clicks that miss the UI select in the world
             if not ui_handled:
-                # Could handle world clicks, shooting, etc.
-                pass 
\ No newline at end of file
+                self.state_manager.select_entity_at(x, y)
+
+    def on_mouse_motion(self, x, y, dx, dy):
+        """Handle mouse motion events - hover the UI, or the world under it"""
+        if self.renderer.handle_mouse_motion(x, y):
+            self.state_manager.clear_hovered_entity()
+        else:
+            self.state_manager.hover_entity_at(x, y) 
+
+    def on_mouse_scroll(self, x, y, scroll_x, scroll_y):
+        """Handle mouse wheel events - scroll the UI under the mouse"""
+        self.renderer.handle_mouse_scroll(x, y, scroll_y)
+
+    def on_close(self):
+        """Window is closing - write back the game state and let the sounds finish before the process exits"""
+        self.state_manager.shutdown()
+        get_audio_engine().shutdown()
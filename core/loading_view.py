@@ -0,0 +1,97 @@
+"""
+Loading View - progress screen shown while the asset preloader runs
+
+Starts the audio engine once the sounds are converted, waits for it to load
+its sound tables, builds the game view once everything is loaded, and only
+then freezes the texture cache and switches to gameplay. Nothing is read from
+disk during play, apart from the long sounds that stream by design and any
+table that does not fit in the sound memory budget (SoundCache warns about
+those).
+"""
+
+import arcade
+
+from audio import get_audio_engine
+from core import startup_profiler, texture_cache
+from core.asset_preloader import AssetPreloader
+from core.constants import BLACK, SCREEN_WIDTH, SCREEN_HEIGHT, WHITE
+
+# Loading Screen Constants - Easy to tune
+LOADING_BAR_WIDTH = 600
+LOADING_BAR_HEIGHT = 8
+LOADING_BAR_COLOR = (255, 255, 255, 200)
+LOADING_BAR_BG_COLOR = (255, 255, 255, 40)
+LOADING_TEXT_SIZE = 14
+AUDIO_READY_TIMEOUT = 10.0   # Seconds to wait for the sound tables after everything else is loaded
+
+
+class LoadingView(arcade.View):
+    """Shows preloading progress, then hands over to the game"""
+
+    def __init__(self, window, make_game_view, preloader=None):
+        """
+        Initialize the loading view
+
+        Args:
+            window: The game window
+            make_game_view: Function returning the view to show once loading is done
+            preloader: AssetPreloader to run (defaults to every asset in the manifest)
+        """
+        super().__init__()
+        self.window = window
+        self.make_game_view = make_game_view
+        self.preloader = preloader or AssetPreloader()
+        self.audio_engine = None
+        self.audio_wait_time = 0.0
+        self.status_text = arcade.Text("", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 30, WHITE, LOADING_TEXT_SIZE,
+                                       anchor_x="center")
+
+    def on_show_view(self):
+        """Start decoding as soon as the view is visible"""
+        arcade.set_background_color(BLACK)
+        self.preloader.start()
+
+    def on_close(self):
+        """Window closed while loading - stop the audio engine if it was started"""
+        if self.audio_engine is not None:
+            self.audio_engine.shutdown()
+
+    def on_update(self, delta_time):
+        """Upload finished textures and move on when everything is loaded"""
+        done = self.preloader.update()
+
+        if self.preloader.sounds_done and self.audio_engine is None:
+            # The engine loads the converted sounds in the background from here on
+            self.audio_engine = get_audio_engine()
+
+        if done and not self.audio_engine.is_ready():
+            self.audio_wait_time += delta_time
+            if self.audio_wait_time < AUDIO_READY_TIMEOUT:
+                return
+            print(f"Warning: Sounds still loading after {AUDIO_READY_TIMEOUT:.0f} s - starting anyway")
+
+        if done:
+            startup_profiler.mark(startup_profiler.PHASE_ASSETS_LOADED)
+            game_view = self.make_game_view()
+            texture_cache.freeze()
+            self.window.show_view(game_view)
+
+    def on_draw(self):
+        """Draw the progress bar and the asset being loaded"""
+        self.clear()
+        left = (SCREEN_WIDTH - LOADING_BAR_WIDTH) / 2
+        bottom = SCREEN_HEIGHT / 2
+        arcade.draw_lbwh_rectangle_filled(left, bottom, LOADING_BAR_WIDTH, LOADING_BAR_HEIGHT, LOADING_BAR_BG_COLOR)
+        fill_width = LOADING_BAR_WIDTH * self.preloader.progress
+        if fill_width > 0:
+            arcade.draw_lbwh_rectangle_filled(left, bottom, fill_width, LOADING_BAR_HEIGHT, LOADING_BAR_COLOR)
+
+        loaded = self.preloader.loaded_count
+        total = self.preloader.total_count
+        if loaded == total and self.audio_engine is not None:
+            current = "sounds"
+        else:
+            current = self.preloader.current_path or ""
+        self.status_text.text = f"Loading {loaded}/{total}  {current}"
+        self.status_text.draw()
+        startup_profiler.mark(startup_profiler.PHASE_FIRST_FRAME)
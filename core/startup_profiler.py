@@ -0,0 +1,78 @@
+"""
+Startup Profiler - wall-clock phases of a cold start, up to the first game frame
+
+main.py and the views mark each phase as it finishes (imports, window open,
+first loading screen frame, assets loaded, first game frame). With
+VSG_STARTUP_PROFILE set to a file path, the phases are written there as JSON
+once the first game frame is drawn and the game exits, so
+tools/profile_startup.py can run it unattended. Without it, marking a phase
+only appends to a list.
+"""
+
+import json
+import os
+import time
+
+# Profiler Constants - Easy to tune
+STARTUP_PROFILE_ENV = "VSG_STARTUP_PROFILE"   # Phases are written to this path, then the game exits
+
+# Phase names, in the order they happen
+PHASE_IMPORTS = "imports"
+PHASE_WINDOW = "window"
+PHASE_FIRST_FRAME = "first_frame"
+PHASE_ASSETS_LOADED = "assets_loaded"
+PHASE_FIRST_GAME_FRAME = "first_game_frame"
+
+_phases = []   # (name, wall-clock time)
+
+
+def mark(phase):
+    """
+    Record that a startup phase finished (only the first mark of a phase counts)
+
+    Args:
+        phase: Phase name (one of the PHASE_* constants)
+    """
+    if not any(name == phase for name, _ in _phases):
+        _phases.append((phase, time.time()))
+
+
+def get_phases():
+    """Get the recorded phases as (name, wall-clock time) pairs"""
+    return list(_phases)
+
+
+def finish_startup():
+    """
+    Mark the first game frame, and write the report and exit when profiling
+
+    Returns:
+        bool: True if the game is exiting because a profile was requested
+    """
+    mark(PHASE_FIRST_GAME_FRAME)
+    path = os.environ.get(STARTUP_PROFILE_ENV)
+    if not path:
+        return False
+
+    import arcade
+    write_phases(path)
+    arcade.exit()
+    return True
+
+
+def write_phases(path):
+    """
+    Write the phases as JSON
+
+    Times are wall-clock (time.time()), so the process that launched the game
+    can measure them from the moment it spawned it.
+
+    Args:
+        path: File to write
+    """
+    report = {
+        "pid": os.getpid(),
+        "phases": [{"name": name, "time": at} for name, at in _phases],
+    }
+    with open(path, "w") as report_file:
+        json.dump(report, report_file, indent=2)
@@ -0,0 +1,169 @@
+"""
+Texture Cache - one shared texture per image path
+
+Renderers get their textures from here instead of calling arcade.load_texture
+themselves, so every image is read once (from the asset archive when there is
+one) - normally by the asset preloader, before gameplay starts. Once the cache
+is frozen a texture that was not preloaded is still loaded, but reported,
+since it means a disk read in the middle of a frame.
+
+Large images have downscaled variants (tools/build_texture_variants.py);
+get_texture_for_size picks the smallest one that still covers the size an
+image is drawn at.
+"""
+
+import arcade
+from PIL import Image
+
+from core import asset_manifest
+from core.asset_archive import open_asset
+
+_textures = {}
+_missing = set()
+_frozen = False
+
+
+def load_texture(path):
+    """
+    Decode an image into a new texture, from the asset archive or the loose file
+
+    Touches no GL state, so it can run on a worker thread.
+
+    Args:
+        path: Asset path
+
+    Returns:
+        arcade.Texture: The texture (not cached)
+    """
+    with open_asset(path) as image_file:
+        image = Image.open(image_file)
+        image = image.convert("RGBA") if image.mode != "RGBA" else image.copy()
+    return arcade.Texture(image, hash=path)
+
+
+def add_texture(path, texture):
+    """
+    Put an already loaded texture in the cache
+
+    Args:
+        path: Asset path the texture was loaded from
+        texture: The arcade.Texture
+    """
+    _textures[path] = texture
+
+
+def has_texture(path):
+    """Check if a texture is cached"""
+    return path in _textures
+
+
+def get_texture(path):
+    """
+    Get the texture of an image, loading it on first use
+
+    Args:
+        path: Asset path (e.g. "assets/spaceship.png")
+
+    Returns:
+        arcade.Texture: The shared texture
+
+    Raises:
+        FileNotFoundError: If the image does not exist (remembered, so the
+            disk is only checked once)
+    """
+    texture = _textures.get(path)
+    if texture is not None:
+        return texture
+    if path in _missing:
+        raise FileNotFoundError(path)
+
+    if _frozen:
+        print(f"Warning: Texture loaded during gameplay: {path} (add it to the asset manifest)")
+    try:
+        texture = load_texture(path)
+    except FileNotFoundError:
+        _missing.add(path)
+        raise
+    _textures[path] = texture
+    return texture
+
+
+def choose_variant(path, width, height):
+    """
+    Pick the smallest version of an image that covers a drawn size
+
+    Args:
+        path: Asset path of the full-size image
+        width: Width the image is drawn at, in pixels
+        height: Height the image is drawn at, in pixels
+
+    Returns:
+        str: Path of a downscaled variant, or the full-size path if no variant
+            is large enough
+    """
+    chosen = path
+    for variant in asset_manifest.get_image_variants(path):
+        if variant["width"] < width or variant["height"] < height:
+            break
+        chosen = variant["path"]
+    return chosen
+
+
+def get_texture_for_size(path, width, height):
+    """
+    Get the smallest texture of an image that covers a drawn size
+
+    Args:
+        path: Asset path of the full-size image
+        width: Width the image is drawn at, in pixels
+        height: Height the image is drawn at, in pixels
+
+    Returns:
+        arcade.Texture: A downscaled variant, or the full-size texture if no
+            variant is large enough
+
+    Raises:
+        FileNotFoundError: If the image does not exist
+    """
+    chosen = choose_variant(path, width, height)
+    try:
+        return get_texture(chosen)
+    except FileNotFoundError:
+        if chosen == path:
+            raise
+        print(f"Warning: Missing texture variant {chosen} (run tools/build_texture_variants.py)")
+        return get_texture(path)
+
+
+def get_image_size(path):
+    """
+    Get the full size of an image, without loading it if the manifest has it
+
+    Args:
+        path: Asset path
+
+    Returns:
+        tuple: (width, height) in pixels
+
+    Raises:
+        FileNotFoundError: If the image does not exist
+    """
+    info = asset_manifest.get_image_info(path)
+    if info is not None:
+        return info["width"], info["height"]
+    texture = get_texture(path)
+    return texture.width, texture.height
+
+
+def freeze():
+    """Report every texture loaded from now on - called when gameplay starts"""
+    global _frozen
+    _frozen = True
+
+
+def clear():
+    """Forget every cached texture"""
+    global _frozen
+    _textures.clear()
+    _missing.clear()
+    _frozen = False
@@ -0,0 +1,183 @@
+"""
+Timer Wheel - hierarchical timing wheel for scheduling callbacks at game times
+
+Timers are bucketed by the tick they expire on. Level 0 has one slot per tick;
+each higher level covers WHEEL_SLOTS times the span of the level below, and
+its slots are cascaded down as the wheel turns. Scheduling and cancelling are
+O(1), and advancing costs one slot per tick plus the timers that expire, no
+matter how many timers are waiting.
+
+Timers never fire early: a timer fires on the first advance() whose time is
+at or past its deadline.
+"""
+
+import math
+
+# Timer Wheel Constants - Easy to tune
+WHEEL_RESOLUTION = 1.0 / 60.0   # Seconds per tick
+WHEEL_SLOT_BITS = 6             # 64 slots per level
+WHEEL_LEVELS = 4                # 4 levels cover 64^4 ticks (~77 hours at 60 ticks/s)
+
+WHEEL_SLOTS = 1 << WHEEL_SLOT_BITS
+_SLOT_MASK = WHEEL_SLOTS - 1
+
+
+class Timer:
+    """Handle of a scheduled callback"""
+
+    __slots__ = ("deadline", "tick", "callback", "args", "cancelled")
+
+    def __init__(self, deadline, tick, callback, args):
+        self.deadline = deadline
+        self.tick = tick
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Stop the timer from firing - cancelled timers are dropped when their slot is reached"""
+        self.cancelled = True
+        self.callback = None
+        self.args = ()
+
+
+class TimerWheel:
+    """Schedules callbacks at game times"""
+
+    def __init__(self, now=0.0, resolution=WHEEL_RESOLUTION):
+        """
+        Initialize an empty wheel
+
+        Args:
+            now: Current game time
+            resolution: Seconds per tick
+        """
+        self.resolution = resolution
+        self.now = now
+        self.current_tick = self._tick_at(now)
+        self.wheels = [[[] for _ in range(WHEEL_SLOTS)] for _ in range(WHEEL_LEVELS)]
+        self.overflow = []   # Timers beyond the span of the top level
+        self.due = []        # Timers whose tick has been reached but that have not fired yet
+
+    def _tick_at(self, game_time):
+        """Tick that has been reached at a game time"""
+        return math.floor(game_time / self.resolution)
+
+    def schedule(self, deadline, callback, *args):
+        """
+        Call callback(*args) once the game time reaches the deadline
+
+        Args:
+            deadline: Game time to fire at
+            callback: Function to call
+            *args: Arguments for the callback
+
+        Returns:
+            Timer: Handle that can be cancelled
+        """
+        timer = Timer(deadline, math.ceil(deadline / self.resolution), callback, args)
+        self._insert(timer)
+        return timer
+
+    def _insert(self, timer):
+        """Put a timer in the slot for its tick"""
+        delta = timer.tick - self.current_tick
+        if delta <= 0:
+            self.due.append(timer)
+            return
+
+        for level in range(WHEEL_LEVELS):
+            if delta < 1 << (WHEEL_SLOT_BITS * (level + 1)):
+                slot = (timer.tick >> (WHEEL_SLOT_BITS * level)) & _SLOT_MASK
+                self.wheels[level][slot].append(timer)
+                return
+        self.overflow.append(timer)
+
+    def advance(self, now):
+        """
+        Move the wheel to a new game time and fire every timer that expired
+
+        Callbacks fire in deadline order and may schedule new timers, which
+        fire in the same call if they are already due.
+
+        Args:
+            now: New game time
+
+        Returns:
+            int: Number of timers fired
+        """
+        self.now = now
+        target_tick = self._tick_at(now)
+        fired = 0
+
+        while True:
+            if self.due:
+                due = self.due
+                self.due = []
+                due.sort(key=lambda timer: timer.deadline)
+                for timer in due:
+                    if not timer.cancelled:
+                        callback, args = timer.callback, timer.args
+                        timer.cancel()
+                        callback(*args)
+                        fired += 1
+                continue
+
+            if self.current_tick >= target_tick:
+                break
+            self.current_tick += 1
+            tick = self.current_tick
+
+            # Cascade higher levels down when the levels below wrap around
+            for level in range(1, WHEEL_LEVELS):
+                if tick & ((1 << (WHEEL_SLOT_BITS * level)) - 1):
+                    break
+                slot = (tick >> (WHEEL_SLOT_BITS * level)) & _SLOT_MASK
+                timers = self.wheels[level][slot]
+                self.wheels[level][slot] = []
+                for timer in timers:
+                    if not timer.cancelled:
+                        self._insert(timer)
+            else:
+                if self.overflow and not tick & ((1 << (WHEEL_SLOT_BITS * WHEEL_LEVELS)) - 1):
+                    overflow = self.overflow
+                    self.overflow = []
+                    for timer in overflow:
+                        if not timer.cancelled:
+                            self._insert(timer)
+
+            slot = tick & _SLOT_MASK
+            if self.wheels[0][slot]:
+                self.due.extend(self.wheels[0][slot])
+                self.wheels[0][slot] = []
+
+        return fired
+
+    def pending_timers(self):
+        """Get every timer that has not fired or been cancelled"""
+        timers = [timer for timer in self.due if not timer.cancelled]
+        for level in self.wheels:
+            for slot in level:
+                timers.extend(timer for timer in slot if not timer.cancelled)
+        timers.extend(timer for timer in self.overflow if not timer.cancelled)
+        return timers
+
+    def reset(self, now=0.0, keep_timers=False):
+        """
+        Move the clock to a new time without firing anything
+
+        Used when loading a game. Kept timers are re-bucketed for the new
+        time; those already due fire on the next advance().
+
+        Args:
+            now: New game time
+            keep_timers: Keep pending timers instead of dropping them
+        """
+        timers = self.pending_timers() if keep_timers else []
+        self.now = now
+        self.current_tick = self._tick_at(now)
+        self.wheels = [[[] for _ in range(WHEEL_SLOTS)] for _ in range(WHEEL_LEVELS)]
+        self.overflow = []
+        self.due = []
+        for timer in timers:
+            self._insert(timer)
@@ -5,5 +5,5 @@ Entities package - contains all game entities with separated state and rendering
 from .base_entity import BaseEntity
 from .player_entity import PlayerEntity  
 from .asteroid_entity import AsteroidEntity
-from .base_module import BaseModule, ModuleState
+from .base_module import BaseModule, ModuleState, ModuleEvent
 from .mining_laser_module import MiningLaserModule 
\ No newline at end of file
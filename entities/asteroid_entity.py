@@ -4,10 +4,9 @@ Asteroid Entity - handles stationary asteroids with ore resources
 
 import random
 
-import arcade
-
-from audio.audio_engine import AudioEngine
+from audio import get_audio_engine
 from audio.sound_bank import SoundBank
+from core.asset_manifest import get_image_radius
 from entities.base_entity import BaseEntity
 from game_state.inventory import Inventory
 from game_state.inventory_types import InventoryType
@@ -22,7 +21,7 @@ ASTEROID_MAX_ROTATION_SPEED = 5   # Maximum rotation speed (degrees/second)
 ASTEROID_MIN_ORE = 30             # Minimum ore amount per asteroid (10x)
 ASTEROID_MAX_ORE = 100            # Maximum ore amount per asteroid (10x)
 
-# Asteroid collision radii by type (base values before scaling)
+# Fallback collision radii by type (base values before scaling), used if the asset manifest is missing
 ASTEROID_BASE_RADII = {
     1: 40,  # asteroid1.png
     2: 35,  # asteroid2.png  
@@ -41,10 +40,26 @@ ASTEROID_ORE_TYPES = [
     InventoryType.OMBER
 ]
 
+# Asteroid type -> collision radius at scale 1.0, looked up once per type
+_base_radii = {}
+
+
+def get_base_radius(asteroid_type):
+    """Collision radius of an asteroid type at scale 1.0, from the asset manifest - no texture is loaded"""
+    radius = _base_radii.get(asteroid_type)
+    if radius is None:
+        radius = get_image_radius(f"assets/asteroid{asteroid_type}.png")
+        if radius is None:
+            radius = ASTEROID_BASE_RADII.get(asteroid_type, 30)
+        _base_radii[asteroid_type] = radius
+    return radius
+
 
 class AsteroidEntity(BaseEntity):
     """Stationary asteroid entity with ore resources"""
     
+    PICKABLE = True
+    
     def __init__(self, x, y):
         """Initialize the asteroid entity"""
         super().__init__(x, y)
@@ -75,12 +90,57 @@ class AsteroidEntity(BaseEntity):
         self.active_mining_module = None  # Reference to active mining module
 
         # Create inventory with initial ore
-        self.inventory = Inventory(max_units=initial_ore)
+        self.inventory = Inventory(max_units=initial_ore, owner=self)
         self.inventory.add_item(self.ore_type, initial_ore)
         
         # Cache the collision radius
         self._cached_radius = None
-        
+
+    @classmethod
+    def restore(cls, entity_id, x, y, asteroid_type, scale, rotation, rotation_speed, ore_type, ore_quantity, max_units,
+                collision_radius=None):
+        """
+        Recreate an asteroid from saved values without rolling any random properties
+
+        Args:
+            entity_id: Saved entity id
+            x, y: Position of the asteroid
+            asteroid_type: Which asteroid asset to use (1-6)
+            scale: Size scale factor
+            rotation: Current rotation in degrees
+            rotation_speed: Rotation speed in degrees per second
+            ore_type: InventoryType of the ore
+            ore_quantity: Ore remaining in the asteroid
+            max_units: Inventory capacity (the initial ore amount)
+            collision_radius: get_base_radius(asteroid_type) * scale, if the
+                caller already has it (None computes it on first use)
+
+        Returns:
+            AsteroidEntity: The restored asteroid
+        """
+        # Assign all attributes at once - this runs for every asteroid in a save
+        asteroid = cls.__new__(cls)
+        inventory = Inventory(max_units=max_units, owner=asteroid)
+        if ore_quantity > 0:
+            inventory.items[ore_type] = ore_quantity
+
+        asteroid.__dict__.update(
+            x=x,
+            y=y,
+            active=True,
+            entity_id=entity_id,
+            dirty_set=None,
+            asteroid_type=asteroid_type,
+            scale=scale,
+            rotation=rotation,
+            rotation_speed=rotation_speed,
+            ore_type=ore_type,
+            active_mining_module=None,
+            inventory=inventory,
+            _cached_radius=collision_radius,
+        )
+        return asteroid
+
     def update(self, delta_time, input_commands=None):
         """Update asteroid logic (rotation and depletion check)"""
         if not self.active:
@@ -92,7 +152,7 @@ class AsteroidEntity(BaseEntity):
         
         # Check if asteroid is depleted
         if self.is_depleted():
-            AudioEngine.get_instance().play_sound(SoundBank.MINING_BLAST)
+            get_audio_engine().play_sound(SoundBank.MINING_BLAST, position=(self.x, self.y))
             self.destroy()
             
     def start_mining(self, mining_module):
@@ -106,17 +166,7 @@ class AsteroidEntity(BaseEntity):
     def get_collision_radius(self):
         """Get the collision radius based on asteroid type and scale"""
         if self._cached_radius is None:
-            # Load the texture to get the actual size
-            texture_path = f"assets/asteroid{self.asteroid_type}.png"
-            try:
-                texture = arcade.load_texture(texture_path)
-                # Use the texture's width and height to determine the radius
-                radius = max(texture.width, texture.height) / 2
-                self._cached_radius = radius * self.scale
-            except FileNotFoundError:
-                # Fallback to base radius if texture is not found
-                base_radius = ASTEROID_BASE_RADII.get(self.asteroid_type, 30)
-                self._cached_radius = base_radius * self.scale
+            self._cached_radius = get_base_radius(self.asteroid_type) * self.scale
         return self._cached_radius
         
     def is_depleted(self):
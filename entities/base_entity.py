@@ -2,17 +2,51 @@
 Base Entity - defines the interface for all game entities
 """
 
+import itertools
 from abc import ABC, abstractmethod
 
 
 class BaseEntity(ABC):
     """Abstract base class for all game entities"""
     
+    # Source of entity ids - ids stay stable across saves and loads
+    _entity_ids = itertools.count(1)
+    
+    # Stationary entities the player can hover and select (kept in the GameState's spatial index)
+    PICKABLE = False
+    
     def __init__(self, x=0, y=0):
         """Initialize entity with position"""
         self.x = x
         self.y = y
         self.active = True
+        self.entity_id = BaseEntity.new_entity_id()
+        
+        # Dirty tracking - set by the GameState the entity is added to
+        self.dirty_set = None
+        
+    @staticmethod
+    def new_entity_id():
+        """Get an unused entity id"""
+        return next(BaseEntity._entity_ids)
+        
+    @classmethod
+    def reserve_entity_ids(cls, highest_id):
+        """
+        Make sure new entities get ids above highest_id
+        
+        Called after loading a save so new entities don't reuse saved ids.
+        
+        Args:
+            highest_id: Highest entity id in use
+        """
+        next_id = next(BaseEntity._entity_ids)
+        BaseEntity._entity_ids = itertools.count(max(next_id, highest_id + 1))
+        
+    def mark_dirty(self):
+        """Record that this entity changed since the last save"""
+        if self.dirty_set is not None:
+            self.dirty_set.add(self)
         
     @abstractmethod
     def update(self, delta_time, input_commands=None):
@@ -22,7 +56,8 @@ class BaseEntity(ABC):
     def destroy(self):
         """Mark entity as inactive"""
         self.active = False
+        self.mark_dirty()
         
     def is_active(self):
         """Check if entity is active"""
-        return self.active 
\ No newline at end of file
+        return self.active 
@@ -1,16 +1,49 @@
 """
 Base Module - defines the interface for spaceship modules/abilities
+
+Module cycles (active -> cooling down -> ready) are driven by the game
+state's timer wheel: each transition schedules the next one, so modules are
+not updated every frame. Timers and progress are derived from the deadlines
+of the current phase.
+
+States are small integers and every transition goes through
+MODULE_TRANSITIONS, so per-frame state checks are integer comparisons.
 """
 
 from abc import ABC, abstractmethod
+from enum import IntEnum
 import time
 
 
-class ModuleState:
-    """Enumeration for module states"""
-    READY = "ready"           # Module is ready to be activated
-    ACTIVE = "active"         # Module is currently active/executing
-    COOLING_DOWN = "cooling_down"  # Module is cooling down after use
+class ModuleState(IntEnum):
+    """Module states - the values are also the codes written to save files"""
+    READY = 0           # Module is ready to be activated
+    ACTIVE = 1          # Module is currently active/executing
+    COOLING_DOWN = 2    # Module is cooling down after use
+
+    def __str__(self):
+        return self.name.lower()
+
+
+class ModuleEvent(IntEnum):
+    """Events that move a module between states"""
+    ACTIVATE = 0        # The module was activated
+    PHASE_END = 1       # The timer of the current phase expired
+    CANCEL = 2          # The module was unequipped or destroyed
+
+
+# Module-level aliases for hot paths - reading a global is much cheaper than
+# looking a member up on the enum class (ModuleState.READY)
+STATE_READY, STATE_ACTIVE, STATE_COOLING_DOWN = ModuleState
+_ACTIVATE, _PHASE_END, _CANCEL = ModuleEvent
+
+# Next state, indexed [state][event] - None means the event is not allowed in that state
+MODULE_TRANSITIONS = (
+    # ACTIVATE            PHASE_END                  CANCEL
+    (ModuleState.ACTIVE,  None,                      ModuleState.READY),   # READY
+    (None,                ModuleState.COOLING_DOWN,  ModuleState.READY),   # ACTIVE
+    (None,                ModuleState.READY,         ModuleState.READY),   # COOLING_DOWN
+)
 
 
 class BaseModule(ABC):
@@ -33,7 +66,11 @@ class BaseModule(ABC):
         
         # State management
         self.state = ModuleState.READY
-        self.cooldown_remaining = 0.0
+        self.phase_start = 0.0   # Game time the current phase started
+        self.phase_end = 0.0     # Game time the current phase ends (when not ready)
+        self._phase_timer = None
+        # Length of each state's phase, indexed by state (ready has no end)
+        self.phase_durations = (None, self.CYCLE_ACTIVE_TIME, self.CYCLE_COOLDOWN_TIME)
         self.last_activation_time = 0.0
         self.fitted_to_ship_entity = None
         
@@ -42,27 +79,90 @@ class BaseModule(ABC):
         self.equipped = False  # Whether module is equipped to a ship
         self.module_index = -1  # Index in ship's module list
         
-    def update(self, delta_time):
-        """Update module state and cooldown timer"""
-        if not self.active:
-            return
+    def _get_timer_wheel(self):
+        """Get the timer wheel of the game state the module's ship is in, or None"""
+        game_state = getattr(self.fitted_to_ship_entity, "game_state", None)
+        return game_state.timer_wheel if game_state is not None else None
+    
+    def _now(self):
+        """Current game time, as seen by the timer wheel"""
+        timer_wheel = self._get_timer_wheel()
+        return timer_wheel.now if timer_wheel is not None else self.phase_start
+    
+    def _enter_phase(self, state, start=None):
+        """
+        Switch to a new state and schedule the end of its phase
+        
+        Args:
+            state: The new ModuleState
+            start: Game time the phase started (defaults to now)
+        """
+        if self._phase_timer is not None:
+            self._phase_timer.cancel()
+            self._phase_timer = None
+        
+        timer_wheel = self._get_timer_wheel()
+        now = timer_wheel.now if timer_wheel is not None else 0.0
+        duration = self.phase_durations[state]
+        self.state = state
+        self.phase_start = now if start is None else start
+        self.phase_end = self.phase_start + duration if duration is not None else self.phase_start
+        if duration is not None and timer_wheel is not None:
+            self._phase_timer = timer_wheel.schedule(self.phase_end, self._on_phase_end)
+        
+        if self.fitted_to_ship_entity is not None:
+            self.fitted_to_ship_entity.mark_dirty()
+    
+    def _transition(self, event, start=None):
+        """
+        Follow MODULE_TRANSITIONS for an event
         
-        # Update cooldown timer
-        if self.state == ModuleState.COOLING_DOWN:
-            self.cooldown_remaining -= delta_time
+        Args:
+            event: The ModuleEvent
+            start: Game time the new phase started (defaults to now)
             
-            if self.cooldown_remaining <= 0.0:
-                self.cooldown_remaining = 0.0
-                self.state = ModuleState.READY
-                self._on_cooldown_complete()
+        Returns:
+            bool: True if the event was allowed in the current state
+        """
+        next_state = MODULE_TRANSITIONS[self.state][event]
+        if next_state is None:
+            return False
+        self._enter_phase(next_state, start)
+        return True
+    
+    @property
+    def cooldown_remaining(self):
+        """Seconds of cooldown left (0 unless cooling down)"""
+        if self.state != STATE_COOLING_DOWN:
+            return 0.0
+        return max(0.0, self.phase_end - self._now())
+    
+    @property
+    def active_timer(self):
+        """Seconds spent in the current activation (0 unless active)"""
+        if self.state != STATE_ACTIVE:
+            return 0.0
+        return min(self.CYCLE_ACTIVE_TIME, max(0.0, self._now() - self.phase_start))
+    
+    def restore_cycle(self, state, time_left):
+        """
+        Restore a saved cycle state, relative to the current game time
         
-        # Update active state
-        elif self.state == ModuleState.ACTIVE:
-            self._update_active_state(delta_time)
+        Args:
+            state: The saved ModuleState
+            time_left: Seconds until the current phase ends
+        """
+        duration = self.phase_durations[state]
+        if duration is None:
+            self._enter_phase(state)
+        else:
+            self._enter_phase(state, self._now() - (duration - time_left))
     
     def can_activate(self):
         """Check if module can be activated"""
-        return self.active and self.equipped and self.state == ModuleState.READY
+        return (self.active and self.equipped
+                and MODULE_TRANSITIONS[self.state][_ACTIVATE] is not None
+                and self._get_timer_wheel() is not None)
     
     def activate(self, ship_entity):
         """
@@ -77,24 +177,27 @@ class BaseModule(ABC):
         if not self.can_activate():
             return False
         
-        self.state = ModuleState.ACTIVE
-        self.last_activation_time = time.time()
-        
         # Start the module's effect
-        success = self.on_module_effect_start(ship_entity)
-        
-        if success:
-            # Don't start cooldown yet - let _update_active_state handle it
-            return True
-        else:
-            # Reset state if execution failed
-            self.state = ModuleState.READY
+        if not self.on_module_effect_start(ship_entity):
             return False
+        
+        self.last_activation_time = time.time()
+        return self._transition(_ACTIVATE)
+    
+    def _on_phase_end(self):
+        """Timer callback - the current phase is over"""
+        self._phase_timer = None
+        if self.state == STATE_ACTIVE:
+            # Apply the effect, then cool down
+            self.on_module_effect_end(self.fitted_to_ship_entity)
+            self._start_cooldown()
+        elif self._transition(_PHASE_END, start=self.phase_end):
+            self._on_cooldown_complete()
     
     def _start_cooldown(self):
-        """Start the cooldown period"""
-        self.state = ModuleState.COOLING_DOWN
-        self.cooldown_remaining = self.CYCLE_COOLDOWN_TIME
+        """Start the cooldown period at the end of the active phase"""
+        # Chain from the end of the active phase so cycles don't drift
+        self._transition(_PHASE_END, start=self.phase_end)
     
     def get_cycle_progress(self):
         """
@@ -103,14 +206,12 @@ class BaseModule(ABC):
         Returns:
             float: Progress from 0.0 (just started) to 1.0 (ready)
         """
-        if self.state == ModuleState.READY:
+        if self.state == STATE_READY:
             return 1.0
-        elif self.state == ModuleState.COOLING_DOWN:
-            return 1.0 - (self.cooldown_remaining / self.CYCLE_COOLDOWN_TIME)
-        elif self.state == ModuleState.ACTIVE:
-            return self.active_timer / self.CYCLE_ACTIVE_TIME
-        else:
-            return 0.0
+        duration = self.phase_end - self.phase_start
+        if duration <= 0.0:
+            return 1.0
+        return min(1.0, max(0.0, (self._now() - self.phase_start) / duration))
     
     def get_module_index(self):
         """
@@ -131,15 +232,24 @@ class BaseModule(ABC):
     
     def unequip_from_ship(self, ship_entity):
         """Unequip this module from a ship"""
+        self._cancel_phase()
         self.equipped = False
         self.module_index = -1
         self._on_unequipped(ship_entity)
     
     def destroy(self):
         """Deactivate the module"""
+        self._cancel_phase()
         self.active = False
         self.equipped = False
     
+    def _cancel_phase(self):
+        """Drop the scheduled end of the current phase and return to ready"""
+        if self._phase_timer is not None:
+            self._phase_timer.cancel()
+            self._phase_timer = None
+        self.state = MODULE_TRANSITIONS[self.state][_CANCEL]
+    
     # Abstract methods to be implemented by subclasses
     @abstractmethod
     def on_module_effect_start(self, ship_entity):
@@ -168,13 +278,6 @@ class BaseModule(ABC):
         pass
     
     # Optional overrides for subclasses
-    def _update_active_state(self, delta_time):
-        """
-        Update module while in active state
-        Override for modules that have ongoing effects
-        """
-        pass
-    
     def _on_equipped(self, ship_entity):
         """Called when module is equipped to a ship"""
         pass
@@ -2,16 +2,12 @@
 Mining Laser Module - mines ore from nearby asteroids
 """
 
-import random
-import time
-
 from blinker import Signal
 
-from audio.audio_engine import AudioEngine
+from audio import get_audio_engine
 from audio.sound_bank import SoundBank
 from entities.base_module import BaseModule
-from game_state.inventory_types import HitType, InventoryType
-from game_state.game_events import on_asteroid_mined
+from game_state.inventory_types import HitType
 
 
 # Mining Laser Constants - Easy to tune
@@ -20,6 +16,7 @@ ORE_PER_CYCLE = 20                   # Amount of ore mined per activation
 
 # Audio effect constants
 LASER_SOUND_VOLUME = 0.5  # Volume level (0.0 to 1.0)
+ORE_SOUND_VOLUME = 0.1    # Volume of the ore mined sound for normal hits
 
 class MiningLaserModule(BaseModule):
     """Mining laser module that extracts ore from nearby asteroids"""
@@ -41,26 +38,6 @@ class MiningLaserModule(BaseModule):
         
         # Visual effects
         self.current_target = None  # Currently targeted asteroid for visual effects
-        self.active_timer = 0.0     # Timer for active state
-    
-    def _determine_hit_type(self) -> tuple[HitType, float]:
-        """Determine the type of hit and its multiplier based on random rolls
-        
-        Returns:
-            tuple[HitType, float]: The hit type and its corresponding multiplier
-        """
-        roll = random.random()
-        
-        # Check for super critical first (5% chance)
-        if roll < HitType.SUPER_CRITICAL.chance:
-            return HitType.SUPER_CRITICAL, HitType.SUPER_CRITICAL.multiplier
-            
-        # Then check for critical (25% chance)
-        if roll < HitType.SUPER_CRITICAL.chance + HitType.CRITICAL.chance:
-            return HitType.CRITICAL, HitType.CRITICAL.multiplier
-            
-        # Otherwise normal hit (70% chance)
-        return HitType.NORMAL, HitType.NORMAL.multiplier
     
     def on_module_effect_start(self, ship_entity):
         """
@@ -72,9 +49,6 @@ class MiningLaserModule(BaseModule):
         Returns:
             bool: True if targeting was successful
         """
-        # Reset active timer when starting new activation
-        self.active_timer = 0.0
-        
         # Use the ship's targeting system to find the closest asteroid
         target_asteroid = ship_entity.find_closest_asteroid(max_range=self.mining_range)
         
@@ -88,73 +62,35 @@ class MiningLaserModule(BaseModule):
         target_asteroid.start_mining(self)
         return True
     
-    def _calculate_mining_amount(self, remaining_ore: int) -> tuple[int, HitType]:
-        """Calculate how much ore to mine based on hit type and remaining ore.
+    def on_module_effect_end(self, ship_entity):
+        """
+        Called when the module effect ends - queue the mining of the target
         
-        Args:
-            remaining_ore: Amount of ore remaining in the asteroid
-            
-        Returns:
-            tuple[int, HitType]: Amount to mine and the hit type
+        The ore is mined when the game state's mining resolver resolves all
+        cycles that ended this tick, see on_mining_resolved.
         """
-        hit_type, multiplier = self._determine_hit_type()
-        base_amount = min(self.ore_per_cycle, remaining_ore)
-        return int(base_amount * multiplier), hit_type
-
+        if not self._validate_mining_state(ship_entity):
+            return False
+        
+        ship_entity.game_state.mining_resolver.submit(self, ship_entity, self.current_target)
+        return True
 
-    def _transfer_ore(self, ship_entity, ore_type: InventoryType, amount: int, hit_type: HitType) -> bool:
-        """Transfer ore from asteroid to ship inventory.
+    def on_mining_resolved(self, ship_entity, ore_type, amount, hit_type):
+        """
+        Called by the mining resolver with the outcome of this laser's cycle
         
         Args:
-            ship_entity: The ship to transfer ore to
-            ore_type: Type of ore to transfer
-            amount: Amount to transfer
+            ship_entity: The ship this module is equipped to
+            ore_type: Type of ore that was mined
+            amount: Amount of ore mined (0 if the cargo hold was full)
             hit_type: Type of mining hit
-            
-        Returns:
-            bool: True if transfer was successful
         """
-        # First try to mine from asteroid
-        if not self.current_target.inventory.remove_item(self.current_target.ore_type, amount):
-            print("Mining failed: Could not mine ore from asteroid: {} / {} ".format(amount, self.current_target.inventory.get_item_quantity(self.current_target.ore_type)))
-            return False
-
-        # Add to ship inventory
-        if not ship_entity.inventory.add_item(ore_type, amount):
-            print("Transfer failed: Could not transfer ore from asteroid.")
-            return False
-            
-        return True
-
-    def on_module_effect_end(self, ship_entity):
-        """Called when the module effect ends - mine the targeted asteroid"""
-        if not self._validate_mining_state(ship_entity):
-            return False
-            
-        # Calculate mining amount
-        remaining_ore = self.current_target.inventory.get_item_quantity(self.current_target.ore_type)
-        mining_amount, hit_type = self._calculate_mining_amount(remaining_ore)
-
-        # Calculate how much will fit in ship inventory
-        available_space = ship_entity.inventory.get_available_space()
-        actual_amount = min(mining_amount, available_space)
-
-        if actual_amount <= 0:
+        if amount <= 0:
             print("Mining failed: Inventory full.")
-            AudioEngine.get_instance().play_sound(SoundBank.WARNING)
-            return False
-
-        # Transfer the ore
-        if not self._transfer_ore(ship_entity, self.current_target.ore_type, actual_amount, hit_type):
-            print("Mining failed: Could not transfer ore to ship inventory.", actual_amount)
-            return False
-        else:
-            on_asteroid_mined.send(self.current_target, amount=actual_amount, hit_type=hit_type)
-
-        # Update stats and play effects
-        self._play_ore_mined_sound(self.current_target.ore_type, actual_amount, hit_type)
-
-        return True
+            get_audio_engine().play_sound(SoundBank.WARNING, position=(ship_entity.x, ship_entity.y))
+            return
+        
+        self._play_ore_mined_sound(ship_entity, ore_type, amount, hit_type)
 
     def _validate_mining_state(self, ship_entity) -> bool:
         """Validate that mining can proceed."""
@@ -185,50 +121,36 @@ class MiningLaserModule(BaseModule):
             self.current_target.stop_mining()
         self.current_target = None
 
-    def _play_laser_sound(self):
-        AudioEngine.get_instance().play_sound(SoundBank.LASER_BEAM, duration=self.CYCLE_ACTIVE_TIME, loop=False, volume=0.05)
+    def _play_laser_sound(self, ship_entity):
+        get_audio_engine().play_sound(SoundBank.LASER_BEAM, duration=self.CYCLE_ACTIVE_TIME, loop=False, volume=0.05,
+                                              position=(ship_entity.x, ship_entity.y))
 
-    def _play_ore_mined_sound(self, ore_type, amount, hit_type):
+    def _play_ore_mined_sound(self, ship_entity, ore_type, amount, hit_type):
         """Play sound effect when ore is successfully mined
         
         Args:
+            ship_entity: The ship that mined the ore, where the sound comes from
             ore_type: Type of ore that was mined
             amount: Amount of ore mined
             hit_type: Type of mining hit (normal, critical, super critical)
         """
-        # Base volume for normal hits
-        base_volume = 0.1
-        
-        # Adjust volume and pitch based on hit type
+        # Louder for better hits; the ore, hit type and amount shape the sound itself
         if hit_type == HitType.SUPER_CRITICAL:
-            volume = base_volume * 2.0  # 50% louder
-            pitch_shift = 1.5  # Higher pitch for super critical
+            volume = ORE_SOUND_VOLUME * 2.0
         elif hit_type == HitType.CRITICAL:
-            volume = base_volume * 3.0  # 25% louder
-            pitch_shift = 1.25  # Higher pitch for critical
+            volume = ORE_SOUND_VOLUME * 3.0
         else:
-            volume = base_volume
-            pitch_shift = 1.0  # Normal pitch
+            volume = ORE_SOUND_VOLUME
             
-        AudioEngine.get_instance().play_sound(
-            SoundBank.SUCCESS,
-            volume=volume,
-            pitch_shift=pitch_shift
-        )
+        get_audio_engine().play_ore_sound(ore_type, hit_type, amount, volume=volume,
+                                                  position=(ship_entity.x, ship_entity.y))
 
-    def _update_active_state(self, delta_time):
-        """Update module while in active state - keep laser visible briefly"""
-        self.active_timer += delta_time
-        
-        # After active duration, execute end effect and start cooldown
-        if self.active_timer >= self.CYCLE_ACTIVE_TIME:
-            self.active_timer = 0.0
-            self.on_module_effect_end(self.fitted_to_ship_entity)
-            self._start_cooldown()
-    
     def activate(self, ship_entity):
         """
-        Override activate to handle visual effect duration
+        Override activate to start the laser sound
+        
+        The laser stays visible for CYCLE_ACTIVE_TIME; the timer wheel then
+        mines the target and starts the cooldown.
         
         Args:
             ship_entity: The ship this module is equipped to
@@ -236,26 +158,9 @@ class MiningLaserModule(BaseModule):
         Returns:
             bool: True if activation was successful
         """
-        if not self.can_activate():
+        if not super().activate(ship_entity):
             return False
         
-        self.state = "active"
-        self.last_activation_time = time.time()
-        
-        # Start the module effect
-        success = self.on_module_effect_start(ship_entity)
-        
-        if success:
-            # Start playing the laser sound
-            self._play_laser_sound()
-            # Don't immediately start cooldown - let _update_active_state handle it
-            # This allows the visual effect to be visible
-            return True
-        else:
-            # Reset state if execution failed
-            self.state = "ready"
-            return False
-
-    def update(self, delta_time):
-        """Update module state including sound effects"""
-        super().update(delta_time)
+        # Start playing the laser sound
+        self._play_laser_sound(ship_entity)
+        return True
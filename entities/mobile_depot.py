@@ -1,7 +1,7 @@
 """
 Mobile Depot Entity - A stationary container in space that can store large amounts of items
 """
-from audio.audio_engine import AudioEngine
+from audio import get_audio_engine
 from audio.sound_bank import SoundBank
 from entities.base_entity import BaseEntity
 from entities.player_entity import PlayerEntity
@@ -16,6 +16,8 @@ MOBILE_DEPOT_TRANSFER_RANGE = 50   # Range at which items are automatically tran
 class MobileDepot(BaseEntity):
     """Stationary container entity that can store large amounts of items and convert ore to minerals"""
     
+    PICKABLE = True
+    
     def __init__(self, x, y, game_state):
         """Initialize the mobile depot entity
         
@@ -27,7 +29,7 @@ class MobileDepot(BaseEntity):
         super().__init__(x, y)
         
         # Create a large inventory
-        self.inventory = Inventory(max_units=MOBILE_DEPOT_INVENTORY_SIZE)
+        self.inventory = Inventory(max_units=MOBILE_DEPOT_INVENTORY_SIZE, owner=self)
         
         # Cache the collision radius
         self._cached_radius = None
@@ -102,6 +104,6 @@ class MobileDepot(BaseEntity):
             items_transferred = True
 
         if items_transferred:
-            AudioEngine.get_instance().play_sound(SoundBank.MINERAL_PICKUP)
+            get_audio_engine().play_sound(SoundBank.MINERAL_PICKUP, position=(self.x, self.y))
 
         return items_transferred 
\ No newline at end of file
@@ -4,12 +4,12 @@ Player Entity - handles the player spaceship logic
 
 import math
 
-import arcade
+from blinker import Signal
 
-from audio.audio_engine import AudioEngine
+from audio import get_audio_engine
 from audio.sound_bank import SoundBank
 from entities.base_entity import BaseEntity
-from input.commands import InputCommand
+from input.commands import COMMAND_ROTATE_LEFT, COMMAND_ROTATE_RIGHT, COMMAND_THRUST
 from core.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from game_state.inventory import Inventory
 
@@ -21,6 +21,7 @@ PLAYER_DRAG = 0.2              # drag coefficient (higher = more drag)
 PLAYER_MAX_HEALTH = 100        # maximum health points
 PLAYER_MAX_MODULES = 4         # maximum number of modules that can be equipped
 PLAYER_INVENTORY_SIZE = 200    # maximum number of units the player can carry
+PLAYER_INVENTORY_WARNING_FRACTION = 0.9  # warn when the hold fills past this fraction
 
 # Module locator positions (relative to ship center)
 MODULE_LOCATORS = [
@@ -50,44 +51,56 @@ class PlayerEntity(BaseEntity):
         # Module system
         self.modules = []  # List of equipped modules
         self.max_modules = PLAYER_MAX_MODULES  # Maximum number of modules that can be equipped
+        self.on_modules_changed = Signal('on_modules_changed')  # Sent after a module is equipped or unequipped
         
         # Inventory system
-        self.inventory = Inventory(max_units=PLAYER_INVENTORY_SIZE)
+        self.inventory = Inventory(max_units=PLAYER_INVENTORY_SIZE, owner=self)
         self.inventory.on_items_added.connect(self.on_inventory_items_added)
         
         # Game state reference (for modules to access other entities)
         self.game_state = None
 
     def on_inventory_items_added(self, player_inventory, item_type, quantity):
-        self.check_play_inventory_full_sound()
+        # Warn when the hold crosses the threshold, not on every add above it
+        previous_units = self.inventory.get_total_units() - quantity
+        if previous_units / self.inventory.max_units <= PLAYER_INVENTORY_WARNING_FRACTION:
+            self.check_play_inventory_full_sound()
 
     def check_play_inventory_full_sound(self):
-        if self.inventory.get_total_units() / self.inventory.max_units > 0.9:
-            AudioEngine.get_instance().play_sound(SoundBank.WARNING)
+        if self.inventory.get_total_units() / self.inventory.max_units > PLAYER_INVENTORY_WARNING_FRACTION:
+            get_audio_engine().play_sound(SoundBank.WARNING)
 
-    def update(self, delta_time, input_commands=None):
-        """Update player logic based on input and physics"""
+    def update(self, delta_time, input_commands=0):
+        """
+        Update player logic based on input and physics
+        
+        Args:
+            delta_time: Seconds since the last tick
+            input_commands: Mask of held COMMAND_* bits (see input.commands)
+        """
         if not self.active:
             return
             
-        self._process_input(input_commands or [], delta_time)
+        previous = (self.x, self.y, self.rotation, self.velocity_x, self.velocity_y)
+        self._process_input(input_commands or 0, delta_time)
         self._update_physics(delta_time)
         self._handle_screen_bounds()
-        self._update_modules(delta_time)
         
-    def _process_input(self, commands, delta_time):
-        """Process input commands for player control"""
+        if previous != (self.x, self.y, self.rotation, self.velocity_x, self.velocity_y):
+            self.mark_dirty()
+        
+    def _process_input(self, held, delta_time):
+        """Process the held-command mask for player control"""
         # Reset thrust state
         self.is_thrusting = False
         
-        for command in commands:
-            if command == InputCommand.ROTATE_LEFT:
-                self.rotation += PLAYER_ROTATION_SPEED * delta_time  # A key: turn left 
-            elif command == InputCommand.ROTATE_RIGHT:
-                self.rotation -= PLAYER_ROTATION_SPEED * delta_time  # D key: turn right
-            elif command == InputCommand.THRUST:
-                self._apply_thrust(delta_time)
-                self.is_thrusting = True
+        if held & COMMAND_ROTATE_LEFT:
+            self.rotation += PLAYER_ROTATION_SPEED * delta_time  # A key: turn left 
+        if held & COMMAND_ROTATE_RIGHT:
+            self.rotation -= PLAYER_ROTATION_SPEED * delta_time  # D key: turn right
+        if held & COMMAND_THRUST:
+            self._apply_thrust(delta_time)
+            self.is_thrusting = True
                 
         # Normalize rotation to 0-360 degrees
         self.rotation = self.rotation % 360
@@ -155,18 +168,12 @@ class PlayerEntity(BaseEntity):
         
     def destroy(self):
         """Mark entity as inactive"""
-        self.active = False
+        super().destroy()
         
     def is_active(self):
         """Check if entity is active"""
         return self.active
 
-    def _update_modules(self, delta_time):
-        """Update all equipped modules"""
-        for module in self.modules:
-            if module.active:
-                module.update(delta_time)
-
     # Module management methods
     def equip_module(self, module):
         """
@@ -186,6 +193,8 @@ class PlayerEntity(BaseEntity):
             
         self.modules.append(module)
         module.equip_to_ship(self)
+        self.mark_dirty()
+        self.on_modules_changed.send(self)
         
         return True
     
@@ -204,6 +213,8 @@ class PlayerEntity(BaseEntity):
             
         self.modules.remove(module)
         module.unequip_from_ship(self)
+        self.mark_dirty()
+        self.on_modules_changed.send(self)
         return True
     
     def activate_module(self, module_index):
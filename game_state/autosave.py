@@ -0,0 +1,416 @@
+"""
+Autosave - background saves from snapshots taken at tick boundaries
+
+A save is split in two parts:
+    - Capture (main thread): copy the game state into snapshot columns. The
+      small entities are copied on the tick the save starts. Asteroids are
+      copied in chunks over the next ticks, never using more than the frame
+      budget, and any asteroid mined before its chunk is copied is saved with
+      its ore as it was when the save started (copy-on-write).
+    - Write (worker thread): encode the snapshot and write it with an atomic
+      rename, so the main thread never waits on the disk.
+
+Between full saves, the entities that changed are appended to a change
+journal every journal interval (see change_journal). Full saves then only
+serve as compaction: each one starts a new journal generation, and the old
+journal is deleted once the new base save is on disk. Until then, frames go
+to both journals, so a crash at any point leaves a base save with a
+matching journal.
+"""
+
+import os
+import queue
+import random
+import threading
+import time
+
+from entities.asteroid_entity import AsteroidEntity
+from entities.mobile_depot import MobileDepot
+from game_state.game_events import on_asteroid_mined, on_game_saved
+from game_state.change_journal import encode_frame, journal_header, journal_path
+from game_state.save_game import GameSnapshot, read_save_generation, write_snapshot
+
+# Autosave Constants - Easy to tune
+ASTEROIDS_PER_CHUNK = 256      # Asteroids copied between budget checks
+
+
+class AutosaveReport:
+    """Timings of a single autosave"""
+
+    def __init__(self, path, game_time):
+        """
+        Initialize an empty report
+
+        Args:
+            path: Path the save is written to
+            game_time: Game time of the tick the snapshot represents
+        """
+        self.path = path
+        self.game_time = game_time
+        self.snapshot_ms = 0.0       # Main-thread time spent capturing, summed over frames
+        self.max_frame_ms = 0.0      # Largest capture time in a single frame
+        self.frames = 0              # Number of frames the capture was spread over
+        self.write_ms = 0.0          # Worker-thread time spent encoding and writing
+        self.size_bytes = 0
+        self.error = None
+
+    def __str__(self):
+        """String representation of the report"""
+        if self.error:
+            return f"Autosave to {self.path} failed: {self.error}"
+        return (f"Autosaved {self.size_bytes / 1024:.0f} KB to {self.path}: "
+                f"snapshot {self.snapshot_ms:.1f} ms over {self.frames} frame(s) "
+                f"(max {self.max_frame_ms:.1f} ms/frame), write {self.write_ms:.1f} ms")
+
+
+class SnapshotCapture:
+    """Captures a GameSnapshot over several frames within a per-frame time budget"""
+
+    def __init__(self, game_state):
+        """
+        Start a capture - copies everything except the asteroids right away
+
+        Args:
+            game_state: The game state to capture
+        """
+        self.game_state = game_state
+        self.start_time = game_state.game_time
+        self.snapshot = GameSnapshot()
+        self.snapshot.game_time = game_state.game_time
+        self.snapshot.score = game_state.score
+        self.snapshot.rng_state = random.getstate()
+
+        # Freeze the entity list - later spawns and removals don't affect this save
+        self.entities = list(game_state.entities)
+        self.next_index = 0
+        self.asteroids = []       # Asteroids captured so far, in save order
+        self.ore_before = {}      # Asteroid -> ore quantity before it was first mined during the capture
+        self.finished = False
+        self.chunk_seconds = 0.0  # Recent worst-case time to capture one chunk
+
+        # The player and depots are added before the asteroids, so only the head
+        # of the list is scanned now. The rest is scanned chunk by chunk in step().
+        for entity in self.entities:
+            if isinstance(entity, AsteroidEntity):
+                break
+            if isinstance(entity, MobileDepot) and entity.active:
+                self.snapshot.capture_depot(entity)
+            self.next_index += 1
+
+        player = game_state.player_entity
+        if player and player.active:
+            self.snapshot.capture_player(player)
+
+        on_asteroid_mined.connect(self._on_asteroid_mined)
+
+    def _on_asteroid_mined(self, asteroid_entity, amount, hit_type=None, ore_before=None, **kwargs):
+        """Remember an asteroid's ore from before it was mined, the first time it is mined"""
+        if asteroid_entity not in self.ore_before:
+            if ore_before is None:
+                ore_before = sum(asteroid_entity.inventory.items.values()) + amount
+            self.ore_before[asteroid_entity] = ore_before
+
+    def step(self, budget_seconds):
+        """
+        Capture asteroids until the budget for this frame is used up
+
+        Args:
+            budget_seconds: Main-thread time this frame may spend
+
+        Returns:
+            bool: True when the capture is complete
+        """
+        now = time.perf_counter()
+        deadline = now + budget_seconds
+        elapsed = self.game_state.game_time - self.start_time
+        chunks = 0
+
+        while self.next_index < len(self.entities):
+            # Stop before a chunk that would likely overrun the budget (but always make progress)
+            if chunks and now + self.chunk_seconds > deadline:
+                return False
+
+            chunk_start = now
+            chunk = self.entities[self.next_index:self.next_index + ASTEROIDS_PER_CHUNK]
+            self.next_index += len(chunk)
+            asteroids = [entity for entity in chunk if isinstance(entity, AsteroidEntity)
+                         and (entity.active or entity in self.ore_before)]
+            self.snapshot.capture_asteroids(asteroids, elapsed, self.ore_before)
+            self.asteroids.extend(asteroids)
+
+            if len(asteroids) != len(chunk):
+                # Depots added after the asteroids are captured as they are now
+                for entity in chunk:
+                    if isinstance(entity, MobileDepot) and entity.active:
+                        self.snapshot.capture_depot(entity)
+
+            now = time.perf_counter()
+            self.chunk_seconds = max(self.chunk_seconds * 0.9, now - chunk_start)
+            chunks += 1
+
+        if not self.finished:
+            self._finish()
+        return True
+
+    def _finish(self):
+        """Stop tracking changes once every asteroid is captured"""
+        self.cancel()
+        self.finished = True
+
+    def cancel(self):
+        """Stop tracking mining events"""
+        on_asteroid_mined.disconnect(self._on_asteroid_mined)
+
+
+class AutosaveService:
+    """Periodically saves the game state without stalling frames"""
+
+    def __init__(self, game_state, path, interval, frame_budget_ms,
+                 journal_interval=None, journal_compact_bytes=None):
+        """
+        Initialize the autosave service
+
+        Args:
+            game_state: The game state to save
+            path: Path of the autosave file
+            interval: Seconds of game time between full autosaves
+            frame_budget_ms: Main-thread milliseconds a save may use per frame
+            journal_interval: Seconds of game time between journal flushes,
+                or None to only make full saves
+            journal_compact_bytes: Journal size that triggers an early full
+                save, or None to only compact on the interval
+        """
+        self.game_state = game_state
+        self.path = path
+        self.interval = interval
+        self.frame_budget = frame_budget_ms / 1000.0
+        self.journal_interval = journal_interval
+        self.journal_compact_bytes = journal_compact_bytes
+
+        self.capture = None
+        self.report = None
+        self.last_report = None
+
+        # Journal generations - continue numbering from the save already on disk
+        self.generation = read_save_generation(path)   # Generation of the latest started full save
+        self.journal_generations = []                   # Generations whose journals receive frames
+        self.journal_bytes = 0                          # Size of the newest journal (updated by the worker)
+        self.next_flush_time = game_state.game_time
+        self.last_rng_state = None
+        self.last_frame_clock = None                    # (game_time, score) the journal was last brought up to
+
+        if journal_interval is None:
+            self.next_save_time = game_state.game_time + interval
+        else:
+            # The journal needs a base save to continue
+            self.next_save_time = game_state.game_time
+
+        self._base_generation = self.generation  # Generation of the base save on disk (worker thread)
+        self._journal_files = {}                 # Generation -> open journal file (worker thread)
+        self._pending = queue.Queue()
+        self._writing = threading.Event()
+        self._worker = threading.Thread(target=self._write_loop, name="autosave", daemon=True)
+        self._worker.start()
+
+    def tick(self):
+        """Advance the autosave - call once per frame at the end of the game update"""
+        game_time = self.game_state.game_time
+        if self.journal_interval is not None and game_time >= self.next_flush_time:
+            self.flush_journal()
+
+        if self.capture is None:
+            if not self._writing.is_set() and len(self.journal_generations) > 1:
+                if self.last_report is not None and self.last_report.error is None:
+                    # The newest base save is on disk - stop writing to the old journal
+                    self.journal_generations = self.journal_generations[-1:]
+                else:
+                    # The base save failed - keep the old journal, drop the new one
+                    self._pending.put(("discard", self.journal_generations[-1], None))
+                    self.journal_generations = self.journal_generations[:-1]
+            compact = (self.journal_compact_bytes is not None
+                       and self.journal_bytes >= self.journal_compact_bytes)
+            if game_time < self.next_save_time and not compact:
+                return
+            if self._writing.is_set():
+                return  # Previous save is still being written
+            self.save_now()
+            return
+
+        self._step_capture()
+
+    def flush_journal(self):
+        """
+        Append the entities changed since the last flush to the journal
+
+        A frame is written whenever the game time or score moved, even if no
+        entity changed, so replay ends at the right game time (asteroid
+        rotation and module timers depend on it).
+        """
+        self.next_flush_time = self.game_state.game_time + self.journal_interval
+        dirty_entities = self.game_state.take_dirty_entities()
+        if not self.journal_generations:
+            return  # No base save to continue yet - the next one will include these changes
+
+        rng_state = random.getstate()
+        if rng_state == self.last_rng_state:
+            rng_state = None
+        else:
+            self.last_rng_state = rng_state
+        clock = (self.game_state.game_time, self.game_state.score)
+        if not dirty_entities and rng_state is None and clock == self.last_frame_clock:
+            return
+        self.last_frame_clock = clock
+
+        frame = encode_frame(self.game_state.game_time, self.game_state.score, dirty_entities, rng_state)
+        self._pending.put(("journal", frame, tuple(self.journal_generations)))
+
+    def save_now(self):
+        """Start a save on this tick, regardless of the interval"""
+        if self.capture is not None:
+            return
+        start = time.perf_counter()
+        if self.journal_interval is not None:
+            # Changes up to this tick go to the current journal, later ones to the new one
+            self.flush_journal()
+            self.game_state.take_dirty_entities()
+            self.last_rng_state = random.getstate()
+            self.last_frame_clock = (self.game_state.game_time, self.game_state.score)
+
+        self.generation += 1
+        self.report = AutosaveReport(self.path, self.game_state.game_time)
+        self.capture = SnapshotCapture(self.game_state)
+        self.capture.snapshot.generation = self.generation if self.journal_interval is not None else 0
+        if self.journal_interval is not None:
+            self.journal_generations.append(self.generation)
+        self.next_save_time = self.game_state.game_time + self.interval
+        self._step_capture(time.perf_counter() - start)
+
+    def _step_capture(self, already_spent=0.0):
+        """Run one frame's worth of capture and hand the snapshot over when done"""
+        start = time.perf_counter()
+        done = self.capture.step(max(0.0, self.frame_budget - already_spent))
+        frame_ms = (time.perf_counter() - start + already_spent) * 1000
+
+        self.report.frames += 1
+        self.report.snapshot_ms += frame_ms
+        self.report.max_frame_ms = max(self.report.max_frame_ms, frame_ms)
+
+        if done:
+            self._writing.set()
+            self._pending.put(("snapshot", self.capture.snapshot, self.report))
+            self.capture = None
+            self.report = None
+
+    def cancel(self):
+        """
+        Abandon a capture in progress (e.g. because a save was loaded)
+
+        The journals no longer match the game state, so journaling pauses
+        until the next full save, which starts right away.
+        """
+        if self.capture is not None:
+            self.capture.cancel()
+            self.capture = None
+            self.report = None
+            if self.journal_interval is not None:
+                self._pending.put(("discard", self.generation, None))
+        self.journal_generations = []
+        self.game_state.take_dirty_entities()
+        self.next_flush_time = self.game_state.game_time
+        if self.journal_interval is not None:
+            self.next_save_time = self.game_state.game_time
+        else:
+            self.next_save_time = self.game_state.game_time + self.interval
+
+    def close(self):
+        """
+        Write out everything the service still holds and stop the worker - call once on exit
+
+        The journal gets a last frame, a capture in progress is finished
+        (without the frame budget) and queued, and the worker drains the
+        queue before it stops, so nothing changed since the last flush is
+        lost and no half-written generation is left behind.
+        """
+        if not self._worker.is_alive():
+            return
+        if self.journal_interval is not None:
+            self.flush_journal()
+        while self.capture is not None:
+            self._step_capture()
+        self._pending.put(("stop", None, None))
+        self._worker.join()
+
+    def _write_loop(self):
+        """Worker thread - write snapshots and journal frames in the order they were queued"""
+        while True:
+            kind, payload, extra = self._pending.get()
+            if kind == "stop":
+                for journal_file in self._journal_files.values():
+                    journal_file.close()
+                self._journal_files.clear()
+                return
+            if kind == "journal":
+                self._append_journal(payload, extra)
+            elif kind == "snapshot":
+                self._write_base(payload, extra)
+            elif kind == "discard":
+                self._delete_journal(payload)
+
+    def _append_journal(self, frame, generations):
+        """Append a frame to the journal of each generation"""
+        for generation in generations:
+            if generation < self._base_generation:
+                continue  # A newer base save already contains these changes
+            try:
+                journal_file = self._journal_files.get(generation)
+                if journal_file is None:
+                    # Truncate - a file with this name can only be left over from an abandoned save
+                    directory = os.path.dirname(self.path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    journal_file = open(journal_path(self.path, generation), "wb")
+                    journal_file.write(journal_header(generation))
+                    self._journal_files[generation] = journal_file
+                journal_file.write(frame)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+                if generation == max(generations):
+                    self.journal_bytes = journal_file.tell()
+            except OSError as e:
+                print(f"Journal write failed: {e}")
+
+    def _write_base(self, snapshot, report):
+        """Write a full save, then delete the journals it replaces"""
+        start = time.perf_counter()
+        try:
+            directory = os.path.dirname(report.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            report.size_bytes = write_snapshot(snapshot, report.path)
+        except OSError as e:
+            report.error = e
+        report.write_ms = (time.perf_counter() - start) * 1000
+
+        if report.error is None and snapshot.generation:
+            self._base_generation = snapshot.generation
+            for generation in [generation for generation in self._journal_files if generation < snapshot.generation]:
+                self._delete_journal(generation)
+            journal_file = self._journal_files.get(snapshot.generation)
+            self.journal_bytes = journal_file.tell() if journal_file else 0
+
+        self.last_report = report
+        print(report)
+        self._writing.clear()
+        on_game_saved.send(self, report=report)
+
+    def _delete_journal(self, generation):
+        """Close and delete the journal of a generation"""
+        journal_file = self._journal_files.pop(generation, None)
+        if journal_file is not None:
+            journal_file.close()
+        try:
+            os.remove(journal_path(self.path, generation))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Could not delete journal: {e}")
@@ -0,0 +1,366 @@
+"""
+Change Journal - append-only log of entity changes between full saves
+
+Entities mark themselves dirty when they change (see BaseEntity.mark_dirty
+and Inventory). Every flush turns the dirty entities into one frame of
+compact records and appends it to the journal, so the data written is
+proportional to what changed instead of to the size of the world.
+
+A journal continues one base save: its generation is stored in the save's
+META section and in the journal header. Loading replays the journal on top
+of the base save. Frames are length-prefixed and CRC-checked, so a frame
+torn by a crash is detected and replay stops there.
+
+File layout (all values little-endian):
+    header:     magic (4s), version (H), reserved (H), generation (I)
+    frame:      payload length (I), crc32 of payload (I), payload
+    payload:    game_time (d), score (q), record count (I), records
+    record:     kind (B), entity_id (I), kind-specific fields
+"""
+
+import random
+import struct
+import sys
+import zlib
+from array import array
+
+from entities.asteroid_entity import AsteroidEntity
+from entities.mobile_depot import MobileDepot
+from entities.player_entity import PlayerEntity
+from game_state.save_game import (
+    INVENTORY_TYPES, MODULE_KINDS, MODULE_KIND_CODES, MODULE_STATE_CODES,
+    SaveFormatError, restore_module_state,
+)
+
+# Journal format constants
+JOURNAL_MAGIC = b"VSGJ"
+JOURNAL_FORMAT_VERSION = 1
+
+_JOURNAL_HEADER = struct.Struct("<4sHHI")
+_FRAME_HEADER = struct.Struct("<II")            # payload length, crc32
+_FRAME_META = struct.Struct("<dqI")             # game_time, score, record count
+_RECORD_HEADER = struct.Struct("<BI")           # kind, entity_id
+_ITEM = struct.Struct("<BI")                    # item_type, quantity
+_PLAYER_RECORD = struct.Struct("<7dIBB")        # x, y, rotation, vx, vy, health, max_health, max_units, item count, module count
+_MODULE_RECORD = struct.Struct("<BBffI")        # kind, state, cooldown_remaining, active_timer, target_id
+_DEPOT_RECORD = struct.Struct("<2dIB")          # x, y, max_units, item count
+_ASTEROID_RECORD = struct.Struct("<5f2I2B")     # x, y, scale, rotation, rotation_speed, ore, max_units, type, ore_type
+_RNG_RECORD = struct.Struct("<IId")             # version, has_gauss, gauss_next - followed by 625 state words
+_RNG_WORDS = 625
+
+# Record kinds
+RECORD_REMOVED = 0
+RECORD_PLAYER = 1
+RECORD_DEPOT = 2
+RECORD_ASTEROID = 3
+RECORD_RNG = 4
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def journal_path(save_path, generation):
+    """Path of the journal that continues a save of the given generation"""
+    return f"{save_path}.{generation}.journal"
+
+
+def journal_header(generation):
+    """Encode the header a new journal file starts with"""
+    return _JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_FORMAT_VERSION, 0, generation)
+
+
+def _encode_items(parts, inventory):
+    """Append the item stacks of an inventory"""
+    for item_type, quantity in inventory.items.items():
+        parts.append(_ITEM.pack(item_type.value, quantity))
+
+
+def _encode_entity(parts, entity):
+    """
+    Append the record for one dirty entity
+
+    Returns:
+        bool: True if a record was written (entities of unknown types are skipped)
+    """
+    if not entity.active:
+        parts.append(_RECORD_HEADER.pack(RECORD_REMOVED, entity.entity_id))
+    elif isinstance(entity, AsteroidEntity):
+        parts.append(_RECORD_HEADER.pack(RECORD_ASTEROID, entity.entity_id))
+        parts.append(_ASTEROID_RECORD.pack(
+            entity.x, entity.y, entity.scale, entity.rotation, entity.rotation_speed,
+            sum(entity.inventory.items.values()), entity.inventory.max_units,
+            entity.asteroid_type, entity.ore_type.value,
+        ))
+    elif isinstance(entity, PlayerEntity):
+        modules = [module for module in entity.modules if type(module) in MODULE_KIND_CODES]
+        parts.append(_RECORD_HEADER.pack(RECORD_PLAYER, entity.entity_id))
+        parts.append(_PLAYER_RECORD.pack(
+            entity.x, entity.y, entity.rotation,
+            entity.velocity_x, entity.velocity_y,
+            entity.health, entity.max_health,
+            entity.inventory.max_units, len(entity.inventory.items), len(modules),
+        ))
+        _encode_items(parts, entity.inventory)
+        for module in modules:
+            target = getattr(module, "current_target", None)
+            parts.append(_MODULE_RECORD.pack(
+                MODULE_KIND_CODES[type(module)],
+                MODULE_STATE_CODES.get(module.state, 0),
+                module.cooldown_remaining,
+                getattr(module, "active_timer", 0.0),
+                target.entity_id if target is not None else 0,
+            ))
+    elif isinstance(entity, MobileDepot):
+        parts.append(_RECORD_HEADER.pack(RECORD_DEPOT, entity.entity_id))
+        parts.append(_DEPOT_RECORD.pack(entity.x, entity.y, entity.inventory.max_units, len(entity.inventory.items)))
+        _encode_items(parts, entity.inventory)
+    else:
+        return False
+    return True
+
+
+def encode_frame(game_time, score, entities, rng_state=None):
+    """
+    Encode one journal frame
+
+    Args:
+        game_time: Game time of the tick the frame was taken on
+        score: Score at that tick
+        entities: Dirty entities to write full records for
+        rng_state: random.getstate() to record, or None if it has not changed
+
+    Returns:
+        bytes: The frame, ready to be appended to a journal
+    """
+    parts = []
+    record_count = 0
+    for entity in entities:
+        if _encode_entity(parts, entity):
+            record_count += 1
+
+    if rng_state is not None:
+        version, internal_state, gauss_next = rng_state
+        words = array("I", internal_state)
+        if not _LITTLE_ENDIAN:
+            words.byteswap()
+        parts.append(_RECORD_HEADER.pack(RECORD_RNG, 0))
+        parts.append(_RNG_RECORD.pack(version, gauss_next is not None, gauss_next or 0.0))
+        parts.append(words.tobytes())
+        record_count += 1
+
+    payload = _FRAME_META.pack(game_time, score, record_count) + b"".join(parts)
+    return _FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+class _FrameReader:
+    """Reads records from one frame payload"""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.offset = 0
+
+    def read(self, layout):
+        """Unpack the next fixed-size value"""
+        values = layout.unpack_from(self.payload, self.offset)
+        self.offset += layout.size
+        return values
+
+    def read_items(self, count):
+        """Read item stacks into an inventory dict"""
+        items = {}
+        for _ in range(count):
+            item_type, quantity = self.read(_ITEM)
+            items[INVENTORY_TYPES[item_type]] = quantity
+        return items
+
+
+class _JournalReplay:
+    """Applies journal frames to a loaded game state"""
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+        self.entities = {entity.entity_id: entity for entity in game_state.entities}
+        self.base_time = game_state.game_time
+        self.asteroid_times = {}   # Asteroid entity id -> game time of its last record
+        self.removed = False
+
+    def apply_frame(self, payload):
+        """Apply every record of one frame"""
+        reader = _FrameReader(payload)
+        game_time, score, record_count = reader.read(_FRAME_META)
+        player_modules = None
+        for _ in range(record_count):
+            kind, entity_id = reader.read(_RECORD_HEADER)
+            if kind == RECORD_REMOVED:
+                entity = self.entities.pop(entity_id, None)
+                if entity is not None:
+                    entity.destroy()
+                    self.removed = True
+            elif kind == RECORD_ASTEROID:
+                self._apply_asteroid(entity_id, reader.read(_ASTEROID_RECORD), game_time)
+            elif kind == RECORD_PLAYER:
+                player_modules = self._apply_player(entity_id, reader)
+            elif kind == RECORD_DEPOT:
+                x, y, max_units, item_count = reader.read(_DEPOT_RECORD)
+                depot = self.entities.get(entity_id)
+                if depot is None:
+                    depot = MobileDepot(x, y, self.game_state)
+                    depot.entity_id = entity_id
+                    self.game_state.add_entity(depot)
+                    self.entities[entity_id] = depot
+                depot.x, depot.y = x, y
+                depot.inventory.max_units = max_units
+                depot.inventory.restore_items(reader.read_items(item_count))
+            elif kind == RECORD_RNG:
+                version, has_gauss, gauss_next = reader.read(_RNG_RECORD)
+                words = array("I", payload[reader.offset:reader.offset + _RNG_WORDS * 4].tobytes())
+                if not _LITTLE_ENDIAN:
+                    words.byteswap()
+                reader.offset += _RNG_WORDS * 4
+                random.setstate((version, tuple(words), gauss_next if has_gauss else None))
+            else:
+                raise SaveFormatError(f"Unknown journal record kind {kind}")
+
+        self.game_state.game_time = game_time
+        self.game_state.score = score
+
+        # Module targets are resolved after the whole frame, so targets added in it are found.
+        # Module phases are scheduled relative to the frame's game time.
+        if player_modules is not None:
+            self.game_state.timer_wheel.reset(game_time, keep_timers=True)
+            self._apply_modules(*player_modules)
+
+    def _apply_asteroid(self, entity_id, values, game_time):
+        """Update or create an asteroid from its record"""
+        x, y, scale, rotation, rotation_speed, ore_quantity, max_units, asteroid_type, ore_type = values
+        ore_type = INVENTORY_TYPES[ore_type]
+        asteroid = self.entities.get(entity_id)
+        if asteroid is None:
+            asteroid = AsteroidEntity.restore(entity_id, x, y, asteroid_type, scale, rotation,
+                                              rotation_speed, ore_type, ore_quantity, max_units)
+            self.game_state.add_entity(asteroid)
+            self.entities[entity_id] = asteroid
+        else:
+            asteroid.x, asteroid.y = x, y
+            asteroid.scale = scale
+            asteroid.rotation = rotation
+            asteroid.rotation_speed = rotation_speed
+            asteroid.inventory.max_units = max_units
+            asteroid.inventory.restore_items({ore_type: ore_quantity})
+        self.asteroid_times[entity_id] = game_time
+
+    def _apply_player(self, entity_id, reader):
+        """
+        Update or create the player from its record
+
+        Returns:
+            tuple: (player, module records) - modules are applied after the frame
+        """
+        (x, y, rotation, velocity_x, velocity_y, health, max_health,
+         max_units, item_count, module_count) = reader.read(_PLAYER_RECORD)
+        player = self.entities.get(entity_id)
+        if player is None:
+            player = PlayerEntity(x, y)
+            player.entity_id = entity_id
+            player.set_game_state(self.game_state)
+            self.game_state.add_entity(player)
+            self.game_state.player_entity = player
+            self.entities[entity_id] = player
+        player.x, player.y = x, y
+        player.rotation = rotation
+        player.velocity_x = velocity_x
+        player.velocity_y = velocity_y
+        player.health = health
+        player.max_health = max_health
+        player.inventory.max_units = max_units
+        player.inventory.restore_items(reader.read_items(item_count))
+        return player, [reader.read(_MODULE_RECORD) for _ in range(module_count)]
+
+    def _apply_modules(self, player, records):
+        """Bring the player's modules in line with the journal"""
+        kinds = [MODULE_KIND_CODES.get(type(module)) for module in player.modules]
+        if kinds != [record[0] for record in records]:
+            # The fitting changed - re-equip from scratch
+            for module in list(player.modules):
+                restore_module_state(module, 0, 0.0, 0.0, None)
+                player.unequip_module(module)
+            for record in records:
+                module_class = MODULE_KINDS.get(record[0])
+                if module_class is None or not player.equip_module(module_class()):
+                    print(f"Warning: Could not restore module kind {record[0]} from journal")
+
+        saved_modules = [module for module in player.modules if type(module) in MODULE_KIND_CODES]
+        for module, (kind, state, cooldown_remaining, active_timer, target_id) in zip(saved_modules, records):
+            target = self.entities.get(target_id) if target_id else None
+            restore_module_state(module, state, cooldown_remaining, active_timer, target)
+
+    def finish(self):
+        """Advance asteroid rotations to the final game time and drop removed entities"""
+        end_time = self.game_state.game_time
+        base_time = self.base_time
+        asteroid_times = self.asteroid_times
+        for entity in self.entities.values():
+            if isinstance(entity, AsteroidEntity):
+                elapsed = end_time - asteroid_times.get(entity.entity_id, base_time)
+                if elapsed:
+                    entity.rotation = (entity.rotation + entity.rotation_speed * elapsed) % 360
+        if self.removed:
+            self.game_state.cleanup_inactive_entities()
+
+
+def replay_journal(path, game_state, generation):
+    """
+    Replay a journal on top of the base save it continues
+
+    Frames after a torn or corrupt frame are ignored - they can only be the
+    result of a crash during the last append. A frame that passes its CRC but
+    can't be decoded also ends the replay, so the state stays at the last
+    frame that could be read.
+
+    Args:
+        path: Path of the journal
+        game_state: Game state loaded from the base save
+        generation: Generation stored in the base save
+
+    Returns:
+        int: Number of frames replayed (0 if there is no journal)
+    """
+    try:
+        with open(path, "rb") as journal_file:
+            data = journal_file.read()
+    except FileNotFoundError:
+        return 0
+
+    if len(data) < _JOURNAL_HEADER.size:
+        return 0
+    magic, version, _, journal_generation = _JOURNAL_HEADER.unpack_from(data, 0)
+    if magic != JOURNAL_MAGIC or version != JOURNAL_FORMAT_VERSION or journal_generation != generation:
+        print(f"Warning: Ignoring journal {path} - it does not belong to this save")
+        return 0
+
+    replay = _JournalReplay(game_state)
+    frames = 0
+    offset = _JOURNAL_HEADER.size
+    with memoryview(data) as view:
+        while offset + _FRAME_HEADER.size <= len(data):
+            length, crc = _FRAME_HEADER.unpack_from(data, offset)
+            start = offset + _FRAME_HEADER.size
+            payload = view[start:start + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                payload.release()
+                print(f"Warning: Journal {path} ends with a damaged frame - it was ignored")
+                break
+            try:
+                replay.apply_frame(payload)
+            except (SaveFormatError, struct.error, KeyError, ValueError) as e:
+                print(f"Warning: Journal {path} has an unreadable frame - replay stopped there: {e}")
+                break
+            finally:
+                payload.release()
+            frames += 1
+            offset = start + length
+
+    replay.finish()
+    game_state.timer_wheel.reset(game_state.game_time, keep_timers=True)
+    # Replayed changes are now part of the loaded state
+    game_state.dirty_entities.clear()
+    return frames
@@ -5,6 +5,8 @@ from blinker import Signal
 #   - asteroid_entity: The asteroid that was mined
 #   - amount: The amount of ore that was mined
 #   - hit_type: The type of hit (normal, critical, super_critical)
+#   - ore_before: Ore the asteroid held before this tick's mining batch
+#     (its inventory already reflects every hit of the batch)
 on_asteroid_mined = Signal('on_asteroid_mined')
 
 # Signal emitted when items are added to an inventory
@@ -19,4 +21,9 @@ on_inventory_item_added = Signal('on_inventory_item_added')
 #   - inventory: The inventory that items were removed from
 #   - item_type: The type of item that was removed
 #   - amount: The amount of items that were removed
-on_inventory_item_removed = Signal('on_inventory_item_removed') 
\ No newline at end of file
+on_inventory_item_removed = Signal('on_inventory_item_removed') 
+
+# Signal emitted when a background save has finished (or failed)
+# Parameters:
+#   - report: AutosaveReport with the snapshot and write timings
+on_game_saved = Signal('on_game_saved')
@@ -2,6 +2,10 @@
 Game State - holds all current game data
 """
 
+from core.timer_wheel import TimerWheel
+from game_state.mining_resolver import MiningResolver
+from game_state.spatial_index import SpatialIndex
+
 
 class GameState:
     """Contains all current game state data"""
@@ -16,14 +20,62 @@ class GameState:
         self.score = 0
         self.game_time = 0.0
         
+        # Scheduled events (module cycles), advanced with game_time
+        self.timer_wheel = TimerWheel(self.game_time)
+        
+        # Mining cycles that ended this tick, resolved together by the StateManager
+        self.mining_resolver = MiningResolver()
+        
+        # Entities changed since the last incremental save
+        self.dirty_entities = set()
+        
+        # Pickable entities by position, and the ones under the mouse / clicked
+        self.spatial_index = SpatialIndex()
+        self.hovered_entity = None
+        self.selected_entity = None
+        
     def add_entity(self, entity):
         """Add an entity to the game state"""
         self.entities.append(entity)
+        self.spatial_index.insert(entity)
+        entity.dirty_set = self.dirty_entities
+        entity.mark_dirty()
+        
+    def track_entities(self, entities, xs, ys, radii):
+        """
+        Enable dirty tracking for pickable entities added without add_entity
+        
+        Args:
+            entities: PICKABLE entities already in self.entities (e.g. bulk-loaded
+                asteroids) - they are added to the spatial index in one pass
+            xs, ys: Columns of their positions
+            radii: Column of their collision radii
+        """
+        dirty_entities = self.dirty_entities
+        for entity in entities:
+            entity.dirty_set = dirty_entities
+        self.spatial_index.insert_many(entities, xs, ys, radii)
+        
+    def take_dirty_entities(self):
+        """
+        Get the entities changed since the last call and clear the dirty set
+        
+        Returns:
+            set: Entities that were added, changed or destroyed
+        """
+        dirty_entities = set(self.dirty_entities)
+        self.dirty_entities.clear()
+        return dirty_entities
         
     def remove_entity(self, entity):
         """Remove an entity from the game state"""
         if entity in self.entities:
             self.entities.remove(entity)
+            self.spatial_index.remove(entity)
+            if self.hovered_entity is entity:
+                self.hovered_entity = None
+            if self.selected_entity is entity:
+                self.selected_entity = None
             
     def get_entities_by_type(self, entity_class):
         """Get all entities of a specific type using isinstance"""
@@ -36,15 +88,49 @@ class GameState:
         
     def cleanup_inactive_entities(self):
         """Remove inactive entities from the game state"""
-        self.entities = [entity for entity in self.entities if entity.is_active()]
+        active_entities = []
+        for entity in self.entities:
+            if entity.is_active():
+                active_entities.append(entity)
+            else:
+                self.spatial_index.remove(entity)
+        self.entities = active_entities
+        self._forget_picks()
         
         # Check if player was destroyed
         if self.player_entity and not self.player_entity.is_active():
             self.player_entity = None
         
+    def pick_entity(self, x, y):
+        """
+        Find the pickable entity at a world position
+
+        Args:
+            x, y: World position (the game has no camera, so screen positions are world positions)
+
+        Returns:
+            The entity, or None
+        """
+        return self.spatial_index.pick(x, y)
+
+    def _forget_picks(self):
+        """Drop the hovered and selected entities once they are gone"""
+        if self.hovered_entity is not None and not self.hovered_entity.is_active():
+            self.hovered_entity = None
+        if self.selected_entity is not None and not self.selected_entity.is_active():
+            self.selected_entity = None
+
     def reset(self):
         """Reset the game state to initial values"""
+        for entity in self.entities:
+            entity.dirty_set = None
         self.entities.clear()
+        self.dirty_entities.clear()
+        self.spatial_index.clear()
+        self.hovered_entity = None
+        self.selected_entity = None
         self.player_entity = None
         self.score = 0
-        self.game_time = 0.0 
\ No newline at end of file
+        self.game_time = 0.0
+        self.timer_wheel.reset(self.game_time)
+        self.mining_resolver.clear()
\ No newline at end of file
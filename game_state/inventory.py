@@ -9,17 +9,35 @@ from .inventory_types import InventoryType
 class Inventory:
     """Represents an inventory location that can store items"""
     
-    def __init__(self, max_units: int):
+    def __init__(self, max_units: int, owner=None):
         """
         Initialize an inventory
         
         Args:
             max_units: Maximum number of units this inventory can hold
+            owner: Entity holding this inventory - it is marked dirty whenever
+                the contents change
         """
         self.max_units = max_units
+        self.owner = owner
         self.items: Dict[InventoryType, int] = {}  # type -> quantity
-        self.on_items_added = Signal('on_items_added')
-        self.on_items_removed = Signal('on_items_removed')
+        # Signals are created on first use - most inventories (asteroids) never get listeners
+        self._on_items_added: Optional[Signal] = None
+        self._on_items_removed: Optional[Signal] = None
+    
+    @property
+    def on_items_added(self) -> Signal:
+        """Signal emitted after items are added to this inventory"""
+        if self._on_items_added is None:
+            self._on_items_added = Signal('on_items_added')
+        return self._on_items_added
+    
+    @property
+    def on_items_removed(self) -> Signal:
+        """Signal emitted after items are removed from this inventory"""
+        if self._on_items_removed is None:
+            self._on_items_removed = Signal('on_items_removed')
+        return self._on_items_removed
     
     def get_total_units(self) -> int:
         """Get the total number of units in the inventory"""
@@ -48,9 +66,12 @@ class Inventory:
             return False
             
         self.items[item_type] = self.items.get(item_type, 0) + quantity
+        if self.owner is not None:
+            self.owner.mark_dirty()
         
         # Emit signal
-        self.on_items_added.send(self, item_type=item_type, quantity=quantity)
+        if self._on_items_added is not None:
+            self._on_items_added.send(self, item_type=item_type, quantity=quantity)
         
         return True
     
@@ -65,7 +86,10 @@ class Inventory:
         self.items[item_type] -= amount
         if self.items[item_type] <= 0:
             del self.items[item_type]
-        self.on_items_removed.send(self, item_type=item_type, quantity=amount)
+        if self.owner is not None:
+            self.owner.mark_dirty()
+        if self._on_items_removed is not None:
+            self._on_items_removed.send(self, item_type=item_type, quantity=amount)
         return True
     
     def get_item_quantity(self, item_type: InventoryType) -> int:
@@ -76,6 +100,20 @@ class Inventory:
         """Get a copy of all items in the inventory"""
         return self.items.copy()
 
+    def restore_items(self, items: Dict[InventoryType, int]):
+        """
+        Replace the inventory contents without emitting signals
+
+        Used when loading a saved game, where listeners must not react to
+        items that were already there when the game was saved.
+
+        Args:
+            items: Mapping of item type to quantity
+        """
+        self.items = {item_type: quantity for item_type, quantity in items.items() if quantity > 0}
+        if self.owner is not None:
+            self.owner.mark_dirty()
+
 
 class InventoryManager:
     """Manages inventories and transfers between them"""
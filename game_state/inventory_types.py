@@ -3,6 +3,7 @@ Inventory Types - defines all possible inventory item types in the game
 """
 
 from enum import Enum, auto
+from itertools import accumulate
 from typing import Dict, List, Tuple
 
 class InventoryType(Enum):
@@ -102,37 +103,33 @@ ORE_MINERAL_RATES: Dict[InventoryType, Dict[InventoryType, float]] = {
 }
 
 class HitType(Enum):
-    """Enum representing different types of mining hits"""
+    """
+    Enum representing different types of mining hits
+
+    Every member has these attributes, filled in from the lookup tables below:
+        multiplier: The ore multiplier for this hit type
+        chance: The base chance for this hit type
+        name_display: The display name for this hit type
+    """
     NORMAL = auto()
     CRITICAL = auto()
     SUPER_CRITICAL = auto()
 
-    @property
-    def multiplier(self) -> float:
-        """Get the ore multiplier for this hit type"""
-        if self == HitType.NORMAL:
-            return 1.0
-        elif self == HitType.CRITICAL:
-            return 1.25
-        elif self == HitType.SUPER_CRITICAL:
-            return 1.5
 
-    @property
-    def chance(self) -> float:
-        """Get the base chance for this hit type"""
-        if self == HitType.NORMAL:
-            return 0.50  # 70%
-        elif self == HitType.CRITICAL:
-            return 0.35  # 25%
-        elif self == HitType.SUPER_CRITICAL:
-            return 0.15  # 5%
+# Per-HitType lookup tables, indexed by HitType.value (index 0 is unused)
+HIT_MULTIPLIERS = (0.0, 1.0, 1.25, 1.5)
+HIT_CHANCES = (0.0, 0.50, 0.35, 0.15)
+HIT_DISPLAY_NAMES = ("", "normal", "critical", "super_critical")
+
+# Plain attributes on the members - reading them is a single attribute lookup, not a property call
+for _hit_type in HitType:
+    _hit_type.multiplier = HIT_MULTIPLIERS[_hit_type.value]
+    _hit_type.chance = HIT_CHANCES[_hit_type.value]
+    _hit_type.name_display = HIT_DISPLAY_NAMES[_hit_type.value]
+del _hit_type
 
-    @property
-    def name_display(self) -> str:
-        """Get the display name for this hit type"""
-        if self == HitType.NORMAL:
-            return "normal"
-        elif self == HitType.CRITICAL:
-            return "critical"
-        elif self == HitType.SUPER_CRITICAL:
-            return "super_critical"
+# Rolls are checked super critical first, then critical, otherwise normal
+# (see roll_hit_types in mining_resolver.py).
+# HIT_ROLL_THRESHOLDS[i] is the cumulative chance up to and including HIT_ROLL_ORDER[i].
+HIT_ROLL_ORDER = (HitType.SUPER_CRITICAL, HitType.CRITICAL, HitType.NORMAL)
+HIT_ROLL_THRESHOLDS = tuple(accumulate(hit_type.chance for hit_type in HIT_ROLL_ORDER))
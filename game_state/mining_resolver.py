@@ -0,0 +1,259 @@
+"""
+Mining Resolver - resolves every mining laser cycle that completes in a tick in one batch
+
+Mining lasers submit their finished cycle here instead of mining on their
+own. Once per tick the StateManager resolves the whole batch with NumPy:
+    - hit types are rolled for every laser at once
+    - lasers on the same asteroid take their ore one after the other, in the
+      order their cycles ended, so later lasers see what the earlier ones left;
+      this runs in rounds, each taking at most one laser per asteroid
+    - cargo space is shared by all lasers of a ship, round by round and in
+      the order the cycles ended within a round; as in a single laser cycle,
+      a hit is capped to the free cargo space first and then fails if that
+      is still more ore than the asteroid has left
+    - each asteroid and each ship inventory is changed once, then the
+      on_asteroid_mined events are sent, each with the asteroid's ore from
+      before the batch
+
+The work per tick is a handful of array operations per laser sharing an
+asteroid, not per laser, so fleets with thousands of lasers resolve in one pass.
+"""
+
+import random
+
+import numpy as np
+
+from game_state.inventory_types import HIT_ROLL_ORDER, HIT_ROLL_THRESHOLDS
+from game_state.game_events import on_asteroid_mined
+
+# Hit types in the order they are rolled: super critical first, then critical, otherwise normal
+HIT_ORDER = HIT_ROLL_ORDER
+_HIT_THRESHOLDS = np.array(HIT_ROLL_THRESHOLDS[:-1])
+_HIT_MULTIPLIERS = np.array([hit_type.multiplier for hit_type in HIT_ORDER])
+
+
+def roll_hit_types(rolls):
+    """
+    Turn uniform rolls into hit types
+
+    Args:
+        rolls: Array of rolls in [0, 1)
+
+    Returns:
+        tuple: (index into HIT_ORDER, multiplier) arrays
+    """
+    hit_indices = np.searchsorted(_HIT_THRESHOLDS, rolls, side="right")
+    return hit_indices, _HIT_MULTIPLIERS[hit_indices]
+
+
+def mining_amounts(remaining_ore, ore_per_cycle, multipliers):
+    """
+    Ore each hit asks for, before cargo space is considered
+
+    A hit asks for int(min(ore_per_cycle, remaining ore) * multiplier), and
+    for nothing from a depleted asteroid. Critical hits can ask for more than
+    is left - see take_ore.
+
+    Args:
+        remaining_ore: Ore left in the targeted asteroids
+        ore_per_cycle: Base ore per cycle of the lasers
+        multipliers: Hit multipliers
+
+    Returns:
+        numpy.ndarray: Ore taken per hit
+    """
+    amounts = (np.minimum(ore_per_cycle, remaining_ore) * multipliers).astype(np.int64)
+    return np.where(remaining_ore > 0, amounts, 0)
+
+
+def take_ore(capped_amounts, remaining_ore):
+    """
+    Ore actually taken by hits already capped to cargo space
+
+    A hit that is more ore than the asteroid has left takes nothing.
+
+    Args:
+        capped_amounts: Ore per hit, capped to the free cargo space
+        remaining_ore: Ore left in the targeted asteroids
+
+    Returns:
+        numpy.ndarray: Ore taken per hit
+    """
+    return np.where(capped_amounts <= remaining_ore, capped_amounts, 0)
+
+
+def allocate_cargo(ship_indices, requested, available_space):
+    """
+    Share cargo space between hits, in order
+
+    Each hit gets as much of its request as still fits in its ship, after
+    the hits before it. Ships are grouped with a stable sort and the space
+    used so far comes from a cumulative sum per group.
+
+    Args:
+        ship_indices: Ship of each hit
+        requested: Ore each hit wants to store
+        available_space: Free cargo space per ship
+
+    Returns:
+        numpy.ndarray: Ore stored per hit
+    """
+    order = np.argsort(ship_indices, kind="stable")
+    ships = ship_indices[order]
+    wanted = requested[order]
+    totals = np.cumsum(wanted)
+    group_starts = np.ones(len(ships), dtype=bool)
+    group_starts[1:] = ships[1:] != ships[:-1]
+    # Totals only grow, so the last group start carries forward with a running maximum
+    offsets = np.maximum.accumulate(np.where(group_starts, totals - wanted, 0))
+    used_after = totals - offsets
+    space = np.maximum(available_space[ships], 0)
+    allocated = np.empty_like(wanted)
+    allocated[order] = np.minimum(used_after, space) - np.minimum(used_after - wanted, space)
+    return allocated
+
+
+class MiningResolver:
+    """Collects finished mining cycles and resolves them together"""
+
+    def __init__(self):
+        """Initialize an empty batch"""
+        self.pending = []  # (module, ship_entity, asteroid) per finished cycle
+
+    def submit(self, module, ship_entity, asteroid):
+        """
+        Queue a finished mining cycle for the next resolve()
+
+        Args:
+            module: The mining laser whose cycle ended
+            ship_entity: The ship the laser is fitted to
+            asteroid: The targeted asteroid
+        """
+        self.pending.append((module, ship_entity, asteroid))
+
+    def clear(self):
+        """Drop the queued cycles (used when the game state is replaced)"""
+        self.pending = []
+
+    def resolve(self):
+        """
+        Mine ore for every queued cycle
+
+        Returns:
+            int: Total ore mined
+        """
+        if not self.pending:
+            return 0
+        requests = self.pending
+        self.pending = []
+        count = len(requests)
+
+        # Number the asteroids and ships involved in this batch
+        asteroid_numbers = {}
+        ship_numbers = {}
+        asteroids = []
+        ships = []
+        asteroid_indices = np.empty(count, dtype=np.int64)
+        ship_indices = np.empty(count, dtype=np.int64)
+        ore_per_cycle = np.empty(count, dtype=np.int64)
+        for i, (module, ship_entity, asteroid) in enumerate(requests):
+            asteroid_index = asteroid_numbers.get(id(asteroid))
+            if asteroid_index is None:
+                asteroid_index = asteroid_numbers[id(asteroid)] = len(asteroids)
+                asteroids.append(asteroid)
+            ship_index = ship_numbers.get(id(ship_entity))
+            if ship_index is None:
+                ship_index = ship_numbers[id(ship_entity)] = len(ships)
+                ships.append(ship_entity)
+            asteroid_indices[i] = asteroid_index
+            ship_indices[i] = ship_index
+            ore_per_cycle[i] = module.ore_per_cycle
+
+        initial_ore = np.array([asteroid.inventory.get_item_quantity(asteroid.ore_type) for asteroid in asteroids],
+                               dtype=np.int64)
+        remaining_ore = initial_ore.copy()
+        available_space = np.array([ship.inventory.get_available_space() for ship in ships], dtype=np.int64)
+
+        # Rolls come from the random module, whose state is saved with the game
+        rolls = np.fromiter((random.random() for _ in range(count)), dtype=np.float64, count=count)
+        hit_indices, multipliers = roll_hit_types(rolls)
+
+        # Rank of each cycle among those on the same asteroid - rank r runs in round r
+        order = np.argsort(asteroid_indices, kind="stable")
+        sorted_asteroids = asteroid_indices[order]
+        group_starts = np.ones(count, dtype=bool)
+        group_starts[1:] = sorted_asteroids[1:] != sorted_asteroids[:-1]
+        positions = np.arange(count)
+        ranks = np.empty(count, dtype=np.int64)
+        ranks[order] = positions - np.maximum.accumulate(np.where(group_starts, positions, 0))
+
+        mined = np.zeros(count, dtype=np.int64)
+        cargo_full = np.zeros(count, dtype=bool)
+        for rank in range(int(ranks.max()) + 1):
+            # At most one cycle per asteroid in a round
+            selected = np.flatnonzero(ranks == rank)
+            targets = asteroid_indices[selected]
+            round_ships = ship_indices[selected]
+            round_ore = remaining_ore[targets]
+            amounts = mining_amounts(round_ore, ore_per_cycle[selected], multipliers[selected])
+
+            # Cap to cargo space, then drop hits that are more than the asteroid has left.
+            # A dropped hit frees its space for later hits of the ship, which can make
+            # them fail too (never succeed), so repeat until nothing else fails.
+            requested = amounts
+            while True:
+                capped = allocate_cargo(round_ships, requested, available_space)
+                stored = take_ore(capped, round_ore)
+                failed = stored != capped
+                if not failed.any():
+                    break
+                requested = np.where(failed, 0, requested)
+            mined[selected] = stored
+            cargo_full[selected] = (amounts > 0) & (requested > 0) & (stored == 0)
+            remaining_ore[targets] -= stored
+            available_space -= np.bincount(round_ships, weights=stored,
+                                           minlength=len(ships)).astype(np.int64)
+
+        self._apply(requests, asteroids, ships, asteroid_indices, ship_indices,
+                    initial_ore, initial_ore - remaining_ore, mined, hit_indices, cargo_full)
+        return int(mined.sum())
+
+    def _apply(self, requests, asteroids, ships, asteroid_indices, ship_indices,
+               initial_ore, taken, mined, hit_indices, cargo_full):
+        """Write the results of a batch to the inventories, then send events and feedback"""
+        for asteroid, amount in zip(asteroids, taken.tolist()):
+            if amount > 0:
+                asteroid.inventory.remove_item(asteroid.ore_type, amount)
+
+        # One add per ship and ore type
+        ore_types = []
+        ore_numbers = {}
+        asteroid_ores = np.empty(len(asteroids), dtype=np.int64)
+        for i, asteroid in enumerate(asteroids):
+            if asteroid.ore_type not in ore_numbers:
+                ore_numbers[asteroid.ore_type] = len(ore_types)
+                ore_types.append(asteroid.ore_type)
+            asteroid_ores[i] = ore_numbers[asteroid.ore_type]
+        keys = ship_indices * len(ore_types) + asteroid_ores[asteroid_indices]
+        stored = np.bincount(keys, weights=mined, minlength=len(ships) * len(ore_types)).astype(np.int64)
+        for key in np.flatnonzero(stored):
+            ship_index, ore_index = divmod(int(key), len(ore_types))
+            ships[ship_index].inventory.add_item(ore_types[ore_index], int(stored[key]))
+
+        # The asteroids were already changed for the whole batch, so every event
+        # carries the ore from before it - several lasers may hit one asteroid
+        successful = np.flatnonzero(mined)
+        for i in successful.tolist():
+            asteroid_index = asteroid_indices[i]
+            on_asteroid_mined.send(asteroids[asteroid_index], amount=int(mined[i]),
+                                   hit_type=HIT_ORDER[hit_indices[i]], ore_before=int(initial_ore[asteroid_index]))
+
+        # Feedback once per ship: its best hit, or a full cargo hold
+        feedback = {}
+        for i in successful[np.argsort(hit_indices[successful], kind="stable")].tolist():
+            feedback.setdefault(int(ship_indices[i]), i)
+        for i in np.flatnonzero(cargo_full).tolist():
+            feedback.setdefault(int(ship_indices[i]), i)
+        for i in feedback.values():
+            module, ship_entity, asteroid = requests[i]
+            module.on_mining_resolved(ship_entity, asteroid.ore_type, int(mined[i]), HIT_ORDER[hit_indices[i]])
@@ -0,0 +1,689 @@
+"""
+Save Game - compact binary save/load of the full game state
+
+The save file is a small header, a section table and a list of sections.
+Bulk data (asteroids, inventories, modules) is stored as struct-packed
+columns, so loading maps the file and casts each column in place instead
+of parsing records one by one.
+
+Decoding is not where a load spends its time: with 100k asteroids the
+columns decode in about 25 ms, while building one Python entity per asteroid
+takes a few hundred. The asteroids are indexed for picking from the columns
+in one pass (SpatialIndex.insert_many), so that step adds little on top.
+
+File layout (all values little-endian):
+    header:         magic (4s), version (H), section count (H), reserved (I)
+    section table:  tag (4s), offset (I), length (I) - one per section
+    sections:       8-byte aligned, unknown tags are skipped by the loader
+
+Version 2 adds entity ids and the journal generation (see change_journal),
+and stores module targets as entity ids. Version 1 saves still load, with
+fresh entity ids.
+"""
+
+import gc
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+
+from entities.asteroid_entity import AsteroidEntity, get_base_radius
+from entities.base_entity import BaseEntity
+from entities.base_module import ModuleState
+from entities.mining_laser_module import MiningLaserModule
+from entities.mobile_depot import MobileDepot
+from entities.player_entity import PlayerEntity
+from game_state.game_state import GameState
+from game_state.inventory_types import InventoryType
+
+# Save format constants
+SAVE_MAGIC = b"VSGS"
+SAVE_FORMAT_VERSION = 2
+SECTION_ALIGNMENT = 8
+
+_HEADER = struct.Struct("<4sHHI")
+_SECTION_ENTRY = struct.Struct("<4sII")
+_META = struct.Struct("<dqI")               # game_time, score, journal generation
+_META_V1 = struct.Struct("<dq")             # game_time, score
+_RNG_HEADER = struct.Struct("<IId")         # version, has_gauss, gauss_next
+_PLAYER = struct.Struct("<II7dI")           # present, entity_id, x, y, rotation, vx, vy, health, max_health, max_units
+_PLAYER_V1 = struct.Struct("<I7dI")         # present, x, y, rotation, vx, vy, health, max_health, max_units
+_COUNT = struct.Struct("<I")
+
+# Section tags
+SECTION_META = b"META"
+SECTION_RNG = b"RNG "
+SECTION_PLAYER = b"PLYR"
+SECTION_DEPOTS = b"DEPO"
+SECTION_ASTEROIDS = b"ASTR"
+SECTION_INVENTORIES = b"INVT"
+SECTION_MODULES = b"MODS"
+
+# Inventory owners in the INVT section
+OWNER_PLAYER = 0
+OWNER_DEPOT = 1
+
+# Asteroid columns in file order: (name, array typecode)
+# 4-byte columns come first so every column stays naturally aligned
+ASTEROID_COLUMNS = (
+    ("entity_id", "I"),
+    ("x", "f"),
+    ("y", "f"),
+    ("scale", "f"),
+    ("rotation", "f"),
+    ("rotation_speed", "f"),
+    ("ore_quantity", "I"),
+    ("max_units", "I"),
+    ("asteroid_type", "B"),
+    ("ore_type", "B"),
+)
+
+ASTEROID_COLUMNS_V1 = ASTEROID_COLUMNS[1:]
+
+DEPOT_COLUMNS = (
+    ("x", "d"),
+    ("y", "d"),
+    ("entity_id", "I"),
+    ("max_units", "I"),
+)
+
+DEPOT_COLUMNS_V1 = (
+    ("x", "d"),
+    ("y", "d"),
+    ("max_units", "I"),
+)
+
+INVENTORY_COLUMNS = (
+    ("owner_index", "I"),
+    ("quantity", "I"),
+    ("owner_kind", "B"),
+    ("item_type", "B"),
+)
+
+MODULE_COLUMNS = (
+    ("cooldown_remaining", "f"),
+    ("active_timer", "f"),
+    ("target_id", "I"),         # Entity id of the target, 0 for none
+    ("kind", "B"),
+    ("state", "B"),
+)
+
+MODULE_COLUMNS_V1 = (
+    ("cooldown_remaining", "f"),
+    ("active_timer", "f"),
+    ("target_index", "i"),      # Index into the asteroid columns, -1 for none
+    ("kind", "B"),
+    ("state", "B"),
+)
+
+# Module classes that can be saved, keyed by their on-disk code
+MODULE_KINDS = {
+    1: MiningLaserModule,
+}
+MODULE_KIND_CODES = {module_class: code for code, module_class in MODULE_KINDS.items()}
+
+# ModuleState values are the on-disk codes
+MODULE_STATE_CODES = {state: int(state) for state in ModuleState}
+MODULE_STATES = {code: state for state, code in MODULE_STATE_CODES.items()}
+
+INVENTORY_TYPES = {item_type.value: item_type for item_type in InventoryType}
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class SaveFormatError(Exception):
+    """Raised when a save file is not a valid save of a supported version"""
+    pass
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Pause the cyclic garbage collector
+
+    Saving and loading allocate one object per entity. With a large world the
+    collector would otherwise run many full passes over objects that are all
+    still alive.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _new_columns(columns):
+    """Create an empty array for each (name, typecode) column"""
+    return {name: array(typecode) for name, typecode in columns}
+
+
+def _pack_columns(columns, spec):
+    """Pack column arrays in file order as little-endian bytes"""
+    parts = [_COUNT.pack(len(columns[spec[0][0]]))]
+    for name, _ in spec:
+        column = columns[name]
+        if not _LITTLE_ENDIAN:
+            column = array(column.typecode, column)
+            column.byteswap()
+        parts.append(column.tobytes())
+    return b"".join(parts)
+
+
+def _unpack_columns(view, spec):
+    """
+    Read columns packed by _pack_columns
+
+    Args:
+        view: memoryview over the section bytes
+        spec: Column spec the section was written with
+
+    Returns:
+        tuple: (row count, dict of column name -> list of values)
+    """
+    count = _COUNT.unpack_from(view, 0)[0]
+    offset = _COUNT.size
+    columns = {}
+    for name, typecode in spec:
+        size = array(typecode).itemsize * count
+        raw = view[offset:offset + size]
+        if len(raw) != size:
+            raise SaveFormatError(f"Truncated column: {name}")
+        if _LITTLE_ENDIAN:
+            # Zero-copy: reinterpret the mapped bytes as the column type
+            with raw.cast(typecode) as column:
+                columns[name] = column.tolist()
+        else:
+            column = array(typecode, raw.tobytes())
+            column.byteswap()
+            columns[name] = column.tolist()
+        raw.release()
+        offset += size
+    return count, columns
+
+
+class GameSnapshot:
+    """Column-oriented copy of everything needed to rebuild a GameState"""
+
+    def __init__(self):
+        """Initialize an empty snapshot"""
+        self.game_time = 0.0
+        self.score = 0
+        self.generation = 0  # Journal generation that continues this snapshot, 0 for none
+        self.rng_state = random.getstate()
+        self.player = None  # Tuple of player values, or None if there is no player
+        self.depots = _new_columns(DEPOT_COLUMNS)
+        self.asteroids = _new_columns(ASTEROID_COLUMNS)
+        self.inventories = _new_columns(INVENTORY_COLUMNS)
+        self.modules = _new_columns(MODULE_COLUMNS)
+
+    def capture_asteroids(self, asteroids, elapsed=0.0, ore_before=None):
+        """
+        Append asteroid rows to the snapshot columns
+
+        Args:
+            asteroids: Sequence of AsteroidEntity to capture, in save order
+            elapsed: Game time since the snapshot was started. Rotation is
+                rewound by this much so late rows still match the start tick.
+            ore_before: Optional dict of asteroid -> ore quantity to save instead
+                of the current one, for asteroids mined after the snapshot started
+        """
+        columns = self.asteroids
+        columns["entity_id"].extend([asteroid.entity_id for asteroid in asteroids])
+        columns["x"].extend([asteroid.x for asteroid in asteroids])
+        columns["y"].extend([asteroid.y for asteroid in asteroids])
+        columns["scale"].extend([asteroid.scale for asteroid in asteroids])
+        if elapsed:
+            columns["rotation"].extend([(asteroid.rotation - asteroid.rotation_speed * elapsed) % 360 for asteroid in asteroids])
+        else:
+            columns["rotation"].extend([asteroid.rotation for asteroid in asteroids])
+        columns["rotation_speed"].extend([asteroid.rotation_speed for asteroid in asteroids])
+        # Asteroid inventories only ever hold their own ore type
+        ore_quantities = [sum(asteroid.inventory.items.values()) for asteroid in asteroids]
+        if ore_before:
+            for index, asteroid in enumerate(asteroids):
+                if asteroid in ore_before:
+                    ore_quantities[index] = ore_before[asteroid]
+        columns["ore_quantity"].extend(ore_quantities)
+        columns["max_units"].extend([asteroid.inventory.max_units for asteroid in asteroids])
+        columns["asteroid_type"].extend([asteroid.asteroid_type for asteroid in asteroids])
+        columns["ore_type"].extend([asteroid.ore_type.value for asteroid in asteroids])
+
+    def capture_inventory(self, owner_kind, owner_index, inventory):
+        """Append every item stack of an inventory to the inventory columns"""
+        for item_type, quantity in inventory.items.items():
+            self.inventories["owner_kind"].append(owner_kind)
+            self.inventories["owner_index"].append(owner_index)
+            self.inventories["item_type"].append(item_type.value)
+            self.inventories["quantity"].append(quantity)
+
+    def capture_player(self, player):
+        """
+        Capture the player ship, its inventory and its modules
+
+        Args:
+            player: PlayerEntity to capture
+        """
+        self.player = (
+            player.entity_id,
+            player.x, player.y, player.rotation,
+            player.velocity_x, player.velocity_y,
+            player.health, player.max_health,
+            player.inventory.max_units,
+        )
+        self.capture_inventory(OWNER_PLAYER, 0, player.inventory)
+
+        for module in player.modules:
+            kind = MODULE_KIND_CODES.get(type(module))
+            if kind is None:
+                print(f"Warning: Module type {type(module).__name__} cannot be saved")
+                continue
+            self.modules["kind"].append(kind)
+            self.modules["state"].append(MODULE_STATE_CODES.get(module.state, 0))
+            self.modules["cooldown_remaining"].append(module.cooldown_remaining)
+            self.modules["active_timer"].append(getattr(module, "active_timer", 0.0))
+            target = getattr(module, "current_target", None)
+            self.modules["target_id"].append(target.entity_id if target is not None else 0)
+
+    def capture_depot(self, depot):
+        """Capture a mobile depot and its inventory"""
+        self.capture_inventory(OWNER_DEPOT, len(self.depots["x"]), depot.inventory)
+        self.depots["x"].append(depot.x)
+        self.depots["y"].append(depot.y)
+        self.depots["entity_id"].append(depot.entity_id)
+        self.depots["max_units"].append(depot.inventory.max_units)
+
+    def to_bytes(self):
+        """Encode the snapshot in the binary save format"""
+        version, internal_state, gauss_next = self.rng_state
+        rng_words = array("I", internal_state)
+        if not _LITTLE_ENDIAN:
+            rng_words.byteswap()
+
+        player_present = self.player is not None
+        player = self.player if player_present else (0,) + (0.0,) * 7 + (0,)
+
+        sections = [
+            (SECTION_META, _META.pack(self.game_time, self.score, self.generation)),
+            (SECTION_RNG, _RNG_HEADER.pack(version, gauss_next is not None, gauss_next or 0.0) + rng_words.tobytes()),
+            (SECTION_PLAYER, _PLAYER.pack(player_present, *player)),
+            (SECTION_DEPOTS, _pack_columns(self.depots, DEPOT_COLUMNS)),
+            (SECTION_ASTEROIDS, _pack_columns(self.asteroids, ASTEROID_COLUMNS)),
+            (SECTION_INVENTORIES, _pack_columns(self.inventories, INVENTORY_COLUMNS)),
+            (SECTION_MODULES, _pack_columns(self.modules, MODULE_COLUMNS)),
+        ]
+
+        offset = _HEADER.size + _SECTION_ENTRY.size * len(sections)
+        table = []
+        body = []
+        for tag, data in sections:
+            padding = -offset % SECTION_ALIGNMENT
+            body.append(b"\0" * padding)
+            offset += padding
+            table.append(_SECTION_ENTRY.pack(tag, offset, len(data)))
+            body.append(data)
+            offset += len(data)
+
+        header = _HEADER.pack(SAVE_MAGIC, SAVE_FORMAT_VERSION, len(sections), 0)
+        return b"".join([header, *table, *body])
+
+
+def capture_snapshot(game_state: GameState) -> GameSnapshot:
+    """
+    Capture a snapshot of the game state
+
+    Args:
+        game_state: The game state to capture
+
+    Returns:
+        GameSnapshot: Snapshot that can be written with write_snapshot
+    """
+    snapshot = GameSnapshot()
+    snapshot.game_time = game_state.game_time
+    snapshot.score = game_state.score
+    snapshot.rng_state = random.getstate()
+
+    with _gc_paused():
+        asteroids = [entity for entity in game_state.entities if entity.active and isinstance(entity, AsteroidEntity)]
+        snapshot.capture_asteroids(asteroids)
+
+    for entity in game_state.entities:
+        if isinstance(entity, MobileDepot) and entity.active:
+            snapshot.capture_depot(entity)
+
+    player = game_state.player_entity
+    if player and player.active:
+        snapshot.capture_player(player)
+
+    return snapshot
+
+
+def write_snapshot(snapshot: GameSnapshot, path):
+    """
+    Write a snapshot to disk
+
+    The file is written next to the target and renamed over it, so an
+    interrupted save never leaves a half-written file behind.
+
+    Returns:
+        int: Size of the written file in bytes
+    """
+    data = snapshot.to_bytes()
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as save_file:
+        save_file.write(data)
+        save_file.flush()
+        os.fsync(save_file.fileno())
+    os.replace(temp_path, path)
+    return len(data)
+
+
+def save_game(game_state: GameState, path):
+    """
+    Save the full game state to a file
+
+    Args:
+        game_state: The game state to save
+        path: Path of the save file
+    """
+    write_snapshot(capture_snapshot(game_state), path)
+
+
+def read_save_generation(path):
+    """
+    Read the journal generation of a save without loading it
+
+    Args:
+        path: Path of the save file
+
+    Returns:
+        int: Journal generation, or 0 if the file is missing, invalid or has none
+    """
+    try:
+        with open(path, "rb") as save_file:
+            magic, version, section_count, _ = _HEADER.unpack(save_file.read(_HEADER.size))
+            if magic != SAVE_MAGIC or version < 2:
+                return 0
+            for _ in range(section_count):
+                tag, offset, length = _SECTION_ENTRY.unpack(save_file.read(_SECTION_ENTRY.size))
+                if tag == SECTION_META:
+                    save_file.seek(offset)
+                    return _META.unpack(save_file.read(_META.size))[2]
+    except (OSError, struct.error):
+        pass
+    return 0
+
+
+def _read_sections(view):
+    """
+    Validate the header and section table
+
+    Returns:
+        tuple: (format version, dict of section tag -> memoryview slice).
+            The caller must release the slices.
+    """
+    if len(view) < _HEADER.size:
+        raise SaveFormatError("File is too small to be a save")
+
+    magic, version, section_count, _ = _HEADER.unpack_from(view, 0)
+    if magic != SAVE_MAGIC:
+        raise SaveFormatError("Not a save file")
+    if version > SAVE_FORMAT_VERSION:
+        raise SaveFormatError(f"Save version {version} is newer than supported version {SAVE_FORMAT_VERSION}")
+
+    if _HEADER.size + section_count * _SECTION_ENTRY.size > len(view):
+        raise SaveFormatError("Section table extends past the end of the file")
+
+    entries = [
+        _SECTION_ENTRY.unpack_from(view, _HEADER.size + index * _SECTION_ENTRY.size)
+        for index in range(section_count)
+    ]
+    for tag, offset, length in entries:
+        if offset + length > len(view):
+            raise SaveFormatError(f"Section {tag!r} extends past the end of the file")
+    return version, {tag: view[offset:offset + length] for tag, offset, length in entries}
+
+
+def _decode_rng(view):
+    """Decode the global random number generator state"""
+    version, has_gauss, gauss_next = _RNG_HEADER.unpack_from(view, 0)
+    words = array("I", view[_RNG_HEADER.size:].tobytes())
+    if not _LITTLE_ENDIAN:
+        words.byteswap()
+    return version, tuple(words), gauss_next if has_gauss else None
+
+
+def _restore_asteroids(game_state, count, columns):
+    """Rebuild asteroid entities from the decoded asteroid columns"""
+    if "entity_id" not in columns:
+        columns["entity_id"] = [BaseEntity.new_entity_id() for _ in range(count)]
+    base_radii = {asteroid_type: get_base_radius(asteroid_type) for asteroid_type in set(columns["asteroid_type"])}
+    radii = [base_radii[asteroid_type] * scale
+             for asteroid_type, scale in zip(columns["asteroid_type"], columns["scale"])]
+    restore = AsteroidEntity.restore
+    asteroids = [
+        restore(entity_id, x, y, asteroid_type, scale, rotation, rotation_speed, ore_type, ore_quantity, max_units,
+                radius)
+        for entity_id, x, y, asteroid_type, scale, rotation, rotation_speed, ore_type, ore_quantity, max_units,
+        radius in zip(
+            columns["entity_id"], columns["x"], columns["y"], columns["asteroid_type"], columns["scale"],
+            columns["rotation"], columns["rotation_speed"], columns["ore_type"],
+            columns["ore_quantity"], columns["max_units"], radii,
+        )
+    ]
+    game_state.entities.extend(asteroids)
+    game_state.track_entities(asteroids, columns["x"], columns["y"], radii)
+    return asteroids
+
+
+def restore_module_state(module, state_code, cooldown_remaining, active_timer, target):
+    """
+    Restore the cycle state of an equipped module
+
+    The module's ship must be in a game state whose timer wheel is at the
+    saved game time, so the end of the phase is scheduled at the right time.
+
+    Args:
+        module: The module to restore
+        state_code: Saved state code (see MODULE_STATE_CODES)
+        cooldown_remaining: Saved cooldown time left
+        active_timer: Saved time spent in the active state
+        target: Entity the module was targeting, or None
+    """
+    previous_target = getattr(module, "current_target", None)
+    if previous_target is not None and previous_target is not target:
+        previous_target.stop_mining()
+
+    state = MODULE_STATES.get(state_code, ModuleState.READY)
+    if state == ModuleState.ACTIVE:
+        module.restore_cycle(state, module.CYCLE_ACTIVE_TIME - active_timer)
+    else:
+        module.restore_cycle(state, cooldown_remaining)
+    module.current_target = None
+    if module.state == ModuleState.ACTIVE and target is not None:
+        module.current_target = target
+        target.start_mining(module)
+
+
+def _restore_modules(player, count, columns, asteroids):
+    """Re-equip the player's modules from the decoded module columns and restore their cycle state"""
+    if "target_id" in columns:
+        asteroids_by_id = {asteroid.entity_id: asteroid for asteroid in asteroids}
+        targets = [asteroids_by_id.get(target_id) for target_id in columns["target_id"]]
+    else:
+        targets = [asteroids[target_index] if 0 <= target_index < len(asteroids) else None
+                   for target_index in columns["target_index"]]
+
+    for index in range(count):
+        module_class = MODULE_KINDS.get(columns["kind"][index])
+        if module_class is None:
+            print(f"Warning: Unknown module kind {columns['kind'][index]} in save")
+            continue
+
+        module = module_class()
+        if not player.equip_module(module):
+            continue
+        restore_module_state(module, columns["state"][index], columns["cooldown_remaining"][index],
+                             columns["active_timer"][index], targets[index])
+
+
+def _decode_save(view):
+    """
+    Decode every section of a mapped save into plain values
+
+    Nothing in the game is touched, so a broken save is rejected before the
+    current game state is reset.
+
+    Args:
+        view: memoryview over the whole file
+
+    Returns:
+        dict: Decoded sections - "version", "meta", "rng", "player" and
+            (count, columns) pairs for "depots", "asteroids" and "modules"
+            (None when the section is absent), plus "inventories"
+            ({(owner_kind, owner_index): items})
+
+    Raises:
+        SaveFormatError: If the file is not a valid save
+    """
+    version, sections = _read_sections(view)
+    try:
+        for tag in (SECTION_META, SECTION_RNG, SECTION_PLAYER, SECTION_ASTEROIDS):
+            if tag not in sections:
+                raise SaveFormatError(f"Missing section {tag!r}")
+
+        decoded = {"version": version}
+        if version >= 2:
+            decoded["meta"] = _META.unpack_from(sections[SECTION_META], 0)
+            decoded["player"] = _PLAYER.unpack_from(sections[SECTION_PLAYER], 0)
+        else:
+            decoded["meta"] = _META_V1.unpack_from(sections[SECTION_META], 0) + (0,)
+            # No entity id in version 1 - None makes the player keep a fresh one
+            present, *fields = _PLAYER_V1.unpack_from(sections[SECTION_PLAYER], 0)
+            decoded["player"] = (present, None, *fields)
+        decoded["rng"] = _decode_rng(sections[SECTION_RNG])
+
+        decoded["depots"] = None
+        if SECTION_DEPOTS in sections:
+            decoded["depots"] = _unpack_columns(sections[SECTION_DEPOTS],
+                                                DEPOT_COLUMNS if version >= 2 else DEPOT_COLUMNS_V1)
+
+        count, columns = _unpack_columns(sections[SECTION_ASTEROIDS],
+                                         ASTEROID_COLUMNS if version >= 2 else ASTEROID_COLUMNS_V1)
+        columns["ore_type"] = [INVENTORY_TYPES[value] for value in columns["ore_type"]]
+        decoded["asteroids"] = (count, columns)
+
+        contents = {}
+        if SECTION_INVENTORIES in sections:
+            _, columns = _unpack_columns(sections[SECTION_INVENTORIES], INVENTORY_COLUMNS)
+            for owner_kind, owner_index, item_type, quantity in zip(
+                    columns["owner_kind"], columns["owner_index"], columns["item_type"], columns["quantity"]):
+                contents.setdefault((owner_kind, owner_index), {})[INVENTORY_TYPES[item_type]] = quantity
+        decoded["inventories"] = contents
+
+        decoded["modules"] = None
+        if SECTION_MODULES in sections:
+            decoded["modules"] = _unpack_columns(sections[SECTION_MODULES],
+                                                 MODULE_COLUMNS if version >= 2 else MODULE_COLUMNS_V1)
+        return decoded
+    except struct.error as e:
+        raise SaveFormatError(f"Truncated section: {e}") from e
+    except KeyError as e:
+        raise SaveFormatError(f"Unknown item type {e} in save") from e
+    finally:
+        for section in sections.values():
+            section.release()
+
+
+def load_game(path, game_state: GameState = None) -> GameState:
+    """
+    Load a saved game
+
+    If the save has a change journal next to it, the journal is replayed on
+    top of it so the most recent incremental changes are restored too.
+
+    Args:
+        path: Path of the save file
+        game_state: Existing game state to load into (it is reset once the
+            save has been read and validated), or None to create a new one
+
+    Returns:
+        GameState: The loaded game state
+
+    Raises:
+        OSError: If the file can't be read - the game state is untouched
+        SaveFormatError: If the file is not a valid save - the game state is untouched
+    """
+    with open(path, "rb") as save_file:
+        if os.fstat(save_file.fileno()).st_size == 0:
+            raise SaveFormatError("File is too small to be a save")
+        with mmap.mmap(save_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view, \
+                _gc_paused():
+            decoded = _decode_save(view)
+
+    # The save is valid - only now replace the current game
+    if game_state is None:
+        game_state = GameState()
+    game_state.reset()
+
+    with _gc_paused():
+        game_state.game_time, game_state.score, generation = decoded["meta"]
+        game_state.timer_wheel.reset(game_state.game_time)
+        random.setstate(decoded["rng"])
+
+        player = None
+        present, player_id, x, y, rotation, velocity_x, velocity_y, health, max_health, max_units = decoded["player"]
+        if present:
+            player = PlayerEntity(x, y)
+            if player_id is not None:
+                player.entity_id = player_id
+            player.rotation = rotation
+            player.velocity_x = velocity_x
+            player.velocity_y = velocity_y
+            player.health = health
+            player.max_health = max_health
+            player.inventory.max_units = max_units
+            player.set_game_state(game_state)
+            game_state.player_entity = player
+            game_state.add_entity(player)
+
+        depots = []
+        if decoded["depots"] is not None:
+            count, columns = decoded["depots"]
+            for index in range(count):
+                depot = MobileDepot(columns["x"][index], columns["y"][index], game_state)
+                if "entity_id" in columns:
+                    depot.entity_id = columns["entity_id"][index]
+                depot.inventory.max_units = columns["max_units"][index]
+                depots.append(depot)
+                game_state.add_entity(depot)
+
+        asteroids = _restore_asteroids(game_state, *decoded["asteroids"])
+
+        for (owner_kind, owner_index), items in decoded["inventories"].items():
+            if owner_kind == OWNER_PLAYER and player:
+                player.inventory.restore_items(items)
+            elif owner_kind == OWNER_DEPOT and owner_index < len(depots):
+                depots[owner_index].inventory.restore_items(items)
+
+        if player and decoded["modules"] is not None:
+            _restore_modules(player, *decoded["modules"], asteroids)
+
+        BaseEntity.reserve_entity_ids(max((entity.entity_id for entity in game_state.entities), default=0))
+
+    # Everything loaded so far is already on disk
+    game_state.dirty_entities.clear()
+
+    if generation:
+        from game_state.change_journal import journal_path, replay_journal
+        try:
+            replay_journal(journal_path(path, generation), game_state, generation)
+        except (OSError, SaveFormatError, struct.error, KeyError, ValueError) as e:
+            # The base save is already loaded - keep it rather than fail halfway
+            print(f"Warning: Could not replay journal: {e}")
+
+    return game_state
@@ -0,0 +1,379 @@
+"""
+Sector Store - SQLite-backed storage for world sectors that are not in memory
+
+The world is divided into square sectors of SECTOR_SIZE pixels, addressed by
+chunk coordinates (cx, cy). Asteroids are generated once per sector and
+written to the store. After that, only ore deltas (the ore left in asteroids
+that were mined) are written, so most of the world costs nothing in RAM.
+
+SectorPager keeps the sectors around the player resident in the GameState
+and pages the rest out, keeping at most MAX_RESIDENT_SECTORS in memory.
+
+Writes are buffered and written by flush() in a single transaction with
+executemany, so a flush costs one commit regardless of how many rows changed.
+"""
+
+import random
+import sqlite3
+from collections import OrderedDict
+
+from entities.asteroid_entity import AsteroidEntity
+from entities.base_entity import BaseEntity
+from game_state.game_events import on_asteroid_mined
+from game_state.inventory_types import InventoryType
+
+# Sector Constants - Easy to tune
+SECTOR_SIZE = 2048                 # Width and height of a sector in pixels
+MAX_RESIDENT_SECTORS = 25          # Sectors kept in memory at most
+SECTOR_LOAD_RADIUS = 1             # Sectors around the player's sector that must be resident
+SECTOR_ASTEROID_COUNT = 40         # Asteroids generated in a new sector
+SECTOR_FLUSH_INTERVAL = 5.0        # Seconds of game time between store flushes
+_ID_QUERY_BATCH = 500              # Entity ids per query when adopting loaded asteroids
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sectors (
+    cx INTEGER NOT NULL,
+    cy INTEGER NOT NULL,
+    asteroid_count INTEGER NOT NULL,
+    PRIMARY KEY (cx, cy)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS asteroids (
+    cx INTEGER NOT NULL,
+    cy INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    entity_id INTEGER NOT NULL,
+    x REAL NOT NULL,
+    y REAL NOT NULL,
+    asteroid_type INTEGER NOT NULL,
+    scale REAL NOT NULL,
+    rotation REAL NOT NULL,
+    rotation_speed REAL NOT NULL,
+    ore_type INTEGER NOT NULL,
+    ore_quantity INTEGER NOT NULL,
+    max_units INTEGER NOT NULL,
+    PRIMARY KEY (cx, cy, idx)
+) WITHOUT ROWID;
+
+CREATE UNIQUE INDEX IF NOT EXISTS asteroids_by_entity ON asteroids (entity_id);
+
+CREATE TABLE IF NOT EXISTS ore_deltas (
+    cx INTEGER NOT NULL,
+    cy INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    ore_quantity INTEGER NOT NULL,
+    PRIMARY KEY (cx, cy, idx)
+) WITHOUT ROWID;
+"""
+
+_INVENTORY_TYPES = {item_type.value: item_type for item_type in InventoryType}
+
+
+def sector_of(x, y):
+    """Get the chunk coordinates of the sector containing a world position"""
+    return int(x // SECTOR_SIZE), int(y // SECTOR_SIZE)
+
+
+class SectorStore:
+    """Persistent store of sector contents and per-asteroid ore deltas"""
+
+    def __init__(self, path):
+        """
+        Open (or create) a sector store
+
+        Args:
+            path: Path of the SQLite database file, or ":memory:"
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+
+        # Buffered writes, applied by flush()
+        self._pending_sectors = {}   # (cx, cy) -> list of asteroid rows
+        self._pending_deltas = {}    # (cx, cy, idx) -> ore quantity
+
+    def has_sector(self, cx, cy):
+        """Check if a sector has been generated"""
+        if (cx, cy) in self._pending_sectors:
+            return True
+        row = self.connection.execute(
+            "SELECT 1 FROM sectors WHERE cx = ? AND cy = ?", (cx, cy)).fetchone()
+        return row is not None
+
+    def load_sector(self, cx, cy):
+        """
+        Read the asteroids of a sector with their ore deltas applied
+
+        Args:
+            cx, cy: Chunk coordinates
+
+        Returns:
+            list: Rows of (idx, entity_id, x, y, asteroid_type, scale, rotation,
+                rotation_speed, ore_type, ore_quantity, max_units). Mined-out
+                asteroids are left out.
+        """
+        pending = self._pending_sectors.get((cx, cy))
+        if pending is not None:
+            rows = [row[2:] for row in pending]
+        else:
+            rows = self.connection.execute(
+                """SELECT a.idx, a.entity_id, a.x, a.y, a.asteroid_type, a.scale, a.rotation,
+                          a.rotation_speed, a.ore_type,
+                          COALESCE(d.ore_quantity, a.ore_quantity), a.max_units
+                   FROM asteroids a
+                   LEFT JOIN ore_deltas d ON d.cx = a.cx AND d.cy = a.cy AND d.idx = a.idx
+                   WHERE a.cx = ? AND a.cy = ?
+                   ORDER BY a.idx""", (cx, cy)).fetchall()
+
+        deltas = self._pending_deltas
+        if deltas:
+            rows = [row[:9] + (deltas.get((cx, cy, row[0]), row[9]), row[10]) for row in rows]
+        return [row for row in rows if row[9] > 0]
+
+    def sectors_in_range(self, min_cx, min_cy, max_cx, max_cy):
+        """
+        Find the generated sectors inside a rectangle of chunk coordinates
+
+        Returns:
+            list: (cx, cy) of every generated sector in the rectangle (inclusive)
+        """
+        rows = self.connection.execute(
+            "SELECT cx, cy FROM sectors WHERE cx BETWEEN ? AND ? AND cy BETWEEN ? AND ?",
+            (min_cx, max_cx, min_cy, max_cy)).fetchall()
+        pending = [key for key in self._pending_sectors
+                   if min_cx <= key[0] <= max_cx and min_cy <= key[1] <= max_cy]
+        return sorted(set(rows) | set(pending))
+
+    def find_asteroids(self, entity_ids):
+        """
+        Look up which sector slots a set of asteroid entities belong to
+
+        Args:
+            entity_ids: Iterable of entity ids
+
+        Returns:
+            dict: entity_id -> (cx, cy, idx) for the ids found in the store
+        """
+        entity_ids = list(entity_ids)
+        wanted = set(entity_ids)
+        found = {}
+        for rows in self._pending_sectors.values():
+            for cx, cy, idx, entity_id, *_ in rows:
+                if entity_id in wanted:
+                    found[entity_id] = (cx, cy, idx)
+
+        for start in range(0, len(entity_ids), _ID_QUERY_BATCH):
+            batch = entity_ids[start:start + _ID_QUERY_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            for entity_id, cx, cy, idx in self.connection.execute(
+                    f"SELECT entity_id, cx, cy, idx FROM asteroids WHERE entity_id IN ({placeholders})", batch):
+                found[entity_id] = (cx, cy, idx)
+        return found
+
+    def max_entity_id(self):
+        """Get the highest entity id used by a stored asteroid (0 if there are none)"""
+        pending = [row[3] for rows in self._pending_sectors.values() for row in rows]
+        row = self.connection.execute("SELECT MAX(entity_id) FROM asteroids").fetchone()
+        return max(pending + [row[0] or 0])
+
+    def add_sector(self, cx, cy, asteroids):
+        """
+        Queue a newly generated sector for writing
+
+        Args:
+            cx, cy: Chunk coordinates
+            asteroids: AsteroidEntity list, in slot order
+        """
+        self._pending_sectors[(cx, cy)] = [
+            (cx, cy, idx, asteroid.entity_id, asteroid.x, asteroid.y, asteroid.asteroid_type,
+             asteroid.scale, asteroid.rotation, asteroid.rotation_speed, asteroid.ore_type.value,
+             sum(asteroid.inventory.items.values()), asteroid.inventory.max_units)
+            for idx, asteroid in enumerate(asteroids)
+        ]
+
+    def set_ore(self, cx, cy, idx, ore_quantity):
+        """Queue the ore left in an asteroid - only the latest value per asteroid is written"""
+        self._pending_deltas[(cx, cy, idx)] = ore_quantity
+
+    def flush(self):
+        """
+        Write all buffered changes in a single transaction
+
+        Returns:
+            int: Number of rows written
+        """
+        if not self._pending_sectors and not self._pending_deltas:
+            return 0
+
+        sectors = self._pending_sectors
+        deltas = self._pending_deltas
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO sectors (cx, cy, asteroid_count) VALUES (?, ?, ?)",
+                [(cx, cy, len(rows)) for (cx, cy), rows in sectors.items()])
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO asteroids VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [row for rows in sectors.values() for row in rows])
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO ore_deltas (cx, cy, idx, ore_quantity) VALUES (?, ?, ?, ?)",
+                [(cx, cy, idx, ore_quantity) for (cx, cy, idx), ore_quantity in deltas.items()])
+
+        written = len(sectors) + sum(len(rows) for rows in sectors.values()) + len(deltas)
+        self._pending_sectors = {}
+        self._pending_deltas = {}
+        return written
+
+    def reset(self):
+        """Delete every sector - used when a new world is started"""
+        self._pending_sectors = {}
+        self._pending_deltas = {}
+        with self.connection:
+            self.connection.execute("DELETE FROM ore_deltas")
+            self.connection.execute("DELETE FROM asteroids")
+            self.connection.execute("DELETE FROM sectors")
+
+    def close(self):
+        """Flush and close the database"""
+        self.flush()
+        self.connection.close()
+
+
+class SectorPager:
+    """Pages sectors in around a focus point and out again when memory is needed"""
+
+    def __init__(self, game_state, store, max_resident=MAX_RESIDENT_SECTORS, load_radius=SECTOR_LOAD_RADIUS):
+        """
+        Initialize the pager
+
+        Args:
+            game_state: Game state the resident asteroids live in
+            store: SectorStore holding the sectors
+            max_resident: Maximum number of sectors kept in memory
+            load_radius: Sectors around the focus sector that are always resident
+        """
+        self.game_state = game_state
+        self.store = store
+        self.max_resident = max(max_resident, (2 * load_radius + 1) ** 2)
+        self.load_radius = load_radius
+
+        self.resident = OrderedDict()   # (cx, cy) -> list of resident asteroids, least recently used first
+        self.slots = {}                 # Asteroid -> (cx, cy, idx)
+        self.next_flush_time = game_state.game_time + SECTOR_FLUSH_INTERVAL
+
+        # Stored asteroids keep their entity ids - new entities must not reuse them
+        BaseEntity.reserve_entity_ids(store.max_entity_id())
+        on_asteroid_mined.connect(self._on_asteroid_mined)
+
+    def _on_asteroid_mined(self, asteroid_entity, amount, hit_type=None, **kwargs):
+        """Record the ore left in a sector asteroid after it was mined"""
+        slot = self.slots.get(asteroid_entity)
+        if slot is not None:
+            self.store.set_ore(*slot, sum(asteroid_entity.inventory.items.values()))
+
+    def update(self, focus_x, focus_y):
+        """
+        Make the sectors around a point resident and page out the least recently used ones
+
+        Args:
+            focus_x, focus_y: World position to keep loaded around (usually the player)
+        """
+        focus_cx, focus_cy = sector_of(focus_x, focus_y)
+        required = [(focus_cx + dx, focus_cy + dy)
+                    for dy in range(-self.load_radius, self.load_radius + 1)
+                    for dx in range(-self.load_radius, self.load_radius + 1)]
+
+        for key in required:
+            if key in self.resident:
+                self.resident.move_to_end(key)
+            else:
+                self._page_in(*key)
+
+        evicted = False
+        for key in list(self.resident):
+            if len(self.resident) <= self.max_resident:
+                break
+            if key not in required and self._page_out(key):
+                evicted = True
+        if evicted:
+            self.game_state.cleanup_inactive_entities()
+
+        if self.game_state.game_time >= self.next_flush_time:
+            self.next_flush_time = self.game_state.game_time + SECTOR_FLUSH_INTERVAL
+            self.store.flush()
+
+    def _page_in(self, cx, cy):
+        """Load a sector from the store, generating it the first time it is visited"""
+        if self.store.has_sector(cx, cy):
+            restore = AsteroidEntity.restore
+            asteroids = []
+            for (idx, entity_id, x, y, asteroid_type, scale, rotation, rotation_speed,
+                 ore_type, ore_quantity, max_units) in self.store.load_sector(cx, cy):
+                asteroid = restore(entity_id, x, y, asteroid_type, scale, rotation, rotation_speed,
+                                   _INVENTORY_TYPES[ore_type], ore_quantity, max_units)
+                self.slots[asteroid] = (cx, cy, idx)
+                asteroids.append(asteroid)
+        else:
+            asteroids = [
+                AsteroidEntity(random.uniform(cx * SECTOR_SIZE, (cx + 1) * SECTOR_SIZE),
+                               random.uniform(cy * SECTOR_SIZE, (cy + 1) * SECTOR_SIZE))
+                for _ in range(SECTOR_ASTEROID_COUNT)
+            ]
+            self.store.add_sector(cx, cy, asteroids)
+            for idx, asteroid in enumerate(asteroids):
+                self.slots[asteroid] = (cx, cy, idx)
+
+        for asteroid in asteroids:
+            self.game_state.add_entity(asteroid)
+        self.resident[(cx, cy)] = asteroids
+
+    def _page_out(self, key):
+        """
+        Write back a sector's ore and remove its asteroids from the game state
+
+        Returns:
+            bool: True if the sector was paged out (sectors being mined stay resident)
+        """
+        asteroids = self.resident[key]
+        if any(asteroid.active_mining_module is not None for asteroid in asteroids):
+            return False
+
+        for asteroid in asteroids:
+            slot = self.slots.pop(asteroid)
+            if asteroid.active:
+                self.store.set_ore(*slot, sum(asteroid.inventory.items.values()))
+                asteroid.destroy()
+        del self.resident[key]
+        return True
+
+    def adopt(self, game_state):
+        """
+        Rebuild the resident set from a freshly loaded game state
+
+        Asteroids in the loaded state that came from the store are mapped
+        back to their sector slots, so they are paged out normally later.
+
+        Args:
+            game_state: The loaded game state
+        """
+        self.game_state = game_state
+        self.resident.clear()
+        self.slots.clear()
+        self.next_flush_time = game_state.game_time + SECTOR_FLUSH_INTERVAL
+        BaseEntity.reserve_entity_ids(self.store.max_entity_id())
+
+        asteroids = {entity.entity_id: entity for entity in game_state.entities
+                     if isinstance(entity, AsteroidEntity)}
+        for entity_id, (cx, cy, idx) in self.store.find_asteroids(asteroids).items():
+            asteroid = asteroids[entity_id]
+            self.slots[asteroid] = (cx, cy, idx)
+            self.resident.setdefault((cx, cy), []).append(asteroid)
+
+    def close(self):
+        """Stop tracking mining, write back every resident sector and close the store"""
+        on_asteroid_mined.disconnect(self._on_asteroid_mined)
+        for asteroid, slot in self.slots.items():
+            if asteroid.active:
+                self.store.set_ore(*slot, sum(asteroid.inventory.items.values()))
+        self.store.close()
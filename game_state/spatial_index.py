@@ -0,0 +1,187 @@
+"""
+Spatial Index - finds the pickable entity under a point without scanning the world
+
+Pickable entities (asteroids, depots) never move, so each one is bucketed
+once, when it is added to the GameState, into every square cell its
+collision circle overlaps, and taken out again when it is removed. Picking a
+point tests only the entities of one cell, so hovering stays cheap with
+thousands of entities resident.
+
+Entities added in bulk (a loaded save) skip the per-cell lists: their cells
+are computed with NumPy and kept as one sorted array of cell keys, which a
+pick searches with a binary search. Building it costs no Python object per
+entity or cell, so loading a large world doesn't stall on the index.
+"""
+
+import math
+
+import numpy as np
+
+# Spatial Index Constants - Easy to tune
+SPATIAL_CELL_SIZE = 256   # Cell width and height in pixels (about the largest asteroid)
+
+
+class SpatialIndex:
+    """Uniform grid over the collision circles of pickable entities"""
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        """
+        Initialize an empty index
+
+        Args:
+            cell_size: Cell width and height in pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}          # (cx, cy) -> entities overlapping the cell
+        self.entity_cells = {}   # entity -> cells it was added to
+
+        # Entities added with insert_many - a removed one is replaced by None
+        self.bulk_entities = []
+        self.bulk_slots = {}                             # entity -> index in bulk_entities
+        self.bulk_keys = np.empty(0, dtype=np.int64)     # Sorted cell keys (see _cell_key)
+        self.bulk_indices = np.empty(0, dtype=np.int64)  # bulk_entities index per key
+
+    def __len__(self):
+        return len(self.entity_cells) + len(self.bulk_slots)
+
+    def __contains__(self, entity):
+        return entity in self.entity_cells or entity in self.bulk_slots
+
+    @staticmethod
+    def _cell_key(cx, cy):
+        """Single integer key of a cell (works on ints and NumPy arrays alike)"""
+        return cx * (1 << 32) + (cy + (1 << 31))
+
+    def _cell_range(self, x, y, radius):
+        """Cells overlapped by a circle's bounding box"""
+        size = self.cell_size
+        min_cx = math.floor((x - radius) / size)
+        max_cx = math.floor((x + radius) / size)
+        min_cy = math.floor((y - radius) / size)
+        max_cy = math.floor((y + radius) / size)
+        return [(cx, cy) for cx in range(min_cx, max_cx + 1) for cy in range(min_cy, max_cy + 1)]
+
+    def insert(self, entity):
+        """
+        Add an entity (ignored unless its class is PICKABLE, or if already added)
+
+        Args:
+            entity: Entity with a position and get_collision_radius()
+        """
+        if not getattr(entity, "PICKABLE", False) or entity in self:
+            return
+        keys = self._cell_range(entity.x, entity.y, entity.get_collision_radius())
+        for key in keys:
+            self.cells.setdefault(key, []).append(entity)
+        self.entity_cells[entity] = keys
+
+    def insert_many(self, entities, xs, ys, radii):
+        """
+        Add many entities at once (e.g. the asteroids of a loaded save)
+
+        The positions and radii are passed as columns, so no entity is
+        touched while the cells are computed.
+
+        Args:
+            entities: PICKABLE entities that are not in the index yet
+            xs, ys: Their positions (sequences or arrays)
+            radii: Their collision radii
+        """
+        count = len(entities)
+        if not count:
+            return
+        size = self.cell_size
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        radii = np.asarray(radii, dtype=np.float64)
+        min_cx = np.floor((xs - radii) / size).astype(np.int64)
+        max_cx = np.floor((xs + radii) / size).astype(np.int64)
+        min_cy = np.floor((ys - radii) / size).astype(np.int64)
+        max_cy = np.floor((ys + radii) / size).astype(np.int64)
+
+        # One (key, entity) pair per overlapped cell - offsets cover the widest circle
+        first = len(self.bulk_entities)
+        indices = np.arange(first, first + count, dtype=np.int64)
+        keys = [self.bulk_keys]
+        owners = [self.bulk_indices]
+        for dx in range(int((max_cx - min_cx).max()) + 1):
+            for dy in range(int((max_cy - min_cy).max()) + 1):
+                overlaps = (min_cx + dx <= max_cx) & (min_cy + dy <= max_cy)
+                keys.append(self._cell_key(min_cx[overlaps] + dx, min_cy[overlaps] + dy))
+                owners.append(indices[overlaps])
+        keys = np.concatenate(keys)
+        order = np.argsort(keys, kind="stable")
+        self.bulk_keys = keys[order]
+        self.bulk_indices = np.concatenate(owners)[order]
+
+        self.bulk_entities.extend(entities)
+        self.bulk_slots.update(zip(entities, range(first, first + count)))
+
+    def remove(self, entity):
+        """Take an entity out of the index (no-op if it is not in it)"""
+        slot = self.bulk_slots.pop(entity, None)
+        if slot is not None:
+            self.bulk_entities[slot] = None
+            return
+        keys = self.entity_cells.pop(entity, None)
+        if keys is None:
+            return
+        for key in keys:
+            cell = self.cells[key]
+            cell.remove(entity)
+            if not cell:
+                del self.cells[key]
+
+    def clear(self):
+        """Remove every entity"""
+        self.cells.clear()
+        self.entity_cells.clear()
+        self.bulk_entities = []
+        self.bulk_slots = {}
+        self.bulk_keys = np.empty(0, dtype=np.int64)
+        self.bulk_indices = np.empty(0, dtype=np.int64)
+
+    def _bulk_candidates(self, cx, cy):
+        """Bulk-added entities overlapping a cell (None where one was removed)"""
+        keys = self.bulk_keys
+        if not len(keys):
+            return ()
+        key = self._cell_key(cx, cy)
+        start = keys.searchsorted(key, "left")
+        end = keys.searchsorted(key, "right")
+        bulk_entities = self.bulk_entities
+        return [bulk_entities[index] for index in self.bulk_indices[start:end].tolist()]
+
+    def pick(self, x, y):
+        """
+        Find the entity under a point
+
+        Args:
+            x, y: World position
+
+        Returns:
+            The active entity whose collision circle contains the point, the
+            one with the nearest center if several do - or None
+        """
+        cx = math.floor(x / self.cell_size)
+        cy = math.floor(y / self.cell_size)
+        candidates = self.cells.get((cx, cy), [])
+        bulk_candidates = self._bulk_candidates(cx, cy)
+        if bulk_candidates:
+            candidates = candidates + bulk_candidates
+        if not candidates:
+            return None
+
+        picked = None
+        picked_distance = math.inf
+        for entity in candidates:
+            if entity is None or not entity.active:
+                continue
+            dx = entity.x - x
+            dy = entity.y - y
+            distance = dx * dx + dy * dy
+            radius = entity.get_collision_radius()
+            if distance <= radius * radius and distance < picked_distance:
+                picked = entity
+                picked_distance = distance
+        return picked
@@ -2,14 +2,26 @@
 State Manager - manages game state and processes input commands
 """
 
+import os
 import random
+import time
+from audio import get_audio_engine
 from game_state.game_state import GameState
+from game_state.save_game import save_game, load_game, SaveFormatError
+from game_state.autosave import AutosaveService
+from game_state.sector_store import SectorStore, SectorPager
 from entities.player_entity import PlayerEntity
 from entities.asteroid_entity import AsteroidEntity
 from entities.mining_laser_module import MiningLaserModule
 from entities.mobile_depot import MobileDepot
-from input.commands import InputCommand
-from core.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from input.commands import InputCommand, MODULE_COMMAND_INDICES
+from input.event_queue import INPUT_EVENT_MAX_AGE
+from core.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, QUICKSAVE_PATH,
+    AUTOSAVE_ENABLED, AUTOSAVE_PATH, AUTOSAVE_INTERVAL, AUTOSAVE_FRAME_BUDGET_MS,
+    AUTOSAVE_JOURNAL_INTERVAL, AUTOSAVE_JOURNAL_COMPACT_BYTES,
+    SECTOR_PAGING_ENABLED, SECTOR_STORE_PATH
+)
 
 
 class StateManager:
@@ -18,11 +30,51 @@ class StateManager:
     def __init__(self):
         """Initialize the state manager"""
         self.game_state = GameState()
+        self.autosave = None
+        self.sector_pager = None
         
-    def initialize(self):
-        """Initialize the game state"""
+        # One-shot command handlers, looked up once per queued command
+        self.command_handlers = {
+            InputCommand.SHOOT: self._handle_shoot_command,
+            InputCommand.QUICK_SAVE: lambda: self.save_game(QUICKSAVE_PATH),
+            InputCommand.QUICK_LOAD: lambda: self.load_game(QUICKSAVE_PATH),
+        }
+        # Actions queued before this time were meant for a game that was since loaded over
+        self.input_cutoff = 0.0
+        self.stale_input_count = 0
+        
+    def initialize(self, new_game=False):
+        """
+        Initialize the game state
+        
+        The sector store is the persistent world: saves refer to the
+        asteroids in it, so it is kept across launches and only wiped when a
+        new game is explicitly started.
+        
+        Args:
+            new_game: Start a new world, deleting every stored sector
+        """
         self._setup_initial_state()
         
+        if SECTOR_PAGING_ENABLED:
+            directory = os.path.dirname(SECTOR_STORE_PATH)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            store = SectorStore(SECTOR_STORE_PATH)
+            if new_game:
+                store.reset()
+            self.sector_pager = SectorPager(self.game_state, store)
+        
+        if AUTOSAVE_ENABLED:
+            self.autosave = AutosaveService(
+                self.game_state,
+                AUTOSAVE_PATH,
+                interval=AUTOSAVE_INTERVAL,
+                frame_budget_ms=AUTOSAVE_FRAME_BUDGET_MS,
+                journal_interval=AUTOSAVE_JOURNAL_INTERVAL,
+                journal_compact_bytes=AUTOSAVE_JOURNAL_COMPACT_BYTES
+            )
+        
     def _setup_initial_state(self):
         """Set up the initial game state"""
         # Create and add player entity at center bottom of larger screen
@@ -82,28 +134,51 @@ class StateManager:
             asteroid = AsteroidEntity(x, y)
             self.game_state.add_entity(asteroid)
         
-    def update(self, delta_time, input_commands):
-        """Update game state based on time and input commands"""
-        self._process_input_commands(input_commands, delta_time)
+    def update(self, delta_time, input_frame):
+        """
+        Update game state based on time and input
+        
+        Args:
+            delta_time: Seconds since the last tick
+            input_frame: InputFrame with the held-command mask and queued one-shot commands
+        """
+        self._process_input_commands(input_frame, delta_time)
         self._update_entities(delta_time)
         self._update_game_logic(delta_time)
         
-    def _process_input_commands(self, commands, delta_time):
-        """Process input commands and route them to appropriate entities"""
-        for command in commands:
-            if command == InputCommand.SHOOT:
-                self._handle_shoot_command()
-            elif command in [InputCommand.ACTIVATE_MODULE_1, InputCommand.ACTIVATE_MODULE_2, 
-                           InputCommand.ACTIVATE_MODULE_3, InputCommand.ACTIVATE_MODULE_4]:
+        if self.sector_pager and self.game_state.player_entity:
+            player = self.game_state.player_entity
+            self.sector_pager.update(player.x, player.y)
+        
+        # Positioned sounds from this tick are mixed together, as heard from the player's ship
+        player = self.game_state.player_entity
+        if player:
+            get_audio_engine().update_listener(player.x, player.y)
+        
+        # Autosave runs at the tick boundary, after all state changes for this tick
+        if self.autosave:
+            self.autosave.tick()
+        
+    def _process_input_commands(self, input_frame, delta_time):
+        """Run the queued one-shot commands, then pass the held commands to the player"""
+        events = input_frame.events
+        now = time.perf_counter()
+        while events:
+            # Skip actions left over from a stalled tick, or from before a load
+            timestamp = events.peek_timestamp()
+            command = events.pop()
+            if timestamp < self.input_cutoff or now - timestamp > INPUT_EVENT_MAX_AGE:
+                self.stale_input_count += 1
+                continue
+            handler = self.command_handlers.get(command)
+            if handler is not None:
+                handler()
+            elif command in MODULE_COMMAND_INDICES:
                 self._handle_module_activation_command(command)
                 
         # Pass movement commands to player entity
         if self.game_state.player_entity:
-            movement_commands = [cmd for cmd in commands 
-                               if cmd in [InputCommand.ROTATE_LEFT, 
-                                        InputCommand.ROTATE_RIGHT, 
-                                        InputCommand.THRUST]]
-            self.game_state.player_entity.update(delta_time, movement_commands)
+            self.game_state.player_entity.update(delta_time, input_frame.held)
         
     def _update_entities(self, delta_time):
         """Update all entities"""
@@ -113,6 +188,32 @@ class StateManager:
         # Clean up inactive entities
         self.game_state.cleanup_inactive_entities()
         
+    def select_entity_at(self, x, y):
+        """
+        Select the pickable entity at a world position, or clear the selection
+        
+        Args:
+            x, y: World position
+            
+        Returns:
+            bool: True if an entity was selected
+        """
+        self.game_state.selected_entity = self.game_state.pick_entity(x, y)
+        return self.game_state.selected_entity is not None
+        
+    def hover_entity_at(self, x, y):
+        """
+        Track the pickable entity under the mouse
+        
+        Args:
+            x, y: World position of the mouse
+        """
+        self.game_state.hovered_entity = self.game_state.pick_entity(x, y)
+        
+    def clear_hovered_entity(self):
+        """Stop hovering the world (the mouse is over the UI)"""
+        self.game_state.hovered_entity = None
+        
     def _handle_shoot_command(self):
         """Handle shooting action"""
         # For now, just increment score as a placeholder
@@ -123,29 +224,90 @@ class StateManager:
         if not self.game_state.player_entity:
             return
         
-        # Map commands to module indices
-        module_index_map = {
-            InputCommand.ACTIVATE_MODULE_1: 0,
-            InputCommand.ACTIVATE_MODULE_2: 1,
-            InputCommand.ACTIVATE_MODULE_3: 2,
-            InputCommand.ACTIVATE_MODULE_4: 3
-        }
-        
-        module_index = module_index_map.get(command)
+        module_index = MODULE_COMMAND_INDICES.get(command)
         if module_index is not None:
             success = self.game_state.player_entity.activate_module(module_index)
             if success:
                 # Could add feedback here (sound, visual effect, etc.)
                 pass
         
+    def save_game(self, path):
+        """
+        Save the current game state to a file
+        
+        Args:
+            path: Path of the save file
+            
+        Returns:
+            bool: True if the game was saved
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            save_game(self.game_state, path)
+        except OSError as e:
+            print(f"Save failed: {e}")
+            return False
+        print(f"Game saved to {path}")
+        return True
+        
+    def load_game(self, path):
+        """
+        Replace the current game state with a saved one
+        
+        The existing GameState object is reused so systems holding a
+        reference to it (renderer, UI) see the loaded state. If the save has
+        a change journal, it is replayed on top of it. A missing or invalid
+        save leaves the current game as it was.
+        
+        Args:
+            path: Path of the save file
+            
+        Returns:
+            bool: True if the game was loaded
+        """
+        if not os.path.exists(path):
+            print(f"Load failed: no save at {path}")
+            return False
+        try:
+            load_game(path, self.game_state)
+        except (OSError, SaveFormatError) as e:
+            print(f"Load failed: {e}")
+            return False
+        
+        # Queued actions were aimed at the replaced game
+        self.input_cutoff = time.perf_counter()
+        
+        # Any capture in progress and the journals belong to the replaced state
+        if self.autosave:
+            self.autosave.cancel()
+        if self.sector_pager:
+            self.sector_pager.adopt(self.game_state)
+        print(f"Game loaded from {path}")
+        return True
+        
     def _update_game_logic(self, delta_time):
         """Update game logic that doesn't depend on input"""
-        # Update game timer
+        # Update game timer and fire the events that are due (module cycles)
         self.game_state.game_time += delta_time
+        self.game_state.timer_wheel.advance(self.game_state.game_time)
+        
+        # Mine for every laser cycle that ended this tick, in one batch
+        self.game_state.mining_resolver.resolve()
         
         # Add any time-based game logic here
         # For example: enemy spawning, bullet movement, etc.
         
+    def shutdown(self):
+        """Write back everything still buffered - call once when the game exits"""
+        if self.autosave:
+            self.autosave.close()
+            self.autosave = None
+        if self.sector_pager:
+            self.sector_pager.close()
+            self.sector_pager = None
+        
     def get_current_state(self) -> GameState:
         """Get the current game state"""
         return self.game_state
\ No newline at end of file
@@ -22,6 +22,31 @@ class InputCommand(Enum):
     ACTIVATE_MODULE_3 = "activate_module_3"
     ACTIVATE_MODULE_4 = "activate_module_4"
     
+    # Save game commands
+    QUICK_SAVE = "quick_save"
+    QUICK_LOAD = "quick_load"
+    
     # Menu commands (for future use)
     CONFIRM = "confirm"
-    CANCEL = "cancel" 
\ No newline at end of file
+    CANCEL = "cancel"
+
+
+# Held commands are bits of the per-tick command mask - plain ints, so
+# combining and testing them allocates nothing
+COMMAND_ROTATE_LEFT = 1 << 0
+COMMAND_ROTATE_RIGHT = 1 << 1
+COMMAND_THRUST = 1 << 2
+
+HELD_COMMAND_BITS = {
+    InputCommand.ROTATE_LEFT: COMMAND_ROTATE_LEFT,
+    InputCommand.ROTATE_RIGHT: COMMAND_ROTATE_RIGHT,
+    InputCommand.THRUST: COMMAND_THRUST,
+}
+
+# Module slot activated by each module command
+MODULE_COMMAND_INDICES = {
+    InputCommand.ACTIVATE_MODULE_1: 0,
+    InputCommand.ACTIVATE_MODULE_2: 1,
+    InputCommand.ACTIVATE_MODULE_3: 2,
+    InputCommand.ACTIVATE_MODULE_4: 3,
+}
@@ -0,0 +1,79 @@
+"""
+Event Queue - timestamped one-shot input commands, in a fixed-size ring buffer
+
+Key presses push a command with the time it happened. The state manager
+takes them oldest first during the next tick, and uses the timestamps to
+ignore actions that went stale: ones left over from a stalled tick, or
+pressed before a quick-load replaced the world. The buffer is allocated once,
+so queueing and taking events creates no per-frame garbage. If a tick is
+stalled long enough to fill the queue, newer events are dropped and counted.
+"""
+
+# Event Queue Constants - Easy to tune
+INPUT_EVENT_CAPACITY = 64   # One-shot commands held between two ticks at most
+INPUT_EVENT_MAX_AGE = 0.5   # Seconds after which a queued action is ignored instead of run
+
+
+class EventQueue:
+    """Ring buffer of (timestamp, command) pairs, oldest first"""
+
+    def __init__(self, capacity=INPUT_EVENT_CAPACITY):
+        """
+        Initialize an empty queue
+
+        Args:
+            capacity: Events held at most
+        """
+        self.capacity = capacity
+        self.timestamps = [0.0] * capacity
+        self.commands = [None] * capacity
+        self.head = 0         # Index of the oldest event
+        self.count = 0
+        self.dropped_count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, command, timestamp):
+        """
+        Queue a command
+
+        Args:
+            command: InputCommand
+            timestamp: When it happened (time.perf_counter() seconds)
+
+        Returns:
+            bool: False if the queue was full and the command was dropped
+        """
+        if self.count == self.capacity:
+            self.dropped_count += 1
+            return False
+        index = (self.head + self.count) % self.capacity
+        self.timestamps[index] = timestamp
+        self.commands[index] = command
+        self.count += 1
+        return True
+
+    def peek_timestamp(self):
+        """Timestamp of the oldest event, or None if the queue is empty"""
+        return self.timestamps[self.head] if self.count else None
+
+    def pop(self):
+        """
+        Take the oldest command
+
+        Returns:
+            InputCommand or None: The command, or None if the queue is empty
+        """
+        if not self.count:
+            return None
+        command = self.commands[self.head]
+        self.commands[self.head] = None
+        self.head = (self.head + 1) % self.capacity
+        self.count -= 1
+        return command
+
+    def clear(self):
+        """Drop every queued event"""
+        while self.count:
+            self.pop()
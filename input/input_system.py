@@ -1,68 +1,88 @@
 """
 Input System - handles user input and converts it to game commands
+
+Key events update a bitmask of held commands (movement) and queue
+timestamped one-shot commands (actions), both through the lookup tables of
+a KeyMap. process_input() hands the state manager the same InputFrame every
+tick, so reading input allocates nothing per frame.
 """
 
-import arcade
-from input.commands import InputCommand
+import time
+
+from input.event_queue import EventQueue
+from input.key_map import KeyMap
+
+
+class InputFrame:
+    """Input for one tick - the same object is reused every frame"""
+
+    __slots__ = ("held", "events")
+
+    def __init__(self, events):
+        """
+        Initialize an input frame
+
+        Args:
+            events: EventQueue of one-shot commands
+        """
+        self.held = 0   # Mask of COMMAND_* bits for the held commands
+        self.events = events
 
 
 class InputSystem:
     """Handles all user input and converts it to game commands"""
-    
-    def __init__(self):
-        """Initialize the input system"""
+
+    def __init__(self, key_map=None):
+        """
+        Initialize the input system
+
+        Args:
+            key_map: KeyMap to use (defaults to the default bindings)
+        """
+        self.key_map = key_map or KeyMap()
         self.active_keys = set()
-        self.commands_this_frame = []
-        
+        self.held = 0
+        self.events = EventQueue()
+        self.frame = InputFrame(self.events)
+
     def process_input(self):
-        """Process current input state and return commands"""
-        commands = self._generate_commands_from_keys()
-        
-        # Get any one-time commands from this frame
-        frame_commands = self.commands_this_frame.copy()
-        self.commands_this_frame.clear()
-        
-        return commands + frame_commands
-        
-    def _generate_commands_from_keys(self):
-        """Generate continuous commands from currently pressed keys"""
-        commands = []
-        
-        # Rotation commands
-        if arcade.key.LEFT in self.active_keys or arcade.key.A in self.active_keys:
-            commands.append(InputCommand.ROTATE_LEFT)
-            
-        if arcade.key.RIGHT in self.active_keys or arcade.key.D in self.active_keys:
-            commands.append(InputCommand.ROTATE_RIGHT)
-            
-        # Thrust command
-        if arcade.key.UP in self.active_keys or arcade.key.W in self.active_keys:
-            commands.append(InputCommand.THRUST)
-            
-        return commands
-        
+        """
+        Get this tick's input
+
+        Returns:
+            InputFrame: Held-command mask and the queue of one-shot commands
+        """
+        self.frame.held = self.held
+        return self.frame
+
+    def _update_held(self):
+        """Recompute the held-command mask from the pressed keys"""
+        held = 0
+        held_bits = self.key_map.held_bits
+        for key in self.active_keys:
+            held |= held_bits.get(key, 0)
+        self.held = held
+
     def on_key_press(self, key, modifiers):
         """Handle key press events"""
         self.active_keys.add(key)
-        
-        # Handle one-time action commands
-        if key == arcade.key.SPACE:
-            self.commands_this_frame.append(InputCommand.SHOOT)
-        
-        # Handle module activation commands
-        elif key == arcade.key.KEY_1:
-            self.commands_this_frame.append(InputCommand.ACTIVATE_MODULE_1)
-        elif key == arcade.key.KEY_2:
-            self.commands_this_frame.append(InputCommand.ACTIVATE_MODULE_2)
-        elif key == arcade.key.KEY_3:
-            self.commands_this_frame.append(InputCommand.ACTIVATE_MODULE_3)
-        elif key == arcade.key.KEY_4:
-            self.commands_this_frame.append(InputCommand.ACTIVATE_MODULE_4)
-            
+
+        bit = self.key_map.held_bits.get(key)
+        if bit is not None:
+            self.held |= bit
+
+        command = self.key_map.actions.get(key)
+        if command is not None:
+            self.events.push(command, time.perf_counter())
+
     def on_key_release(self, key, modifiers):
         """Handle key release events"""
         self.active_keys.discard(key)
-        
+
+        # Another pressed key may still hold the same command
+        if key in self.key_map.held_bits:
+            self._update_held()
+
     def is_key_pressed(self, key):
         """Check if a specific key is currently pressed"""
-        return key in self.active_keys 
\ No newline at end of file
+        return key in self.active_keys
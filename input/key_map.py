@@ -0,0 +1,61 @@
+"""
+Key Map - rebindable key bindings, compiled into lookup tables
+
+Bindings map each command to the keys that trigger it - pass custom ones to
+KeyMap to rebind. compile() turns them into two dicts keyed by key code - the
+held-command bit of a key, and the one-shot command of a key - so a key event
+is handled with a dict lookup instead of a chain of comparisons.
+"""
+
+import arcade
+
+from input.commands import HELD_COMMAND_BITS, InputCommand
+
+DEFAULT_KEY_BINDINGS = {
+    # Movement (held)
+    InputCommand.ROTATE_LEFT: (arcade.key.LEFT, arcade.key.A),
+    InputCommand.ROTATE_RIGHT: (arcade.key.RIGHT, arcade.key.D),
+    InputCommand.THRUST: (arcade.key.UP, arcade.key.W),
+
+    # Actions (one-shot)
+    InputCommand.SHOOT: (arcade.key.SPACE,),
+    InputCommand.ACTIVATE_MODULE_1: (arcade.key.KEY_1,),
+    InputCommand.ACTIVATE_MODULE_2: (arcade.key.KEY_2,),
+    InputCommand.ACTIVATE_MODULE_3: (arcade.key.KEY_3,),
+    InputCommand.ACTIVATE_MODULE_4: (arcade.key.KEY_4,),
+    InputCommand.QUICK_SAVE: (arcade.key.F5,),
+    InputCommand.QUICK_LOAD: (arcade.key.F9,),
+}
+
+
+class KeyMap:
+    """Command-to-keys bindings and the lookup tables compiled from them"""
+
+    def __init__(self, bindings=None):
+        """
+        Initialize a key map
+
+        Args:
+            bindings: Dict of InputCommand to key codes (defaults to DEFAULT_KEY_BINDINGS)
+        """
+        source = bindings if bindings is not None else DEFAULT_KEY_BINDINGS
+        self.bindings = {command: tuple(keys) for command, keys in source.items()}
+        self.held_bits = {}   # key -> OR of the held-command bits it sets
+        self.actions = {}     # key -> one-shot InputCommand
+        self.compile()
+
+    def compile(self):
+        """Build the lookup tables from the bindings"""
+        held_bits = {}
+        actions = {}
+        for command, keys in self.bindings.items():
+            bit = HELD_COMMAND_BITS.get(command)
+            for key in keys:
+                if bit is not None:
+                    held_bits[key] = held_bits.get(key, 0) | bit
+                elif key in actions:
+                    print(f"Warning: Key {key} is bound to both {actions[key]} and {command}, keeping {actions[key]}")
+                else:
+                    actions[key] = command
+        self.held_bits = held_bits
+        self.actions = actions
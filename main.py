@@ -14,23 +14,37 @@ Simple space game with clean system architecture
 # - Common methods: arcade.load_texture(), arcade.play_sound(), arcade.run()
 # Docs: https://api.arcade.academy/en/stable/
 
+import argparse
+
 import arcade
 
-from audio.audio_engine import AudioEngine
-from core.game_loop import GameLoop
+from core import startup_profiler
+from core.loading_view import LoadingView
 from core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE
 
 
+def make_game_view(window, new_game=False):
+    """Build the game loop - its modules are imported here, after the loading screen is up"""
+    from core.game_loop import GameLoop
+    return GameLoop(window, new_game=new_game)
+
+
 def main():
     """Main function to start the game"""
+    startup_profiler.mark(startup_profiler.PHASE_IMPORTS)
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    parser.add_argument("--new-game", action="store_true",
+                        help="Start a new world, deleting the stored sectors")
+    args = parser.parse_args()
+
     arcade.load_font("assets/fonts/EveSansNeue-Regular.otf")
-    AudioEngine.get_instance()
 
     window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
-    game_loop = GameLoop(window)
+    startup_profiler.mark(startup_profiler.PHASE_WINDOW)
     
-    # Set the game loop as the window's view
-    window.show_view(game_loop)
+    # Load every asset (and start the audio engine) behind a progress screen,
+    # then switch to the game loop
+    window.show_view(LoadingView(window, lambda: make_game_view(window, args.new_game)))
     
     arcade.run()
 
@@ -5,6 +5,7 @@ Asteroid Renderer - handles rendering of asteroid entities
 import arcade
 
 
+from core.texture_cache import get_image_size, get_texture_for_size
 from rendering.base_renderer import BaseRenderer
 from game_state.inventory_types import ORE_NAMES
 
@@ -25,8 +26,9 @@ class AsteroidRenderer(BaseRenderer):
     TEXT_COLOR = arcade.color.Color(255, 255, 255, 128)
     
     def __init__(self, asteroid_entity):
-        """Initialize the asteroid renderer and load all asteroid textures"""
-        self.asteroid_textures = {}
+        """Initialize the asteroid renderer and look up the asteroid image sizes"""
+        self.asteroid_sizes = {}
+        self._drawn_textures = {}  # (asteroid type, scale) -> (texture, width, height)
         self._load_textures()
         self.active_effects = []
         self.item_textures = {}  # Cache for loaded item textures
@@ -34,14 +36,26 @@ class AsteroidRenderer(BaseRenderer):
         # Connect to asteroid's inventory signals
 
     def _load_textures(self):
-        """Load all asteroid textures"""
+        """Look up the full size of every asteroid image - the texture drawn depends on the scale"""
         for i in range(1, 7):  # asteroid1.png through asteroid6.png
             try:
-                texture = arcade.load_texture(f"assets/asteroid{i}.png")
-                self.asteroid_textures[i] = texture
+                self.asteroid_sizes[i] = get_image_size(f"assets/asteroid{i}.png")
             except FileNotFoundError:
                 print(f"Warning: Could not load assets/asteroid{i}.png")
-                self.asteroid_textures[i] = None
+                self.asteroid_sizes[i] = None
+
+    def _get_drawn_texture(self, asteroid):
+        """Get the smallest texture covering an asteroid's drawn size, with that size"""
+        key = (asteroid.asteroid_type, asteroid.scale)
+        drawn = self._drawn_textures.get(key)
+        if drawn is None:
+            width, height = self.asteroid_sizes[asteroid.asteroid_type]
+            # Calculate the actual size based on the full image size and scale
+            actual_width = width * asteroid.scale
+            actual_height = height * asteroid.scale
+            texture = get_texture_for_size(f"assets/asteroid{asteroid.asteroid_type}.png", actual_width, actual_height)
+            drawn = self._drawn_textures[key] = (texture, actual_width, actual_height)
+        return drawn
     
     def render_local(self, asteroid, transform):
         """Render an asteroid entity in local coordinates"""
@@ -49,10 +63,7 @@ class AsteroidRenderer(BaseRenderer):
             return
             
         # Try to render with texture first
-        texture = self.asteroid_textures.get(asteroid.asteroid_type)
-        # Calculate the actual size based on the texture size and scale
-        actual_width = texture.width * asteroid.scale
-        actual_height = texture.height * asteroid.scale
+        texture, actual_width, actual_height = self._get_drawn_texture(asteroid)
 
         # Draw the texture at the entity's world position with subtle rotation
         arcade.draw_texture_rect(
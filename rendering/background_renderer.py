@@ -4,6 +4,7 @@ Background Renderer - handles background image rendering
 
 import arcade
 from core.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from core.texture_cache import get_texture
 
 
 class BackgroundRenderer:
@@ -17,7 +18,7 @@ class BackgroundRenderer:
         """Initialize background renderer resources"""
         # Load background texture
         try:
-            self.background_texture = arcade.load_texture("assets/background.png")
+            self.background_texture = get_texture("assets/background.png")
         except FileNotFoundError:
             print("Warning: Background texture not found at assets/background.png")
             self.background_texture = None
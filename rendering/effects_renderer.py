@@ -6,7 +6,9 @@ import arcade
 import random
 import math
 from core.constants import *
+from core.texture_cache import get_texture
 from game_state.inventory_types import INVENTORY_ICONS
+from entities.base_module import STATE_ACTIVE
 
 # Laser beam visual effect constants
 LASER_BEAM_COLOR = (255, 140, 0)  # Bright orange RGB
@@ -45,7 +47,7 @@ class MinedItemEffect:
         # Load texture if not already cached
         if item_type not in self.textures:
             texture_path = INVENTORY_ICONS[item_type]
-            self.textures[item_type] = arcade.load_texture(texture_path)
+            self.textures[item_type] = get_texture(texture_path)
             
         self.active_effects.append({
             'item_type': item_type,
@@ -104,7 +106,7 @@ class MiningLaserRenderer:
         # Find active mining laser modules and render their effects
         for i, module in enumerate(player_entity.modules):
             if (isinstance(module, MiningLaserModule) and 
-                module.state == "active" and 
+                module.state == STATE_ACTIVE and 
                 module.current_target is not None):
                 # Get module position from the ship
                 module_x, module_y = player_entity.get_module_position(i)
@@ -1,4 +1,5 @@
 import arcade
+from core.texture_cache import get_texture
 from game_state.inventory_types import INVENTORY_ICONS, HitType
 from game_state.game_events import on_asteroid_mined
 
@@ -86,7 +87,7 @@ class MinedItemEffectManager:
         if item_type not in self.item_textures:
             try:
                 texture_path = INVENTORY_ICONS[item_type]
-                self.item_textures[item_type] = arcade.load_texture(texture_path)
+                self.item_textures[item_type] = get_texture(texture_path)
             except (KeyError, FileNotFoundError) as e:
                 print(f"Warning: Could not load texture for {item_type}: {e}")
                 return  # Skip adding effect if texture is missing
@@ -102,7 +103,7 @@ class MinedItemEffectManager:
         )
         self.active_effects.append(effect)
 
-    def on_asteroid_mined(self, asteroid_entity, amount, hit_type: HitType = HitType.NORMAL):
+    def on_asteroid_mined(self, asteroid_entity, amount, hit_type: HitType = HitType.NORMAL, **kwargs):
         """Handle the asteroid mined event"""
         # Position effect above the asteroid, accounting for its radius
         y_offset = asteroid_entity.get_collision_radius() + ITEM_POPUP_OFFSET
@@ -3,6 +3,7 @@ Mobile Depot Renderer - Handles rendering of mobile depot entities
 """
 
 import arcade
+from core.texture_cache import get_texture, get_texture_for_size
 from rendering.base_renderer import BaseRenderer
 import math
 import random
@@ -36,7 +37,8 @@ class MobileDepotRenderer(BaseRenderer):
     def _load_textures(self):
         """Load the mobile depot texture"""
         try:
-            self.texture = arcade.load_texture("assets/mobile_depot.png")
+            # Drawn at twice the size of the current square
+            self.texture = get_texture_for_size("assets/mobile_depot.png", self.size * 2, self.size * 2)
         except FileNotFoundError:
             print("Warning: Could not load assets/mobile_depot.png")
             self.texture = None
@@ -111,7 +113,7 @@ class MobileDepotRenderer(BaseRenderer):
         """Spew out item icons when items are transferred"""
         # Load the item icon texture
         try:
-            icon_texture = arcade.load_texture(f"assets/icons/types/{item_type.name.lower()}.png")
+            icon_texture = get_texture(f"assets/icons/types/{item_type.name.lower()}.png")
         except FileNotFoundError:
             print(f"Warning: Could not load icon for {item_type}")
             return
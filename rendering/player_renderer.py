@@ -6,6 +6,7 @@ import arcade
 import math
 from rendering.base_renderer import BaseRenderer, CoordinateTransform
 from core.constants import *
+from core.texture_cache import get_image_size, get_texture_for_size
 
 # Player Rendering Constants - Easy to tune
 TEXTURE_SCALE = 0.5            # Scale factor for spaceship texture
@@ -21,12 +22,17 @@ class PlayerRenderer(BaseRenderer):
     def __init__(self):
         """Initialize the player renderer"""
         self.spaceship_texture = None
+        self.ship_width = 0
+        self.ship_height = 0
         self._load_textures()
     
     def _load_textures(self):
         """Load the spaceship texture"""
         try:
-            self.spaceship_texture = arcade.load_texture("assets/spaceship.png")
+            width, height = get_image_size("assets/spaceship.png")
+            self.ship_width = width * TEXTURE_SCALE
+            self.ship_height = height * TEXTURE_SCALE
+            self.spaceship_texture = get_texture_for_size("assets/spaceship.png", self.ship_width, self.ship_height)
         except FileNotFoundError:
             print("Warning: Could not load assets/spaceship.png")
             self.spaceship_texture = None
@@ -47,9 +53,7 @@ class PlayerRenderer(BaseRenderer):
             # Add 90 degrees to correct the texture orientation (90° clockwise)
             arcade.draw_texture_rect(
                 self.spaceship_texture,
-                arcade.XYWH(entity.x, entity.y, 
-                           self.spaceship_texture.width * TEXTURE_SCALE, 
-                           self.spaceship_texture.height * TEXTURE_SCALE),
+                arcade.XYWH(entity.x, entity.y, self.ship_width, self.ship_height),
                 angle=90 -entity.rotation,
             )
         else:
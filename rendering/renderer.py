@@ -13,6 +13,7 @@ from rendering.asteroid_renderer import AsteroidRenderer
 from rendering.background_renderer import BackgroundRenderer
 from rendering.effects_renderer import EffectsRenderer
 from rendering.mobile_depot_renderer import MobileDepotRenderer
+from rendering.selection_renderer import SelectionRenderer
 from ui.ui_renderer import UIRenderer
 from rendering.mined_item_effect_manager import MinedItemEffectManager
 
@@ -27,6 +28,7 @@ class Renderer:
         self.asteroid_renderers = {}  # Map of asteroid entities to their renderers
         self.mobile_depot_renderers = {}  # Map of mobile depot entities to their renderers
         self.effects_renderer = EffectsRenderer()
+        self.selection_renderer = SelectionRenderer()
         self.ui_renderer = UIRenderer(game_state=game_state)
         self.mined_item_effect_manager = MinedItemEffectManager()
         
@@ -42,6 +44,7 @@ class Renderer:
         
         # Then render all entities
         self._render_entities(game_state)
+        self.selection_renderer.render(game_state)
         
         # Render effects between entities
         self.effects_renderer.render_effects(game_state)
@@ -64,6 +67,31 @@ class Renderer:
         """
         return self.ui_renderer.handle_mouse_click(x, y, game_state)
 
+    def handle_mouse_motion(self, x, y):
+        """
+        Handle mouse motion events
+        
+        Args:
+            x, y: Mouse position
+            
+        Returns:
+            bool: True if the mouse is over UI
+        """
+        return self.ui_renderer.handle_mouse_motion(x, y)
+
+    def handle_mouse_scroll(self, x, y, scroll_y):
+        """
+        Handle mouse wheel events
+        
+        Args:
+            x, y: Mouse position
+            scroll_y: Wheel movement
+            
+        Returns:
+            bool: True if the mouse is over UI
+        """
+        return self.ui_renderer.handle_mouse_scroll(x, y, scroll_y)
+
     def _render_entities(self, game_state):
         """Render all entities using their specific renderers"""
         for entity in game_state.entities:
@@ -0,0 +1,35 @@
+"""
+Selection Renderer - outlines the hovered and selected entities
+"""
+
+import arcade
+
+# Selection Rendering Constants - Easy to tune
+SELECTION_COLOR = (255, 255, 255, 160)   # Ring around the selected entity
+HOVER_COLOR = (255, 255, 255, 60)        # Ring around the entity under the mouse
+SELECTION_RING_WIDTH = 2
+SELECTION_RING_PADDING = 8               # Gap between the collision radius and the ring
+
+
+class SelectionRenderer:
+    """Draws a ring around the hovered and the selected entity"""
+
+    def render(self, game_state):
+        """
+        Render the selection rings
+
+        Args:
+            game_state: Current game state
+        """
+        selected = game_state.selected_entity
+        hovered = game_state.hovered_entity
+        if hovered is not None and hovered is not selected:
+            self._draw_ring(hovered, HOVER_COLOR)
+        if selected is not None:
+            self._draw_ring(selected, SELECTION_COLOR)
+
+    @staticmethod
+    def _draw_ring(entity, color):
+        """Draw a ring just outside an entity's collision radius"""
+        arcade.draw_circle_outline(entity.x, entity.y, entity.get_collision_radius() + SELECTION_RING_PADDING,
+                                   color, SELECTION_RING_WIDTH)
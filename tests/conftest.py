@@ -0,0 +1,30 @@
+"""
+Test configuration - run every test headless from the repository root
+
+Asset and save paths are relative to the repository root, the same as when
+the game is started with `python main.py`.
+"""
+
+import os
+
+import pytest
+
+# No sound card is needed to run the tests
+os.environ.setdefault("VSG_AUDIO_BACKEND", "null")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def repo_cwd(monkeypatch):
+    """Resolve relative asset paths against the repository root"""
+    monkeypatch.chdir(REPO_ROOT)
+
+
+@pytest.fixture
+def game_state():
+    """A new game with the player, a depot and the initial asteroids"""
+    from game_state.state_manager import StateManager
+    state_manager = StateManager()
+    state_manager._setup_initial_state()
+    return state_manager.game_state
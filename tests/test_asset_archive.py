@@ -0,0 +1,81 @@
+"""
+Asset Archive tests - packed reads, loose-file fallback and VSG_LOOSE_ASSETS
+"""
+
+import os
+
+import pytest
+
+from core import asset_archive
+from core.asset_archive import ASSET_ARCHIVE_PATH, LOOSE_ASSETS_ENV, asset_fingerprint, open_asset, read_asset
+from tools.pack_assets import pack
+
+
+@pytest.fixture
+def assets(tmp_path, monkeypatch):
+    """Working directory with two loose assets, both packed into an archive"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(LOOSE_ASSETS_ENV, raising=False)
+    monkeypatch.setattr(asset_archive, "_archive", None)
+    monkeypatch.setattr(asset_archive, "_archive_checked", False)
+    os.mkdir("assets")
+    for name, data in (("a.bin", b"packed a"), ("b.bin", b"packed b" * 100)):
+        with open(f"assets/{name}", "wb") as asset_file:
+            asset_file.write(data)
+    pack(["assets/a.bin", "assets/b.bin"])
+    return tmp_path
+
+
+def _edit_after_packing(path, data):
+    """Rewrite a loose file with a modification time later than the archive"""
+    with open(path, "wb") as asset_file:
+        asset_file.write(data)
+    archive_mtime = os.stat(ASSET_ARCHIVE_PATH).st_mtime_ns
+    os.utime(path, ns=(archive_mtime + 10**9, archive_mtime + 10**9))
+
+
+def test_packed_asset_is_read_from_the_archive(assets):
+    os.remove("assets/a.bin")
+
+    assert bytes(read_asset("assets/a.bin")) == b"packed a"
+    assert bytes(read_asset("assets/b.bin")) == b"packed b" * 100
+
+
+def test_unpacked_asset_falls_back_to_the_loose_file(assets):
+    with open("assets/c.bin", "wb") as asset_file:
+        asset_file.write(b"loose c")
+
+    assert bytes(read_asset("assets/c.bin")) == b"loose c"
+    with pytest.raises(FileNotFoundError):
+        read_asset("assets/missing.bin")
+
+
+def test_open_asset_reads_and_seeks(assets):
+    with open_asset("assets/b.bin") as asset_file:
+        assert asset_file.read(6) == b"packed"
+        asset_file.seek(-8, os.SEEK_END)
+        assert asset_file.read() == b"packed b"
+
+
+def test_edited_loose_file_is_ignored_without_the_flag(assets):
+    _edit_after_packing("assets/a.bin", b"edited a")
+
+    assert bytes(read_asset("assets/a.bin")) == b"packed a"
+    assert asset_archive.get_archive().stale == frozenset()
+
+
+def test_edited_loose_file_wins_with_the_flag(assets, monkeypatch):
+    monkeypatch.setenv(LOOSE_ASSETS_ENV, "1")
+    _edit_after_packing("assets/a.bin", b"edited a")
+
+    assert bytes(read_asset("assets/a.bin")) == b"edited a"
+    assert bytes(read_asset("assets/b.bin")) == b"packed b" * 100
+    assert asset_fingerprint("assets/a.bin").endswith(f":{len(b'edited a')}:{os.stat('assets/a.bin').st_mtime_ns}")
+
+
+def test_invalid_archive_is_ignored(assets):
+    with open(ASSET_ARCHIVE_PATH, "wb") as archive_file:
+        archive_file.write(b"garbage archive contents")
+
+    assert asset_archive.get_archive() is None
+    assert bytes(read_asset("assets/a.bin")) == b"packed a"
@@ -0,0 +1,149 @@
+"""
+Change Journal tests - frame CRC checks, replay and incremental autosave
+"""
+
+import random
+
+import pytest
+
+from game_state import autosave as autosave_module
+from game_state.autosave import AutosaveService
+from game_state.change_journal import encode_frame, journal_header, journal_path, replay_journal
+from game_state.save_game import capture_snapshot, load_game, write_snapshot
+
+
+def _write_base_save(game_state, path, generation=1):
+    """Write a save that a journal of the given generation continues"""
+    snapshot = capture_snapshot(game_state)
+    snapshot.generation = generation
+    write_snapshot(snapshot, path)
+
+
+def _write_journal(path, generation, *frames):
+    with open(journal_path(path, generation), "wb") as journal_file:
+        journal_file.write(journal_header(generation) + b"".join(frames))
+
+
+def test_frames_are_replayed_in_order(game_state, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    _write_base_save(game_state, path)
+    player = game_state.player_entity
+    player.x = 10.0
+    first = encode_frame(1.0, 1, [player])
+    player.x = 20.0
+    second = encode_frame(2.0, 2, [player])
+    _write_journal(path, 1, first, second)
+
+    loaded = load_game(path)
+
+    assert loaded.player_entity.x == 20.0
+    assert (loaded.game_time, loaded.score) == (2.0, 2)
+
+
+def test_replay_stops_at_crc_mismatch(game_state, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    _write_base_save(game_state, path)
+    player = game_state.player_entity
+    player.x = 10.0
+    good = encode_frame(1.0, 1, [player])
+    player.x = 20.0
+    damaged = bytearray(encode_frame(2.0, 2, [player]))
+    damaged[-1] ^= 0xFF
+    _write_journal(path, 1, good, bytes(damaged))
+
+    loaded = load_game(path)
+
+    assert loaded.player_entity.x == 10.0
+    assert (loaded.game_time, loaded.score) == (1.0, 1)
+
+
+def test_torn_final_frame_is_ignored(game_state, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    _write_base_save(game_state, path)
+    player = game_state.player_entity
+    player.x = 10.0
+    good = encode_frame(1.0, 1, [player])
+    torn = encode_frame(2.0, 2, [player])[:-3]
+    _write_journal(path, 1, good, torn)
+
+    loaded = load_game(path)
+
+    assert (loaded.game_time, loaded.score) == (1.0, 1)
+
+
+def test_journal_of_another_generation_is_ignored(game_state, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    _write_base_save(game_state, path, generation=2)
+    journal_file = journal_path(path, 2)
+    with open(journal_file, "wb") as f:
+        f.write(journal_header(1) + encode_frame(5.0, 5, []))
+
+    assert replay_journal(journal_file, load_game(path), 2) == 0
+
+
+def test_rng_state_is_restored(game_state, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    _write_base_save(game_state, path)
+    random.seed(1234)
+    state = random.getstate()
+    _write_journal(path, 1, encode_frame(1.0, 0, [], state))
+    expected = [random.random() for _ in range(5)]
+
+    random.seed(0)
+    load_game(path)
+
+    assert [random.random() for _ in range(5)] == expected
+
+
+@pytest.fixture
+def autosave(game_state, tmp_path):
+    """Journaling autosave that only makes the first full save on its own"""
+    service = AutosaveService(game_state, str(tmp_path / "auto.vsg"), interval=1000,
+                              frame_budget_ms=5, journal_interval=1.0)
+    yield service
+    service.close()
+
+
+def test_idle_session_replays_to_the_live_game_time(game_state, autosave):
+    # Nothing changes but the clock - the journal must still move the game time on
+    for asteroid in game_state.get_asteroids():
+        asteroid.rotation_speed = 0.0
+    autosave.tick()
+    for _ in range(100):
+        game_state.game_time += 0.1
+        autosave.tick()
+    autosave.close()
+
+    loaded = load_game(autosave.path)
+
+    assert loaded.game_time == pytest.approx(game_state.game_time)
+    assert loaded.score == game_state.score
+
+
+def test_changes_since_the_last_flush_are_written_on_close(game_state, autosave):
+    autosave.tick()
+    game_state.game_time += 0.2
+    game_state.player_entity.x = 555.0
+    game_state.player_entity.mark_dirty()
+    game_state.score = 3
+    autosave.tick()  # Before the next flush is due
+    autosave.close()
+
+    loaded = load_game(autosave.path)
+
+    assert loaded.player_entity.x == 555.0
+    assert loaded.score == 3
+
+
+def test_unchanged_flush_writes_no_frame(game_state, autosave, monkeypatch):
+    autosave.tick()
+    autosave.flush_journal()
+    frames = []
+    monkeypatch.setattr(autosave_module, "encode_frame", lambda *args: frames.append(args) or b"")
+
+    autosave.flush_journal()
+    assert frames == []
+
+    game_state.game_time += 0.5
+    autosave.flush_journal()
+    assert len(frames) == 1
@@ -0,0 +1,118 @@
+"""
+Event Queue tests - ring buffer order and overflow, and stale input handling
+"""
+
+import time
+
+import pytest
+
+from game_state.state_manager import StateManager
+from input.commands import InputCommand
+from input.event_queue import INPUT_EVENT_MAX_AGE, EventQueue
+from input.input_system import InputFrame
+
+
+def test_events_come_out_oldest_first():
+    events = EventQueue(4)
+    for index, command in enumerate([InputCommand.SHOOT, InputCommand.QUICK_SAVE, InputCommand.SHOOT]):
+        events.push(command, float(index))
+
+    taken = []
+    while events:
+        taken.append((events.peek_timestamp(), events.pop()))
+
+    assert taken == [(0.0, InputCommand.SHOOT), (1.0, InputCommand.QUICK_SAVE), (2.0, InputCommand.SHOOT)]
+    assert events.pop() is None
+    assert events.peek_timestamp() is None
+
+
+def test_ring_buffer_wraps_around():
+    events = EventQueue(3)
+    for round_index in range(5):
+        for offset in range(3):
+            assert events.push(round_index * 3 + offset, float(offset))
+        assert [events.pop() for _ in range(3)] == [round_index * 3 + offset for offset in range(3)]
+    assert len(events) == 0
+
+
+def test_full_queue_drops_newer_events():
+    events = EventQueue(2)
+    assert events.push("a", 0.0)
+    assert events.push("b", 1.0)
+
+    assert not events.push("c", 2.0)
+
+    assert events.dropped_count == 1
+    assert [events.pop(), events.pop()] == ["a", "b"]
+
+
+def test_clear_drops_everything():
+    events = EventQueue(4)
+    events.push("a", 0.0)
+    events.push("b", 1.0)
+
+    events.clear()
+
+    assert len(events) == 0
+    assert events.commands == [None] * 4
+
+
+@pytest.fixture
+def state_manager():
+    """State manager whose one-shot handlers only record what ran"""
+    manager = StateManager()
+    manager._setup_initial_state()
+    manager.handled = []
+    for command in list(manager.command_handlers):
+        manager.command_handlers[command] = lambda command=command: manager.handled.append(command)
+    return manager
+
+
+def test_fresh_events_are_run(state_manager):
+    frame = InputFrame(EventQueue())
+    now = time.perf_counter()
+    frame.events.push(InputCommand.SHOOT, now)
+    frame.events.push(InputCommand.QUICK_SAVE, now)
+
+    state_manager._process_input_commands(frame, 0.0)
+
+    assert state_manager.handled == [InputCommand.SHOOT, InputCommand.QUICK_SAVE]
+    assert state_manager.stale_input_count == 0
+    assert len(frame.events) == 0
+
+
+def test_events_older_than_max_age_are_skipped(state_manager):
+    frame = InputFrame(EventQueue())
+    now = time.perf_counter()
+    frame.events.push(InputCommand.SHOOT, now - INPUT_EVENT_MAX_AGE - 1.0)
+    frame.events.push(InputCommand.QUICK_SAVE, now)
+
+    state_manager._process_input_commands(frame, 0.0)
+
+    assert state_manager.handled == [InputCommand.QUICK_SAVE]
+    assert state_manager.stale_input_count == 1
+
+
+def test_events_from_before_a_load_are_skipped(state_manager):
+    frame = InputFrame(EventQueue())
+    frame.events.push(InputCommand.SHOOT, time.perf_counter())
+    state_manager.input_cutoff = time.perf_counter()
+    frame.events.push(InputCommand.QUICK_SAVE, time.perf_counter())
+
+    state_manager._process_input_commands(frame, 0.0)
+
+    assert state_manager.handled == [InputCommand.QUICK_SAVE]
+    assert state_manager.stale_input_count == 1
+
+
+def test_successful_load_invalidates_queued_events(state_manager, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    assert state_manager.save_game(path)
+    frame = InputFrame(EventQueue())
+    frame.events.push(InputCommand.SHOOT, time.perf_counter())
+
+    assert state_manager.load_game(path)
+    state_manager._process_input_commands(frame, 0.0)
+
+    assert state_manager.handled == []
+    assert state_manager.stale_input_count == 1
@@ -0,0 +1,142 @@
+"""
+Save Game tests - binary save round-trip and journal replay on load
+"""
+
+import struct
+import zlib
+
+import pytest
+
+from entities.mobile_depot import MobileDepot
+from game_state.change_journal import _FRAME_HEADER, _FRAME_META, encode_frame, journal_header, journal_path
+from game_state.game_state import GameState
+from game_state.inventory_types import InventoryType
+from game_state.save_game import SaveFormatError, capture_snapshot, load_game, save_game, write_snapshot
+
+
+def _asteroid_fields(asteroid):
+    """Values of an asteroid that a save has to keep"""
+    return (asteroid.x, asteroid.y, asteroid.scale, asteroid.rotation, asteroid.rotation_speed,
+            asteroid.asteroid_type, asteroid.ore_type, asteroid.inventory.get_all_items(),
+            asteroid.inventory.max_units)
+
+
+def _by_id(entities):
+    """Map entities by id"""
+    return {entity.entity_id: entity for entity in entities}
+
+
+def _write_base_save(game_state, path, generation=1):
+    """Write a save that a journal of the given generation continues"""
+    snapshot = capture_snapshot(game_state)
+    snapshot.generation = generation
+    write_snapshot(snapshot, path)
+
+
+def test_round_trip_restores_every_entity(game_state, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    player = game_state.player_entity
+    player.x, player.y = 321.5, -42.25
+    player.inventory.add_item(InventoryType.VELDSPAR, 17)
+    depot = game_state.get_entities_by_type(MobileDepot)[0]
+    depot.inventory.add_item(InventoryType.SCORDITE, 5)
+    game_state.game_time = 12.5
+    game_state.score = 99
+
+    save_game(game_state, path)
+    loaded = load_game(path)
+
+    assert loaded.game_time == 12.5
+    assert loaded.score == 99
+    assert len(loaded.entities) == len(game_state.entities)
+
+    loaded_player = loaded.player_entity
+    assert (loaded_player.x, loaded_player.y) == (321.5, -42.25)
+    assert loaded_player.inventory.get_all_items() == {InventoryType.VELDSPAR: 17}
+    assert len(loaded_player.modules) == len(player.modules)
+
+    loaded_depot = loaded.get_entities_by_type(MobileDepot)[0]
+    assert loaded_depot.inventory.get_all_items() == {InventoryType.SCORDITE: 5}
+
+    asteroids = _by_id(game_state.get_asteroids())
+    loaded_asteroids = _by_id(loaded.get_asteroids())
+    assert loaded_asteroids.keys() == asteroids.keys()
+    for entity_id, asteroid in asteroids.items():
+        loaded_asteroid = loaded_asteroids[entity_id]
+        assert _asteroid_fields(loaded_asteroid) == pytest.approx(_asteroid_fields(asteroid))
+        assert loaded_asteroid.get_collision_radius() == pytest.approx(asteroid.get_collision_radius())
+
+
+def test_loaded_asteroids_can_be_picked(game_state, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    save_game(game_state, path)
+    loaded = load_game(path)
+
+    for asteroid in loaded.get_asteroids():
+        assert loaded.pick_entity(asteroid.x, asteroid.y) is not None
+
+
+def test_save_loads_into_existing_game_state(game_state, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    game_state.score = 7
+    save_game(game_state, path)
+
+    target = GameState()
+    assert load_game(path, target) is target
+    assert target.score == 7
+    assert len(target.get_asteroids()) == len(game_state.get_asteroids())
+
+
+def test_invalid_save_leaves_game_state_untouched(game_state, tmp_path):
+    path = tmp_path / "save.vsg"
+    path.write_bytes(b"not a save file at all")
+    entity_count = len(game_state.entities)
+
+    with pytest.raises(SaveFormatError):
+        load_game(str(path), game_state)
+    assert len(game_state.entities) == entity_count
+
+
+def test_truncated_save_is_rejected(game_state, tmp_path):
+    path = tmp_path / "save.vsg"
+    save_game(game_state, str(path))
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+
+    with pytest.raises(SaveFormatError):
+        load_game(str(path))
+
+
+def test_journal_is_replayed_on_load(game_state, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    _write_base_save(game_state, path)
+    player = game_state.player_entity
+    player.x = 123.0
+    player.inventory.add_item(InventoryType.PYROXERES, 3)
+    with open(journal_path(path, 1), "wb") as journal_file:
+        journal_file.write(journal_header(1) + encode_frame(5.0, 7, [player]))
+
+    loaded = load_game(path)
+
+    assert loaded.player_entity.x == 123.0
+    assert loaded.player_entity.inventory.get_all_items() == {InventoryType.PYROXERES: 3}
+    assert (loaded.game_time, loaded.score) == (5.0, 7)
+
+
+def test_unreadable_journal_frame_does_not_fail_the_load(game_state, tmp_path):
+    path = str(tmp_path / "save.vsg")
+    _write_base_save(game_state, path)
+    player = game_state.player_entity
+    player.x = 123.0
+    good = encode_frame(5.0, 7, [player])
+    # Passes the CRC, but holds a record kind that does not exist
+    payload = _FRAME_META.pack(6.0, 8, 1) + struct.pack("<BI", 99, 1)
+    bad = _FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+    with open(journal_path(path, 1), "wb") as journal_file:
+        journal_file.write(journal_header(1) + good + bad)
+
+    loaded = load_game(path)
+
+    assert loaded.player_entity.x == 123.0
+    assert (loaded.game_time, loaded.score) == (5.0, 7)
+    assert len(loaded.entities) == len(game_state.entities)
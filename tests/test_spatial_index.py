@@ -0,0 +1,133 @@
+"""
+Spatial Index tests - picking from per-cell and bulk-added entities
+"""
+
+import math
+import random
+
+import pytest
+
+from game_state.spatial_index import SpatialIndex
+
+
+class FakeEntity:
+    """Pickable circle"""
+
+    PICKABLE = True
+
+    def __init__(self, x, y, radius):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.active = True
+
+    def get_collision_radius(self):
+        return self.radius
+
+
+class Scenery(FakeEntity):
+    PICKABLE = False
+
+
+def _random_entities(count, seed=3):
+    rng = random.Random(seed)
+    return [FakeEntity(rng.uniform(-2000, 2000), rng.uniform(-2000, 2000), rng.uniform(5, 300))
+            for _ in range(count)]
+
+
+def _brute_force_pick(entities, x, y):
+    """Reference pick: nearest active center among the circles containing the point"""
+    best, best_distance = None, math.inf
+    for entity in entities:
+        distance = (entity.x - x) ** 2 + (entity.y - y) ** 2
+        if entity.active and distance <= entity.radius ** 2 and distance < best_distance:
+            best, best_distance = entity, distance
+    return best
+
+
+def _bulk_insert(index, entities):
+    index.insert_many(entities, [e.x for e in entities], [e.y for e in entities], [e.radius for e in entities])
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_pick_matches_brute_force(bulk):
+    entities = _random_entities(400)
+    index = SpatialIndex(cell_size=128)
+    if bulk:
+        _bulk_insert(index, entities)
+    else:
+        for entity in entities:
+            index.insert(entity)
+
+    rng = random.Random(11)
+    for _ in range(2000):
+        x, y = rng.uniform(-2300, 2300), rng.uniform(-2300, 2300)
+        assert index.pick(x, y) is _brute_force_pick(entities, x, y)
+
+
+def test_pick_merges_both_storages():
+    entities = _random_entities(300)
+    index = SpatialIndex(cell_size=128)
+    _bulk_insert(index, entities[:150])
+    for entity in entities[150:]:
+        index.insert(entity)
+    assert len(index) == 300
+
+    rng = random.Random(5)
+    for _ in range(2000):
+        x, y = rng.uniform(-2300, 2300), rng.uniform(-2300, 2300)
+        assert index.pick(x, y) is _brute_force_pick(entities, x, y)
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_removed_entity_is_not_picked(bulk):
+    entity = FakeEntity(-10.0, 20.0, 50.0)
+    index = SpatialIndex()
+    if bulk:
+        _bulk_insert(index, [entity])
+    else:
+        index.insert(entity)
+    assert index.pick(-10.0, 20.0) is entity
+
+    index.remove(entity)
+    index.remove(entity)
+
+    assert entity not in index
+    assert len(index) == 0
+    assert index.pick(-10.0, 20.0) is None
+
+
+def test_inactive_entity_is_not_picked():
+    entity = FakeEntity(0.0, 0.0, 50.0)
+    index = SpatialIndex()
+    _bulk_insert(index, [entity])
+
+    entity.active = False
+
+    assert index.pick(0.0, 0.0) is None
+
+
+def test_only_pickable_entities_are_added():
+    index = SpatialIndex()
+    scenery = Scenery(0.0, 0.0, 50.0)
+    entity = FakeEntity(0.0, 0.0, 50.0)
+
+    index.insert(scenery)
+    index.insert(entity)
+    index.insert(entity)
+
+    assert scenery not in index
+    assert len(index) == 1
+
+
+def test_clear_empties_the_index():
+    entities = _random_entities(20)
+    index = SpatialIndex()
+    _bulk_insert(index, entities[:10])
+    for entity in entities[10:]:
+        index.insert(entity)
+
+    index.clear()
+
+    assert len(index) == 0
+    assert all(index.pick(entity.x, entity.y) is None for entity in entities)
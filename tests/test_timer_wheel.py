@@ -0,0 +1,156 @@
+"""
+Timer Wheel tests - deadlines, ordering, cancelling and cascading
+"""
+
+import random
+
+import pytest
+
+from core.timer_wheel import WHEEL_LEVELS, WHEEL_SLOT_BITS, WHEEL_SLOTS, TimerWheel
+
+RESOLUTION = 0.1
+
+
+@pytest.fixture
+def wheel():
+    return TimerWheel(0.0, RESOLUTION)
+
+
+def test_timer_never_fires_early(wheel):
+    fired = []
+    wheel.schedule(1.05, fired.append, "a")
+
+    wheel.advance(1.0)
+    assert fired == []
+    wheel.advance(1.04)
+    assert fired == []
+    assert wheel.advance(1.1) == 1
+    assert fired == ["a"]
+
+
+def test_timer_fires_once(wheel):
+    fired = []
+    wheel.schedule(0.5, fired.append, "a")
+
+    wheel.advance(1.0)
+    wheel.advance(2.0)
+
+    assert fired == ["a"]
+    assert wheel.pending_timers() == []
+
+
+def test_timers_fire_in_deadline_order(wheel):
+    fired = []
+    deadlines = [3.3, 0.2, 7.9, 0.25, 1.0, 0.21]
+    for deadline in deadlines:
+        wheel.schedule(deadline, fired.append, deadline)
+
+    wheel.advance(10.0)
+
+    assert fired == sorted(deadlines)
+
+
+def test_cancelled_timer_does_not_fire(wheel):
+    fired = []
+    timer = wheel.schedule(1.0, fired.append, "a")
+    wheel.schedule(1.0, fired.append, "b")
+
+    timer.cancel()
+    wheel.advance(2.0)
+
+    assert fired == ["b"]
+
+
+def test_past_deadline_fires_on_next_advance(wheel):
+    wheel.advance(5.0)
+    fired = []
+    wheel.schedule(1.0, fired.append, "late")
+
+    wheel.advance(5.0)
+
+    assert fired == ["late"]
+
+
+def test_callback_can_schedule_a_due_timer(wheel):
+    fired = []
+
+    def first():
+        fired.append("first")
+        wheel.schedule(0.5, fired.append, "second")
+
+    wheel.schedule(0.3, first)
+    wheel.advance(1.0)
+
+    assert fired == ["first", "second"]
+
+
+@pytest.mark.parametrize("level", range(1, WHEEL_LEVELS))
+def test_far_timers_cascade_down(wheel, level):
+    fired = []
+    ticks = (1 << (WHEEL_SLOT_BITS * level)) + 3
+    deadline = ticks * RESOLUTION
+    wheel.schedule(deadline, fired.append, "far")
+
+    wheel.advance(deadline - RESOLUTION)
+    assert fired == []
+    wheel.advance(deadline)
+    assert fired == ["far"]
+
+
+def test_overflow_timer_moves_into_the_wheel():
+    span = WHEEL_SLOTS ** WHEEL_LEVELS
+    # Start just before the top level wraps, so the overflow is re-bucketed after a few ticks
+    wheel = TimerWheel((span - 10) * RESOLUTION, RESOLUTION)
+    fired = []
+    timer = wheel.schedule((2 * span - 5) * RESOLUTION, fired.append, "overflow")
+    assert wheel.overflow == [timer]
+
+    wheel.advance((span + 1) * RESOLUTION)
+
+    assert wheel.overflow == []
+    assert wheel.pending_timers() == [timer]
+    assert fired == []
+
+
+def test_random_timers_fire_at_their_deadlines():
+    rng = random.Random(7)
+    wheel = TimerWheel(0.0, 1.0 / 60.0)
+    deadlines = [rng.uniform(0.0, 200.0) for _ in range(500)]
+    fired_at = {}
+    for index, deadline in enumerate(deadlines):
+        wheel.schedule(deadline, lambda index=index: fired_at.setdefault(index, wheel.now))
+
+    now = 0.0
+    while now < 201.0:
+        now += rng.uniform(0.001, 0.5)
+        wheel.advance(now)
+
+    assert len(fired_at) == len(deadlines)
+    for index, deadline in enumerate(deadlines):
+        assert fired_at[index] >= deadline
+
+
+def test_reset_keeps_and_rebuckets_pending_timers(wheel):
+    fired = []
+    wheel.schedule(2.0, fired.append, "a")
+    wheel.schedule(50.0, fired.append, "b")
+
+    wheel.reset(10.0, keep_timers=True)
+    assert fired == []
+    wheel.advance(10.0)
+    assert fired == ["a"]
+    wheel.advance(49.9)
+    assert fired == ["a"]
+    wheel.advance(50.0)
+    assert fired == ["a", "b"]
+
+
+def test_reset_drops_timers_by_default(wheel):
+    fired = []
+    wheel.schedule(2.0, fired.append, "a")
+
+    wheel.reset(1.0)
+    wheel.advance(5.0)
+
+    assert fired == []
+    assert wheel.now == 5.0
@@ -0,0 +1,204 @@
+"""
+Voice Pool tests - handing out, reusing, stealing and merging voices
+
+pyo objects are replaced by fakes that only record calls, so no audio
+server is needed.
+"""
+
+import pytest
+
+from audio.voice_pool import STEAL_QUIETEST, VoicePool
+
+
+class FakePyoObject:
+    """Stands in for TableRead, SfPlayer and Pan"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args):
+            self.calls.append((name, args))
+        return record
+
+
+class FakeTable:
+    """Stands in for SndTable"""
+
+    def getRate(self):
+        return 1.0
+
+
+def make_pool(size, **kwargs):
+    """Voice pool whose voices already own fake players"""
+    pool = VoicePool(size, **kwargs)
+    for voice in pool.voices:
+        voice.player = FakePyoObject()
+        voice.streamer = FakePyoObject()
+        voice.panner = FakePyoObject()
+    return pool
+
+
+@pytest.fixture
+def table():
+    return FakeTable()
+
+
+def test_acquire_uses_free_voices_first(table):
+    pool = make_pool(3)
+
+    voices = [pool.acquire(table, f"sound{index}", 1.0, False, 1.0, now=index)[0] for index in range(3)]
+
+    assert len({voice.index for voice in voices}) == 3
+    assert len(pool.active_voices()) == 3
+    assert pool.stolen_count == 0
+
+
+def test_release_frees_the_voice(table):
+    pool = make_pool(1)
+    voice, generation, merged = pool.acquire(table, "laser", 1.0, False, 1.0, now=0.0)
+    assert not merged
+
+    assert pool.release(voice, generation)
+    assert not pool.is_playing("laser")
+    assert pool.active_voices() == []
+
+    again, _, _ = pool.acquire(table, "laser", 1.0, False, 1.0, now=1.0)
+    assert again is voice
+    assert pool.stolen_count == 0
+
+
+def test_stale_release_is_ignored(table):
+    pool = make_pool(1)
+    voice, old_generation, _ = pool.acquire(table, "laser", 1.0, False, 1.0, now=0.0)
+    # Reused by a newer sound before the old release arrives
+    _, new_generation, _ = pool.acquire(table, "explosion", 1.0, False, 1.0, now=1.0)
+
+    assert not pool.release(voice, old_generation)
+    assert pool.is_playing("explosion")
+    assert pool.release(voice, new_generation)
+
+
+def test_double_release_does_not_free_twice(table):
+    pool = make_pool(2)
+    voice, generation, _ = pool.acquire(table, "laser", 1.0, False, 1.0, now=0.0)
+
+    assert pool.release(voice, generation)
+    assert not pool.release(voice, generation)
+    assert len(pool._free) == 2
+
+
+def test_voice_is_reused_not_rebuilt(table):
+    pool = make_pool(1)
+    voice, generation, _ = pool.acquire(table, "laser", 1.0, False, 1.0, now=0.0)
+    player = voice.player
+    pool.release(voice, generation)
+
+    pool.acquire(table, "laser", 0.5, True, 2.0, now=1.0)
+
+    assert voice.player is player
+    assert ("setMul", (0.5,)) in player.calls
+    assert ("setFreq", (2.0,)) in player.calls
+
+
+def test_streamed_sound_uses_the_streamer():
+    pool = make_pool(1)
+
+    voice, _, _ = pool.acquire("assets/music.wav", "music", 1.0, True, 1.0, now=0.0)
+
+    assert voice.current is voice.streamer
+    assert ("setPath", ("assets/music.wav",)) in voice.streamer.calls
+
+
+def test_stop_all_frees_every_voice(table):
+    pool = make_pool(3)
+    for index in range(3):
+        pool.acquire(table, f"sound{index}", 1.0, False, 1.0, now=index)
+
+    pool.stop_all()
+
+    assert pool.active_voices() == []
+    assert len(pool._free) == 3
+
+
+def test_sound_limit_steals_the_oldest_voice_of_that_sound(table):
+    pool = make_pool(4, sound_limits={"laser": 2})
+    first, _, _ = pool.acquire(table, "laser", 1.0, False, 1.0, now=0.0)
+    pool.acquire(table, "laser", 1.0, False, 1.0, now=1.0)
+
+    stolen, _, _ = pool.acquire(table, "laser", 1.0, False, 1.0, now=2.0)
+
+    assert stolen is first
+    assert pool.stolen_count == 1
+    assert len(pool.active_voices()) == 2
+
+
+def test_full_pool_steals_from_any_sound(table):
+    pool = make_pool(2)
+    first, _, _ = pool.acquire(table, "laser", 1.0, False, 1.0, now=0.0)
+    pool.acquire(table, "explosion", 1.0, False, 1.0, now=1.0)
+
+    stolen, _, _ = pool.acquire(table, "alarm", 1.0, False, 1.0, now=2.0)
+
+    assert stolen is first
+    assert not pool.is_playing("laser")
+    assert len(pool.voices) == 2
+
+
+def test_quietest_policy_steals_the_quietest_voice(table):
+    pool = make_pool(3, steal_policy=STEAL_QUIETEST)
+    pool.acquire(table, "a", 0.8, False, 1.0, now=0.0)
+    quiet, _, _ = pool.acquire(table, "b", 0.2, False, 1.0, now=1.0)
+    pool.acquire(table, "c", 0.5, False, 1.0, now=2.0)
+
+    stolen, _, _ = pool.acquire(table, "d", 1.0, False, 1.0, now=3.0)
+
+    assert stolen is quiet
+
+
+def test_stolen_voice_ignores_its_old_release(table):
+    pool = make_pool(1)
+    voice, old_generation, _ = pool.acquire(table, "laser", 1.0, False, 1.0, now=0.0)
+    pool.acquire(table, "laser", 1.0, False, 1.0, now=1.0)
+
+    assert not pool.release(voice, old_generation)
+    assert pool.is_playing("laser")
+
+
+def test_trigger_within_merge_window_is_merged(table):
+    pool = make_pool(4, merge_window=0.05, max_merged_volume=2.0)
+    voice, generation, _ = pool.acquire(table, "laser", 0.6, False, 1.0, now=0.0)
+
+    merged_voice, merged_generation, merged = pool.acquire(table, "laser", 0.8, False, 1.0, now=0.03)
+
+    assert merged
+    assert merged_voice is voice
+    assert merged_generation == generation
+    assert voice.volume == pytest.approx(1.0)   # Powers add: sqrt(0.6^2 + 0.8^2)
+    assert len(pool.active_voices()) == 1
+    assert pool.merged_count == 1
+
+
+def test_merged_volume_is_capped(table):
+    pool = make_pool(4, merge_window=0.05, max_merged_volume=1.0)
+    voice, _, _ = pool.acquire(table, "laser", 1.0, False, 1.0, now=0.0)
+
+    pool.acquire(table, "laser", 1.0, False, 1.0, now=0.01)
+
+    assert voice.volume == 1.0
+
+
+@pytest.mark.parametrize("now, pitch_shift, other_table", [
+    (0.1, 1.0, False),    # Outside the window
+    (0.01, 1.5, False),   # Different pitch
+    (0.01, 1.0, True),    # Different table (e.g. a pre-pitched variant)
+])
+def test_different_trigger_is_not_merged(table, now, pitch_shift, other_table):
+    pool = make_pool(4, merge_window=0.05)
+    pool.acquire(table, "laser", 1.0, False, 1.0, now=0.0)
+    source = FakeTable() if other_table else table
+
+    _, _, merged = pool.acquire(source, "laser", 1.0, False, pitch_shift, now=now)
+
+    assert not merged
+    assert len(pool.active_voices()) == 2
@@ -0,0 +1,171 @@
+"""
+Audio Benchmark - trigger cost, trigger-to-sample latency and mixer cost per voice
+
+Runs without a sound device, on the null and offline audio backends:
+    - trigger cost: wall time of one play_sound() call on each backend
+    - trigger-to-sample latency: trigger cost, plus the samples the offline
+      render outputs before the sound is heard, plus one server buffer (the
+      delay a real device adds before the first buffer holding it is played)
+    - mixer cost: render time per second of audio with 0..N looping voices,
+      and the extra cost of each voice
+
+    python tools/benchmark_audio.py --voices 0 1 8 32
+"""
+
+import argparse
+import array
+import os
+import statistics
+import sys
+import tempfile
+import time
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from audio.audio_engine import AudioEngine, BACKEND_OFFLINE  # noqa: E402
+from audio.null_audio_engine import NullAudioEngine  # noqa: E402
+from audio.sound_bank import SoundBank  # noqa: E402
+
+# Benchmark Constants - Easy to tune
+TRIGGER_CALLS = 2000          # play_sound() calls timed per backend
+RENDER_SECONDS = 2.0          # Seconds of audio rendered per mixer measurement
+SILENCE_THRESHOLD = 64        # 16-bit sample level counted as sound
+BENCHMARK_SOUND = SoundBank.SUCCESS
+
+
+def _time_triggers(engine, sound, calls):
+    """Median wall time of one play_sound() call, in microseconds"""
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        engine.play_sound(sound, volume=0.5)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def _first_sound_frame(path):
+    """Index of the first frame louder than SILENCE_THRESHOLD, or None if silent"""
+    with wave.open(path, "rb") as wav:
+        channels = wav.getnchannels()
+        samples = array.array("h", wav.readframes(wav.getnframes()))
+    for index, sample in enumerate(samples):
+        if abs(sample) > SILENCE_THRESHOLD:
+            return index // channels
+    return None
+
+
+def _reset(engine):
+    """Stop everything the previous measurement left playing"""
+    engine.scheduler.shutdown()
+    engine.voices.stop_all()
+
+
+def measure_latency(engine, sound, trigger_us, workdir):
+    """
+    Measure trigger-to-sample latency on the offline backend
+
+    Args:
+        engine: Offline AudioEngine
+        sound: SoundBank item to trigger
+        trigger_us: Cost of the play_sound() call, in microseconds
+        workdir: Directory for the rendered file
+
+    Returns:
+        dict: Latency parts and total in milliseconds, or None if nothing was heard
+    """
+    _reset(engine)
+    path = os.path.join(workdir, "latency.wav")
+    engine.play_sound(sound, volume=1.0)
+    engine.render(path, 0.5)
+    frame = _first_sound_frame(path)
+    if frame is None:
+        return None
+
+    rate = engine.server.getSamplingRate()
+    buffer_ms = engine.server.getBufferSize() / rate * 1000
+    render_ms = frame / rate * 1000
+    return {
+        "trigger_ms": trigger_us / 1000,
+        "render_ms": render_ms,
+        "buffer_ms": buffer_ms,
+        "total_ms": trigger_us / 1000 + render_ms + buffer_ms,
+    }
+
+
+def measure_mixer_cost(engine, sound, voice_counts, workdir, seconds=RENDER_SECONDS):
+    """
+    Measure render time per second of audio with a number of looping voices
+
+    Args:
+        engine: Offline AudioEngine
+        sound: SoundBank item to loop on every voice
+        voice_counts: Voice counts to measure
+        workdir: Directory for the rendered files
+        seconds: Seconds of audio rendered per measurement
+
+    Returns:
+        list: (voices, milliseconds of render time per second of audio) tuples
+    """
+    # Let every trigger take its own voice
+    engine.voices.merge_window = 0.0
+    engine.voices.default_sound_limit = len(engine.voices.voices)
+
+    results = []
+    for count in voice_counts:
+        _reset(engine)
+        count = min(count, len(engine.voices.voices))
+        for index in range(count):
+            # Slightly different pitches so no two voices are identical
+            engine.play_sound(sound, volume=0.5 / max(1, count), loop=True, pitch_shift=1.0 + index * 0.001)
+        elapsed = engine.render(os.path.join(workdir, f"mixer_{count}.wav"), seconds)
+        results.append((count, elapsed / seconds * 1000))
+    _reset(engine)
+    return results
+
+
+def main():
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Benchmark the audio engine without a sound device")
+    parser.add_argument("--voices", type=int, nargs="+", default=[0, 1, 8, 32],
+                        help="Active voice counts for the mixer cost")
+    parser.add_argument("--calls", type=int, default=TRIGGER_CALLS, help="play_sound() calls per backend")
+    parser.add_argument("--seconds", type=float, default=RENDER_SECONDS,
+                        help="Seconds of audio rendered per mixer measurement")
+    args = parser.parse_args()
+
+    null_engine = NullAudioEngine()
+    null_us = _time_triggers(null_engine, BENCHMARK_SOUND, args.calls)
+
+    engine = AudioEngine(BACKEND_OFFLINE)
+    offline_us = _time_triggers(engine, BENCHMARK_SOUND, args.calls)
+
+    print("Trigger cost (median play_sound() call)")
+    print(f"  null     {null_us:8.2f} us")
+    print(f"  offline  {offline_us:8.2f} us")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        latency = measure_latency(engine, BENCHMARK_SOUND, offline_us, workdir)
+        print("\nTrigger-to-sample latency")
+        if latency is None:
+            print(f"  {BENCHMARK_SOUND.name} was not heard in the render")
+        else:
+            print(f"  trigger call   {latency['trigger_ms']:7.3f} ms")
+            print(f"  first sample   {latency['render_ms']:7.3f} ms")
+            print(f"  server buffer  {latency['buffer_ms']:7.3f} ms")
+            print(f"  total          {latency['total_ms']:7.3f} ms")
+
+        results = measure_mixer_cost(engine, BENCHMARK_SOUND, sorted(args.voices), workdir, args.seconds)
+
+    print("\nMixer cost (render ms per second of audio, budget 1000 ms)")
+    baseline = results[0][1]
+    for count, cost in results:
+        per_voice = (cost - baseline) / (count - results[0][0]) if count > results[0][0] else 0.0
+        print(f"  {count:4d} voices  {cost:8.2f} ms   {per_voice:6.3f} ms/voice")
+
+    engine.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
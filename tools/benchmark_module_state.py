@@ -0,0 +1,130 @@
+"""
+Module State Benchmark - micro-benchmark of the per-frame module and hit type checks
+
+Compares the current hot paths with the string states and if-chains they
+replaced:
+    - module state checks (ModuleButton.render, MiningLaserRenderer.render)
+    - HitType.multiplier / HitType.chance lookups
+    - hit type rolls, the way MiningResolver rolls them each tick (a few
+      lasers) and for a large batch
+
+    python tools/benchmark_module_state.py
+"""
+
+import os
+import random
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities.base_module import STATE_COOLING_DOWN, STATE_READY  # noqa: E402
+from game_state.inventory_types import HitType  # noqa: E402
+from game_state.mining_resolver import roll_hit_types  # noqa: E402
+
+# Benchmark Constants - Easy to tune
+ITERATIONS = 1_000_000   # Calls per measurement
+REPEATS = 5              # Measurements per case, the best one is reported
+LASERS_PER_TICK = 2      # Laser cycles the resolver rolls in a typical tick
+
+
+class _StringStates:
+    """The string states modules used before ModuleState became an IntEnum"""
+    READY = "ready"
+    ACTIVE = "active"
+    COOLING_DOWN = "cooling_down"
+
+
+class _Module:
+    """Stand-in with just the attribute the checks read"""
+
+    def __init__(self, state):
+        self.state = state
+
+
+def _chained_multiplier(hit_type):
+    """HitType.multiplier as the if-chain it used to be"""
+    if hit_type == HitType.NORMAL:
+        return 1.0
+    elif hit_type == HitType.CRITICAL:
+        return 1.25
+    elif hit_type == HitType.SUPER_CRITICAL:
+        return 1.5
+
+
+def _chained_chance(hit_type):
+    """HitType.chance as the if-chain it used to be"""
+    if hit_type == HitType.NORMAL:
+        return 0.50
+    elif hit_type == HitType.CRITICAL:
+        return 0.35
+    elif hit_type == HitType.SUPER_CRITICAL:
+        return 0.15
+
+
+def _chained_roll(roll):
+    """The old MiningLaserModule._determine_hit_type, on a given roll"""
+    if roll < _chained_chance(HitType.SUPER_CRITICAL):
+        return HitType.SUPER_CRITICAL
+    if roll < _chained_chance(HitType.SUPER_CRITICAL) + _chained_chance(HitType.CRITICAL):
+        return HitType.CRITICAL
+    return HitType.NORMAL
+
+
+def _measure(statement, namespace, iterations=ITERATIONS):
+    """Best time per call in nanoseconds"""
+    timer = timeit.Timer(statement, globals=namespace)
+    return min(timer.repeat(REPEATS, iterations)) / iterations * 1e9
+
+
+def _report(name, before, after):
+    """Print one comparison"""
+    print(f"{name:<44} {before:8.1f} ns -> {after:8.1f} ns  ({before / after:4.1f}x)")
+
+
+def main():
+    """Run every case and print the results"""
+    string_module = _Module(_StringStates.COOLING_DOWN)
+    enum_module = _Module(STATE_COOLING_DOWN)
+    namespace = {
+        "string_module": string_module,
+        "enum_module": enum_module,
+        "STATE_READY": STATE_READY,
+        "STATE_COOLING_DOWN": STATE_COOLING_DOWN,
+        "HitType": HitType,
+        "critical": HitType.CRITICAL,
+        "_chained_multiplier": _chained_multiplier,
+        "_chained_chance": _chained_chance,
+        "_chained_roll": _chained_roll,
+        "random": random,
+        "np": np,
+        "roll_hit_types": roll_hit_types,
+        "count": LASERS_PER_TICK,
+    }
+
+    print(f"Best of {REPEATS} x {ITERATIONS:,} calls")
+    _report("button state check",
+            _measure('string_module.state == "ready" or string_module.state == "cooling_down"', namespace),
+            _measure("enum_module.state == STATE_READY or enum_module.state == STATE_COOLING_DOWN", namespace))
+    _report("HitType.multiplier", _measure("_chained_multiplier(critical)", namespace),
+            _measure("critical.multiplier", namespace))
+    _report("HitType.chance", _measure("_chained_chance(critical)", namespace),
+            _measure("critical.chance", namespace))
+    # As in MiningResolver.resolve: draw from the random module, then classify the batch
+    _report(f"hit type rolls, {LASERS_PER_TICK} lasers per tick",
+            _measure("[_chained_roll(random.random()) for _ in range(count)]", namespace, ITERATIONS // 10),
+            _measure("roll_hit_types(np.fromiter((random.random() for _ in range(count)), "
+                     "dtype=np.float64, count=count))", namespace, ITERATIONS // 10))
+
+    rolls = np.random.random(10_000)
+    namespace.update(rolls=rolls, roll_list=rolls.tolist())
+    _report("hit type roll, batch of 10,000 (per roll)",
+            _measure("[_chained_roll(r) for r in roll_list]", namespace, 100) / len(rolls),
+            _measure("roll_hit_types(rolls)", namespace, 100) / len(rolls))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
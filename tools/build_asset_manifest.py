@@ -0,0 +1,356 @@
+"""
+Build Asset Manifest - precomputes metadata for every PNG and WAV under assets/
+
+Writes assets/manifest.json with, for each image:
+    - width and height in pixels
+    - bbox: alpha-trimmed bounding box [left, top, right, bottom] (exclusive)
+    - radius: half the larger side of the trimmed bounding box, the same
+      measure the game used on the full texture size
+    - sha256: hash of the file contents
+    - variants: downscaled copies from tools/build_texture_variants.py, if
+      any, as factor, path, width and height - smallest last
+
+and for each sound:
+    - frames, rate, channels and duration in seconds
+    - sha256: hash of the file contents
+
+The PNG files are decoded with the standard library only (zlib plus the PNG
+scanline filters), so the build needs no graphics libraries and no window.
+Run it from the repository root whenever an image changes:
+
+    python tools/build_asset_manifest.py
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import wave
+import zlib
+
+# Manifest Constants - Easy to tune
+ASSETS_DIRECTORY = "assets"
+MANIFEST_PATH = os.path.join(ASSETS_DIRECTORY, "manifest.json")
+VARIANTS_DIRECTORY = os.path.join(ASSETS_DIRECTORY, "variants")
+MANIFEST_VERSION = 3   # 2 added sounds, 3 added image variants
+ALPHA_THRESHOLD = 16     # Pixels with alpha at or below this are treated as transparent
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Channels per pixel for each PNG color type
+_CHANNELS = {
+    0: 1,   # Grayscale
+    2: 3,   # RGB
+    3: 1,   # Palette index
+    4: 2,   # Grayscale + alpha
+    6: 4,   # RGBA
+}
+
+
+class PNGError(Exception):
+    """Raised for PNG files this decoder does not support"""
+    pass
+
+
+def _read_chunks(data):
+    """Yield (type, payload) for every chunk of a PNG file"""
+    if not data.startswith(PNG_SIGNATURE):
+        raise PNGError("Not a PNG file")
+    offset = len(PNG_SIGNATURE)
+    while offset + 8 <= len(data):
+        length, chunk_type = struct.unpack_from(">I4s", data, offset)
+        payload = data[offset + 8:offset + 8 + length]
+        crc = struct.unpack_from(">I", data, offset + 8 + length)[0]
+        if zlib.crc32(chunk_type + payload) != crc:
+            raise PNGError(f"Bad CRC in {chunk_type.decode('latin-1')} chunk")
+        yield chunk_type, payload
+        offset += 12 + length
+        if chunk_type == b"IEND":
+            return
+
+
+def _unfilter(raw, height, stride, bytes_per_pixel):
+    """
+    Undo the PNG scanline filters
+
+    Args:
+        raw: Decompressed image data (filter byte + scanline, per row)
+        height: Number of rows
+        stride: Bytes per scanline, without the filter byte
+        bytes_per_pixel: Filter distance (at least 1)
+
+    Returns:
+        list: One bytearray per row
+    """
+    rows = []
+    previous = bytearray(stride)
+    offset = 0
+    for _ in range(height):
+        filter_type = raw[offset]
+        row = bytearray(raw[offset + 1:offset + 1 + stride])
+        offset += 1 + stride
+
+        if filter_type == 1:        # Sub
+            for i in range(bytes_per_pixel, stride):
+                row[i] = (row[i] + row[i - bytes_per_pixel]) & 0xFF
+        elif filter_type == 2:      # Up
+            row = bytearray((a + b) & 0xFF for a, b in zip(row, previous))
+        elif filter_type == 3:      # Average
+            for i in range(stride):
+                left = row[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
+                row[i] = (row[i] + ((left + previous[i]) >> 1)) & 0xFF
+        elif filter_type == 4:      # Paeth
+            for i in range(stride):
+                if i >= bytes_per_pixel:
+                    a = row[i - bytes_per_pixel]
+                    c = previous[i - bytes_per_pixel]
+                else:
+                    a = c = 0
+                b = previous[i]
+                p = a + b - c
+                pa = abs(p - a)
+                pb = abs(p - b)
+                pc = abs(p - c)
+                if pa <= pb and pa <= pc:
+                    predictor = a
+                elif pb <= pc:
+                    predictor = b
+                else:
+                    predictor = c
+                row[i] = (row[i] + predictor) & 0xFF
+        elif filter_type != 0:
+            raise PNGError(f"Unknown filter type {filter_type}")
+
+        rows.append(row)
+        previous = row
+    return rows
+
+
+def read_size(data):
+    """
+    Read the size of a PNG from its header, without decoding it
+
+    Args:
+        data: Contents of the PNG file
+
+    Returns:
+        tuple: (width, height)
+    """
+    for chunk_type, payload in _read_chunks(data):
+        if chunk_type == b"IHDR":
+            return struct.unpack_from(">II", payload)
+        break
+    raise PNGError("Missing IHDR chunk")
+
+
+def decode_alpha(data):
+    """
+    Decode a PNG file down to its alpha channel
+
+    Args:
+        data: Contents of the PNG file
+
+    Returns:
+        tuple: (width, height, rows) where rows is one bytes-like object of
+            8-bit alpha values per row
+    """
+    header = None
+    transparency = None   # tRNS chunk: palette alphas or a transparent color key
+    compressed = []
+    for chunk_type, payload in _read_chunks(data):
+        if chunk_type == b"IHDR":
+            header = struct.unpack(">IIBBBBB", payload)
+        elif chunk_type == b"tRNS":
+            transparency = payload
+        elif chunk_type == b"IDAT":
+            compressed.append(payload)
+    if header is None:
+        raise PNGError("Missing IHDR chunk")
+
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if interlace:
+        raise PNGError("Interlaced PNGs are not supported")
+    if color_type not in _CHANNELS or bit_depth not in (8, 16) or (color_type == 3 and bit_depth != 8):
+        raise PNGError(f"Unsupported PNG format (color type {color_type}, bit depth {bit_depth})")
+
+    channels = _CHANNELS[color_type]
+    sample_bytes = bit_depth // 8
+    bytes_per_pixel = channels * sample_bytes
+    rows = _unfilter(zlib.decompress(b"".join(compressed)), height, width * bytes_per_pixel, bytes_per_pixel)
+
+    if color_type in (4, 6):
+        # Alpha is the last channel - keep the high byte of 16-bit samples
+        alpha_offset = (channels - 1) * sample_bytes
+        return width, height, [row[alpha_offset::bytes_per_pixel] for row in rows]
+
+    if color_type == 3:
+        palette_alpha = transparency or b""
+        table = bytes(palette_alpha) + b"\xff" * (256 - len(palette_alpha))
+        return width, height, [row.translate(table) for row in rows]
+
+    # Grayscale or RGB - only a tRNS color key can make pixels transparent
+    if transparency is None:
+        return width, height, [b"\xff" * width] * height
+    samples = struct.unpack(">H", transparency[:2]) if color_type == 0 else struct.unpack(">HHH", transparency[:6])
+    key = b"".join(sample.to_bytes(sample_bytes, "big") for sample in samples)
+    return width, height, [
+        bytes(0 if row[x * bytes_per_pixel:(x + 1) * bytes_per_pixel] == key else 255 for x in range(width))
+        for row in rows
+    ]
+
+
+def measure_image(data, alpha_threshold=ALPHA_THRESHOLD):
+    """
+    Compute the manifest entry of one PNG
+
+    Args:
+        data: Contents of the PNG file
+        alpha_threshold: Alpha values at or below this are transparent
+
+    Returns:
+        dict: Manifest entry (width, height, bbox, radius, sha256)
+    """
+    width, height, rows = decode_alpha(data)
+    opaque = bytes(0 if alpha <= alpha_threshold else 1 for alpha in range(256))
+    left, top, right, bottom = width, height, 0, 0
+    for y, alpha_row in enumerate(rows):
+        mask = alpha_row.translate(opaque)
+        first = mask.find(b"\x01")
+        if first < 0:
+            continue
+        last = mask.rfind(b"\x01")
+        left = min(left, first)
+        right = max(right, last + 1)
+        top = min(top, y)
+        bottom = y + 1
+
+    if right <= left:
+        left = top = right = bottom = 0
+
+    return {
+        "width": width,
+        "height": height,
+        "bbox": [left, top, right, bottom],
+        "radius": max(right - left, bottom - top) / 2,
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+def measure_sound(path, data):
+    """
+    Compute the manifest entry of one WAV
+
+    Args:
+        path: Path of the WAV file
+        data: Contents of the WAV file
+
+    Returns:
+        dict: Manifest entry (frames, rate, channels, duration, sha256)
+    """
+    with wave.open(path, "rb") as wav:
+        frames = wav.getnframes()
+        rate = wav.getframerate()
+        channels = wav.getnchannels()
+    return {
+        "frames": frames,
+        "rate": rate,
+        "channels": channels,
+        "duration": frames / rate,
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+def _is_inside(path, directory):
+    """Check if a path is inside a directory"""
+    return os.path.commonpath([os.path.abspath(path), os.path.abspath(directory)]) == os.path.abspath(directory)
+
+
+def _measure_variant(path, data, assets_directory, variants_directory):
+    """
+    Compute the manifest entry of one downscaled variant
+
+    Args:
+        path: Variant path (e.g. "assets/variants/asteroid1@2.png")
+        data: Contents of the PNG file
+        assets_directory: Directory of the full-size images
+        variants_directory: Directory of the variants
+
+    Returns:
+        tuple: (full-size image path, variant entry)
+    """
+    relative = os.path.relpath(path, variants_directory)
+    stem, extension = os.path.splitext(relative)
+    name, separator, factor = stem.rpartition("@")
+    if not separator or not factor.isdigit():
+        raise PNGError("Variant name must end in @<factor>")
+    width, height = read_size(data)
+    source_path = os.path.join(assets_directory, name + extension).replace(os.sep, "/")
+    return source_path, {
+        "factor": int(factor),
+        "path": path.replace(os.sep, "/"),
+        "width": width,
+        "height": height,
+    }
+
+
+def build_manifest(assets_directory=ASSETS_DIRECTORY):
+    """
+    Measure every PNG and WAV under a directory
+
+    Args:
+        assets_directory: Directory to scan
+
+    Returns:
+        dict: The manifest, with images and sounds keyed by forward-slash path
+            (e.g. "assets/asteroid1.png")
+    """
+    images = {}
+    sounds = {}
+    variants = []   # (full-size path, entry)
+    variants_directory = os.path.join(assets_directory, os.path.relpath(VARIANTS_DIRECTORY, ASSETS_DIRECTORY))
+    for directory, _, filenames in os.walk(assets_directory):
+        for filename in filenames:
+            extension = os.path.splitext(filename)[1].lower()
+            if extension not in (".png", ".wav"):
+                continue
+            path = os.path.join(directory, filename)
+            with open(path, "rb") as asset_file:
+                data = asset_file.read()
+            try:
+                if extension == ".png" and _is_inside(path, variants_directory):
+                    variants.append(_measure_variant(path, data, assets_directory, variants_directory))
+                elif extension == ".png":
+                    images[path.replace(os.sep, "/")] = measure_image(data)
+                else:
+                    sounds[path.replace(os.sep, "/")] = measure_sound(path, data)
+            except (PNGError, zlib.error, struct.error, wave.Error, EOFError) as e:
+                print(f"Warning: Skipping {path}: {e}")
+
+    for source_path, entry in sorted(variants, key=lambda variant: variant[1]["factor"]):
+        if source_path in images:
+            images[source_path].setdefault("variants", []).append(entry)
+        else:
+            print(f"Warning: Skipping {entry['path']}: no full-size image {source_path}")
+
+    return {
+        "version": MANIFEST_VERSION,
+        "alpha_threshold": ALPHA_THRESHOLD,
+        "images": dict(sorted(images.items())),
+        "sounds": dict(sorted(sounds.items())),
+    }
+
+
+def main():
+    """Build the manifest and write it next to the assets"""
+    manifest = build_manifest()
+    with open(MANIFEST_PATH, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+        manifest_file.write("\n")
+    variant_count = sum(len(info.get("variants", [])) for info in manifest["images"].values())
+    print(f"Wrote {len(manifest['images'])} images ({variant_count} variants) and {len(manifest['sounds'])} sounds to {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Build Texture Variants - writes power-of-two downscaled copies of large images
+
+Most images are drawn far smaller than they are stored (asteroids at 0.3-0.6
+scale, the 1024 px depot at 240 px), so the GPU would sample, and the loading
+screen would upload, several times more pixels than reach the screen. For
+every PNG under assets/ whose larger side is at least VARIANT_MIN_SOURCE_SIZE,
+this writes half, quarter, ... size copies to assets/variants/, named
+<name>@<factor>.png, until the smaller side would drop below VARIANT_MIN_SIZE.
+The asset manifest lists them under their full-size image, and the renderers
+draw the smallest one that still covers their on-screen size.
+
+Run it from the repository root after changing an image, then rebuild the
+manifest (and the archive, if you use one):
+
+    python tools/build_texture_variants.py
+    python tools/build_asset_manifest.py
+"""
+
+import argparse
+import math
+import os
+import shutil
+import sys
+
+from PIL import Image
+
+# Variant Constants - Easy to tune
+ASSETS_DIRECTORY = "assets"
+VARIANTS_DIRECTORY = os.path.join(ASSETS_DIRECTORY, "variants")
+VARIANT_MIN_SOURCE_SIZE = 128   # Images with a larger side below this get no variants
+VARIANT_MIN_SIZE = 32           # Stop halving before the smaller side drops below this
+
+
+def variant_path(path, factor, assets_directory=ASSETS_DIRECTORY, variants_directory=VARIANTS_DIRECTORY):
+    """
+    Get the file name of a downscaled variant
+
+    Args:
+        path: Full-size image (e.g. "assets/asteroid1.png")
+        factor: Downscale factor, a power of two
+        assets_directory: Directory the image is in
+        variants_directory: Directory the variants are written to
+
+    Returns:
+        str: Variant path (e.g. "assets/variants/asteroid1@2.png")
+    """
+    relative = os.path.relpath(path, assets_directory)
+    stem, extension = os.path.splitext(relative)
+    return os.path.join(variants_directory, f"{stem}@{factor}{extension}")
+
+
+def variant_factors(width, height, min_source_size=VARIANT_MIN_SOURCE_SIZE, min_size=VARIANT_MIN_SIZE):
+    """
+    List the downscale factors an image gets
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        min_source_size: Images with a larger side below this get none
+        min_size: Smallest allowed variant side
+
+    Returns:
+        list: Factors (2, 4, 8, ...)
+    """
+    if max(width, height) < min_source_size:
+        return []
+    factors = []
+    factor = 2
+    while min(width, height) / factor >= min_size:
+        factors.append(factor)
+        factor *= 2
+    return factors
+
+
+def build_variants(path, factors):
+    """
+    Write the variants of one image
+
+    Sizes are rounded up, so a variant is never smaller than its exact
+    fraction of the full-size image.
+
+    Args:
+        path: Full-size image
+        factors: Downscale factors to write
+
+    Returns:
+        list: Paths written
+    """
+    written = []
+    with Image.open(path) as image:
+        image = image.convert("RGBA")
+        for factor in factors:
+            size = (math.ceil(image.width / factor), math.ceil(image.height / factor))
+            output_path = variant_path(path, factor)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            # Pillow resamples RGBA with premultiplied alpha, so transparent edges don't darken
+            image.resize(size, Image.LANCZOS).save(output_path, optimize=True)
+            written.append(output_path)
+    return written
+
+
+def main():
+    """Rebuild every variant"""
+    parser = argparse.ArgumentParser(description="Write downscaled variants of large images")
+    parser.add_argument("--min-source-size", type=int, default=VARIANT_MIN_SOURCE_SIZE,
+                        help="Skip images with a larger side below this")
+    parser.add_argument("--min-size", type=int, default=VARIANT_MIN_SIZE, help="Smallest variant side")
+    args = parser.parse_args()
+
+    # Start clean so variants of removed or shrunk images don't linger
+    shutil.rmtree(VARIANTS_DIRECTORY, ignore_errors=True)
+
+    written = []
+    for directory, _, filenames in os.walk(ASSETS_DIRECTORY):
+        for filename in sorted(filenames):
+            if not filename.lower().endswith(".png"):
+                continue
+            path = os.path.join(directory, filename)
+            with Image.open(path) as image:
+                factors = variant_factors(image.width, image.height, args.min_source_size, args.min_size)
+            if factors:
+                written.extend(build_variants(path, factors))
+
+    print(f"Wrote {len(written)} variants to {VARIANTS_DIRECTORY}")
+    print("Run 'python tools/build_asset_manifest.py' to add them to the manifest")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Mining Simulator - Monte Carlo estimate of mining yield per fitting
+
+Simulates many independent mining sessions at once with NumPy. Every
+session runs the same rules as the game's MiningResolver, whose vectorized
+hit roll and mining amounts it reuses:
+    - each laser cycles every CYCLE_ACTIVE_TIME + CYCLE_COOLDOWN_TIME seconds
+    - the hit type is rolled super critical first, then critical, otherwise normal
+    - the amount is int(min(ORE_PER_CYCLE, ore left) * multiplier), capped at
+      the free cargo space; a hit that would take more ore than the asteroid
+      has left fails
+    - a depleted asteroid is replaced by a fresh one rolled like AsteroidEntity
+    - a full cargo hold is emptied at the depot, which takes --unload-time
+
+Prints the ore per hour distribution for each fitting (number of lasers):
+
+    python tools/mining_simulator.py --lasers 1 2 3 4 --sessions 20000 --hours 1
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities.asteroid_entity import (  # noqa: E402
+    ASTEROID_MAX_ORE, ASTEROID_MAX_SCALE, ASTEROID_MIN_ORE, ASTEROID_MIN_SCALE,
+)
+from entities.mining_laser_module import ORE_PER_CYCLE, MiningLaserModule  # noqa: E402
+from entities.player_entity import PLAYER_INVENTORY_SIZE, PLAYER_MAX_MODULES  # noqa: E402
+from game_state.mining_resolver import HIT_ORDER, mining_amounts, roll_hit_types, take_ore  # noqa: E402
+
+# Simulator Constants - Easy to tune
+DEFAULT_SESSIONS = 20000        # Independent sessions per fitting
+DEFAULT_HOURS = 1.0             # Game time simulated per session
+DEFAULT_UNLOAD_TIME = 30.0      # Seconds to fly to the depot, unload and come back
+
+
+def roll_asteroid_ore(rng, count):
+    """Vectorized initial ore of new asteroids, rolled like AsteroidEntity.__init__"""
+    scale = rng.uniform(ASTEROID_MIN_SCALE, ASTEROID_MAX_SCALE, count)
+    size_factor = (scale - ASTEROID_MIN_SCALE) / (ASTEROID_MAX_SCALE - ASTEROID_MIN_SCALE)
+    min_ore = (ASTEROID_MIN_ORE * (0.5 + size_factor * 0.5)).astype(np.int64)
+    max_ore = (ASTEROID_MAX_ORE * (0.5 + size_factor * 0.5)).astype(np.int64)
+    return rng.integers(min_ore, max_ore + 1)
+
+
+def simulate_fitting(lasers, sessions, hours, unload_time, cargo_size=PLAYER_INVENTORY_SIZE,
+                     ore_per_cycle=ORE_PER_CYCLE, active_time=MiningLaserModule.CYCLE_ACTIVE_TIME,
+                     cooldown_time=MiningLaserModule.CYCLE_COOLDOWN_TIME, seed=None):
+    """
+    Simulate mining sessions for one fitting
+
+    Args:
+        lasers: Number of mining lasers fitted
+        sessions: Number of independent sessions
+        hours: Game time per session
+        unload_time: Seconds lost per trip to the depot
+        cargo_size: Cargo hold capacity
+        ore_per_cycle: Base ore per laser cycle
+        active_time, cooldown_time: Laser cycle times in seconds
+        seed: Random seed, or None for a random one
+
+    Returns:
+        dict: ore_per_hour (array, one value per session), hit_counts (per
+            HIT_ORDER entry), cycles, failed_cycles and trips
+    """
+    rng = np.random.default_rng(seed)
+    cycle_time = active_time + cooldown_time
+    steps = int(hours * 3600 / cycle_time)
+    unload_steps = int(np.ceil(unload_time / cycle_time))
+
+    ore_left = roll_asteroid_ore(rng, sessions)
+    cargo = np.zeros(sessions, dtype=np.int64)
+    mined = np.zeros(sessions, dtype=np.int64)
+    travel_left = np.zeros(sessions, dtype=np.int64)
+    hit_counts = np.zeros(len(HIT_ORDER), dtype=np.int64)
+    cycles = failed_cycles = trips = 0
+
+    for _ in range(steps):
+        mining = travel_left == 0
+        travel_left[~mining] -= 1
+        active = np.flatnonzero(mining)
+        if active.size == 0:
+            continue
+
+        # Lasers on the same ship resolve one after the other against the same asteroid
+        for _ in range(lasers):
+            hit_indices, multipliers = roll_hit_types(rng.random(active.size))
+            amount = mining_amounts(ore_left[active], ore_per_cycle, multipliers)
+            amount = take_ore(np.minimum(amount, cargo_size - cargo[active]), ore_left[active])
+            success = amount > 0
+
+            ore_left[active] -= amount
+            cargo[active] += amount
+            mined[active] += amount
+            hit_counts += np.bincount(hit_indices[success], minlength=len(HIT_ORDER))
+            cycles += active.size
+            failed_cycles += int(active.size - np.count_nonzero(success))
+
+            # Depleted asteroids are replaced before the next laser fires
+            depleted = active[ore_left[active] == 0]
+            if depleted.size:
+                ore_left[depleted] = roll_asteroid_ore(rng, depleted.size)
+
+        # Full holds go to the depot
+        full = active[cargo[active] >= cargo_size]
+        if full.size:
+            cargo[full] = 0
+            travel_left[full] = unload_steps
+            trips += full.size
+
+    return {
+        "ore_per_hour": mined / hours,
+        "hit_counts": hit_counts,
+        "cycles": cycles,
+        "failed_cycles": failed_cycles,
+        "trips": trips,
+    }
+
+
+def print_report(lasers, result, elapsed):
+    """Print the ore per hour distribution of one fitting"""
+    ore_per_hour = result["ore_per_hour"]
+    p5, p50, p95 = np.percentile(ore_per_hour, [5, 50, 95])
+    successful = max(1, int(result["hit_counts"].sum()))
+    hits = ", ".join(f"{hit_type.name_display} {count / successful:.1%}"
+                     for hit_type, count in zip(HIT_ORDER, result["hit_counts"]))
+    print(f"{lasers} laser(s): ore/hour mean {ore_per_hour.mean():.0f}  "
+          f"p5 {p5:.0f}  p50 {p50:.0f}  p95 {p95:.0f}  std {ore_per_hour.std():.0f}")
+    print(f"    {result['cycles']:,} cycles in {elapsed:.2f}s, "
+          f"{result['failed_cycles'] / max(1, result['cycles']):.1%} failed, "
+          f"{result['trips'] / len(ore_per_hour):.1f} depot trips/session, hits: {hits}")
+
+
+def main():
+    """Run the simulator from the command line"""
+    parser = argparse.ArgumentParser(description="Monte Carlo mining yield simulator")
+    parser.add_argument("--lasers", type=int, nargs="+", default=list(range(1, PLAYER_MAX_MODULES + 1)),
+                        help="Fittings to simulate, as numbers of mining lasers")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS, help="Sessions per fitting")
+    parser.add_argument("--hours", type=float, default=DEFAULT_HOURS, help="Game hours per session")
+    parser.add_argument("--unload-time", type=float, default=DEFAULT_UNLOAD_TIME,
+                        help="Seconds per depot trip")
+    parser.add_argument("--cargo", type=int, default=PLAYER_INVENTORY_SIZE, help="Cargo hold size")
+    parser.add_argument("--ore-per-cycle", type=int, default=ORE_PER_CYCLE, help="Base ore per cycle")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+
+    print(f"Cycle {MiningLaserModule.CYCLE_ACTIVE_TIME}s active + {MiningLaserModule.CYCLE_COOLDOWN_TIME}s cooldown, "
+          f"{args.sessions:,} sessions x {args.hours}h per fitting")
+    for lasers in args.lasers:
+        start = time.perf_counter()
+        result = simulate_fitting(lasers, args.sessions, args.hours, args.unload_time,
+                                  cargo_size=args.cargo, ore_per_cycle=args.ore_per_cycle, seed=args.seed)
+        print_report(lasers, result, time.perf_counter() - start)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
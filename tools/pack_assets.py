@@ -0,0 +1,115 @@
+"""
+Pack Assets - builds the asset archive the game reads instead of loose files
+
+Packs every file under assets/ into assets.pak (see core/asset_archive.py).
+Files are stored in the order the loading screen reads them - the sounds and
+images of the asset manifest first - so a cold start reads the archive front
+to back. Run it from the repository root after changing any asset:
+
+    python tools/pack_assets.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.asset_archive import (  # noqa: E402
+    ARCHIVE_ALIGNMENT, ARCHIVE_HEADER, ARCHIVE_MAGIC, ARCHIVE_VERSION, ASSET_ARCHIVE_PATH,
+)
+
+# Packer Constants - Easy to tune
+ASSETS_DIRECTORY = "assets"
+MANIFEST_PATH = os.path.join(ASSETS_DIRECTORY, "manifest.json")
+
+
+def _aligned(offset):
+    """Round an offset up to the archive alignment"""
+    return (offset + ARCHIVE_ALIGNMENT - 1) // ARCHIVE_ALIGNMENT * ARCHIVE_ALIGNMENT
+
+
+def collect_paths(assets_directory=ASSETS_DIRECTORY, manifest_path=MANIFEST_PATH):
+    """
+    List the files to pack, in the order the game loads them
+
+    Args:
+        assets_directory: Directory to pack
+        manifest_path: Asset manifest giving the preload order
+
+    Returns:
+        list: Forward-slash paths (e.g. "assets/spaceship.png")
+    """
+    loose = []
+    for directory, _, filenames in os.walk(assets_directory):
+        for filename in filenames:
+            loose.append(os.path.join(directory, filename).replace(os.sep, "/"))
+    loose.sort()
+
+    try:
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        manifest = {}
+    first = [path for path in list(manifest.get("sounds", {})) + list(manifest.get("images", {})) if path in loose]
+    return first + [path for path in loose if path not in set(first)]
+
+
+def pack(paths, archive_path=ASSET_ARCHIVE_PATH):
+    """
+    Write an archive
+
+    Args:
+        paths: Files to pack, in storage order
+        archive_path: Archive to write
+
+    Returns:
+        int: Size of the archive in bytes
+    """
+    contents = []
+    for path in paths:
+        with open(path, "rb") as asset_file:
+            contents.append(asset_file.read())
+
+    # The index holds absolute offsets, which depend on the index's own length - grow until stable
+    index_length = 0
+    while True:
+        offset = _aligned(ARCHIVE_HEADER.size + index_length)
+        entries = {}
+        for path, data in zip(paths, contents):
+            entries[path] = [offset, len(data), hashlib.sha256(data).hexdigest()]
+            offset = _aligned(offset + len(data))
+        index = json.dumps({"entries": entries}, separators=(",", ":")).encode()
+        if len(index) <= index_length:
+            break
+        index_length = len(index)
+    index = index.ljust(index_length)
+
+    temp_path = f"{archive_path}.tmp"
+    with open(temp_path, "wb") as archive_file:
+        archive_file.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, index_length))
+        archive_file.write(index)
+        for path, data in zip(paths, contents):
+            archive_file.seek(entries[path][0])
+            archive_file.write(data)
+        size = archive_file.tell()
+    os.replace(temp_path, archive_path)
+    return size
+
+
+def main():
+    """Pack the assets directory"""
+    parser = argparse.ArgumentParser(description="Pack assets/ into one archive")
+    parser.add_argument("--output", default=ASSET_ARCHIVE_PATH, help="Archive to write")
+    args = parser.parse_args()
+
+    paths = collect_paths()
+    size = pack(paths, args.output)
+    print(f"Packed {len(paths)} files ({size / (1024 * 1024):.1f} MiB) into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Profile Startup - import-time breakdown and wall-clock phases of a cold start
+
+Starts the game in a fresh interpreter with `python -X importtime`, lets it
+run until the first game frame (see core/startup_profiler.py) and writes a
+report of:
+    - wall-clock phases from process spawn: imports, window open, first
+      loading screen frame, assets loaded, first game frame
+    - the slowest imports, by cumulative and by self time
+
+With --imports-only the game is not started, so no display is needed: the
+report covers `import main` alone. --check then fails (exit status 1) if the
+startup budgets below are exceeded, or if simulation modules import a
+graphics or audio library, which makes it usable as a CI step:
+
+    python tools/profile_startup.py
+    python tools/profile_startup.py --imports-only --check
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIRECTORY)
+
+from core.startup_profiler import PHASE_FIRST_GAME_FRAME, STARTUP_PROFILE_ENV  # noqa: E402
+
+# Profiler Constants - Easy to tune
+STARTUP_REPORT_PATH = os.path.join("cache", "startup_report.txt")
+IMPORT_BUDGET = 1.5               # Seconds for `import main` (arcade alone is most of it)
+FIRST_GAME_FRAME_BUDGET = 5.0     # Seconds from spawn to the first game frame
+PROFILE_TIMEOUT = 120             # Seconds before a profiled game run is given up on
+REPORT_TOP_COUNT = 20             # Imports listed per table
+
+# Simulation must stay importable without a window or an audio device
+SIMULATION_MODULES = ("entities", "game_state.state_manager", "game_state.mining_resolver")
+SIMULATION_FORBIDDEN_IMPORTS = ("arcade", "pyglet", "pyo", "PIL")
+
+
+def parse_importtime(output):
+    """
+    Parse the `-X importtime` lines of an interpreter's stderr
+
+    Args:
+        output: stderr text
+
+    Returns:
+        list: One dict per import (module, self and cumulative seconds,
+            depth), in the order the interpreter printed them
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        stripped = name.lstrip(" ")
+        records.append({
+            "module": stripped,
+            "self": int(self_us) / 1e6,
+            "cumulative": int(cumulative_us) / 1e6,
+            "depth": (len(name) - len(stripped) - 1) // 2,
+        })
+    return records
+
+
+def _run(arguments, env=None, timeout=PROFILE_TIMEOUT):
+    """Run a fresh interpreter with import timing - returns (import records, wall seconds)"""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime"] + arguments, cwd=ROOT_DIRECTORY, env=env,
+                            capture_output=True, text=True, timeout=timeout)
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"{' '.join(arguments)} failed:\n" + "\n".join(errors[-20:]))
+    return parse_importtime(result.stderr), wall
+
+
+def profile_imports(modules):
+    """
+    Import modules in a fresh interpreter
+
+    Args:
+        modules: Module names
+
+    Returns:
+        tuple: (import records, wall seconds of the whole run)
+    """
+    return _run(["-c", f"import {', '.join(modules)}"])
+
+
+def profile_game(audio_backend=None):
+    """
+    Start the game and let it run to its first game frame
+
+    Needs a display. The game exits by itself once the frame is drawn.
+
+    Args:
+        audio_backend: VSG_AUDIO_BACKEND for the run (None keeps the default)
+
+    Returns:
+        tuple: (import records, [(phase, seconds since spawn)], wall seconds)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        phases_path = os.path.join(directory, "phases.json")
+        env = dict(os.environ, **{STARTUP_PROFILE_ENV: phases_path})
+        if audio_backend:
+            env["VSG_AUDIO_BACKEND"] = audio_backend
+        spawned = time.time()
+        records, wall = _run(["main.py"], env=env)
+        with open(phases_path) as phases_file:
+            report = json.load(phases_file)
+    phases = [(phase["name"], phase["time"] - spawned) for phase in report["phases"]]
+    return records, phases, wall
+
+
+def find_imports(records, packages):
+    """List the imported modules that belong to any of the given top-level packages"""
+    return sorted({record["module"] for record in records if record["module"].split(".")[0] in packages})
+
+
+def format_report(records, phases=None, wall=None, top=REPORT_TOP_COUNT):
+    """
+    Format a startup report
+
+    Args:
+        records: Import records
+        phases: (phase, seconds since spawn) pairs, if the game was run
+        wall: Wall seconds of the whole run
+        top: Imports listed per table
+
+    Returns:
+        str: The report
+    """
+    lines = []
+    if phases:
+        lines.append("Phases (seconds since spawn)")
+        previous = 0.0
+        for name, at in phases:
+            lines.append(f"  {name:<20} {at:8.3f}   +{at - previous:.3f}")
+            previous = at
+        lines.append("")
+    if wall is not None:
+        lines.append(f"Process wall time: {wall:.3f} s")
+    top_level = [record for record in records if record["depth"] == 0]
+    lines.append(f"Import time: {sum(record['cumulative'] for record in top_level):.3f} s "
+                 f"({len(records)} modules)")
+    lines.append("")
+
+    lines.append("Slowest top-level imports (cumulative)")
+    for record in sorted(top_level, key=lambda record: -record["cumulative"])[:top]:
+        lines.append(f"  {record['cumulative'] * 1000:9.1f} ms  {record['module']}")
+    lines.append("")
+
+    lines.append("Slowest modules (self)")
+    for record in sorted(records, key=lambda record: -record["self"])[:top]:
+        lines.append(f"  {record['self'] * 1000:9.1f} ms  {record['module']}")
+    return "\n".join(lines) + "\n"
+
+
+def check_budgets(import_records, simulation_records, phases=None):
+    """
+    Compare a profile with the startup budgets
+
+    Args:
+        import_records: Records of importing main
+        simulation_records: Records of importing the simulation modules
+        phases: (phase, seconds since spawn) pairs, if the game was run
+
+    Returns:
+        list: Messages for every budget exceeded (empty if all are met)
+    """
+    failures = []
+    main_records = [record for record in import_records if record["module"] == "main"]
+    if main_records and main_records[0]["cumulative"] > IMPORT_BUDGET:
+        failures.append(f"import main took {main_records[0]['cumulative']:.3f} s (budget {IMPORT_BUDGET} s)")
+
+    forbidden = find_imports(simulation_records, SIMULATION_FORBIDDEN_IMPORTS)
+    if forbidden:
+        failures.append(f"Simulation modules import {', '.join(forbidden[:5])}"
+                        f"{' ...' if len(forbidden) > 5 else ''}")
+
+    for name, at in phases or ():
+        if name == PHASE_FIRST_GAME_FRAME and at > FIRST_GAME_FRAME_BUDGET:
+            failures.append(f"First game frame after {at:.3f} s (budget {FIRST_GAME_FRAME_BUDGET} s)")
+    return failures
+
+
+def main():
+    """Profile a cold start and write the report"""
+    parser = argparse.ArgumentParser(description="Profile the game's cold start")
+    parser.add_argument("--imports-only", action="store_true", help="Only time `import main` (no display needed)")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if a startup budget is exceeded")
+    parser.add_argument("--audio-backend", help="Audio backend for the game run (e.g. null)")
+    parser.add_argument("--top", type=int, default=REPORT_TOP_COUNT, help="Imports listed per table")
+    parser.add_argument("--output", default=STARTUP_REPORT_PATH, help="Report file")
+    args = parser.parse_args()
+
+    phases = None
+    if args.imports_only:
+        records, wall = profile_imports(["main"])
+    else:
+        records, phases, wall = profile_game(args.audio_backend)
+    simulation_records, _ = profile_imports(SIMULATION_MODULES)
+
+    report = format_report(records, phases, wall, args.top)
+    failures = check_budgets(records, simulation_records, phases)
+    report += "\n" + ("\n".join(f"OVER BUDGET: {failure}" for failure in failures) or "All startup budgets met") + "\n"
+
+    output_path = os.path.join(ROOT_DIRECTORY, args.output)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w") as report_file:
+        report_file.write(report)
+    print(report)
+    print(f"Wrote {args.output}")
+    return 1 if args.check and failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Hit Grid - finds the UI widget under the mouse without testing every widget
+
+When the UI is laid out, each widget is bucketed by its bounding box into
+square screen cells. A click or mouse move then only tests the widgets of
+the cell under the pointer, topmost first. A widget is any object with
+contains_point(x, y); what happens on a click is up to its owner.
+"""
+
+import math
+
+# Hit Grid Constants - Easy to tune
+HIT_GRID_CELL_SIZE = 64   # Cell width and height in pixels
+
+
+class HitGrid:
+    """Uniform grid over widget bounding boxes, rebuilt whenever the layout changes"""
+
+    def __init__(self, cell_size=HIT_GRID_CELL_SIZE):
+        """
+        Initialize an empty grid
+
+        Args:
+            cell_size: Cell width and height in pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}   # (cx, cy) -> widgets overlapping the cell, bottom to top
+        self.widget_count = 0
+
+    def clear(self):
+        """Remove every widget (before laying the UI out again)"""
+        self.cells.clear()
+        self.widget_count = 0
+
+    def add(self, widget, left, bottom, width, height):
+        """
+        Add a widget - widgets added later are on top of earlier ones
+
+        Args:
+            widget: Object with contains_point(x, y)
+            left, bottom: Lower-left corner of its bounding box
+            width, height: Size of its bounding box
+        """
+        size = self.cell_size
+        for cx in range(math.floor(left / size), math.floor((left + width) / size) + 1):
+            for cy in range(math.floor(bottom / size), math.floor((bottom + height) / size) + 1):
+                self.cells.setdefault((cx, cy), []).append(widget)
+        self.widget_count += 1
+
+    def hit(self, x, y):
+        """
+        Find the topmost widget under a point
+
+        Args:
+            x, y: Screen position
+
+        Returns:
+            The widget, or None
+        """
+        cell = self.cells.get((math.floor(x / self.cell_size), math.floor(y / self.cell_size)))
+        if cell:
+            for widget in reversed(cell):
+                if widget.contains_point(x, y):
+                    return widget
+        return None
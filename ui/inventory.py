@@ -1,10 +1,12 @@
 import arcade
 import math
-from game_state.inventory_types import INVENTORY_ICONS, InventoryType, ORE_NAMES
+from entities.mobile_depot import MobileDepot
+from ui.inventory_list import InventoryList
+
 
 class InventoryUIRenderer:
     """Renders the player's inventory UI"""
-    
+
     # UI Constants
     PANEL_WIDTH = 300
     PANEL_HEIGHT = 600
@@ -13,9 +15,10 @@ class InventoryUIRenderer:
     TITLE_FONT_SIZE = 20
     ITEM_FONT_SIZE = 16
     ITEM_SPACING = 48
-    ICON_SIZE = 48
     FONT_NAME = "EveSansNeue-Regular"
-    
+    TITLE = "Mineral Hold"
+    PANEL_SLOT = 0  # Panels are placed right to left from the top-right corner
+
     # Capacity bar constants
     CAPACITY_BAR_HEIGHT = 8
     CAPACITY_BAR_PADDING = 4
@@ -23,27 +26,112 @@ class InventoryUIRenderer:
     CAPACITY_BAR_FILL_COLOR = (255, 255, 255, 255)  # Solid white
     WARNING_THRESHOLD = 0.9  # 90% full
     BLINK_SPEED = 2.0  # Blinks per second
-    
+
     def __init__(self, game_state):
         """Initialize the inventory UI renderer"""
         self.game_state = game_state
-        self.item_textures = {}  # Cache for loaded textures
-        self._load_textures()
         self.blink_time = 0.0  # Track time for blinking effect
 
-    def _load_textures(self):
-        """Load all inventory item textures"""
-        for item_type in InventoryType:
-            try:
-                texture_path = INVENTORY_ICONS[item_type]
-                self.item_textures[item_type] = arcade.load_texture(texture_path)
-            except (KeyError, FileNotFoundError) as e:
-                print(f"Warning: Could not load texture for {item_type}: {e}")
-                self.item_textures[item_type] = None
-    
+        # Retained layout, rebuilt when the window size changes
+        self.window_size = None
+        self.panel_x = 0
+        self.panel_y = 0
+        self.bar_y = 0
+        self.title_text = None
+        self.empty_text = None
+        self.item_list = None
+        self.scroll_remainder = 0.0  # Wheel/trackpad delta not yet turned into whole rows
+
+        self.visible = False
+        self.layout_version = 0  # Bumped whenever the panel moves, appears or disappears
+
+    def get_inventory(self):
+        """Get the inventory this panel shows (None hides the panel)"""
+        if not self.game_state or not self.game_state.player_entity:
+            return None
+        return self.game_state.player_entity.inventory
+
+    def _layout(self, width, height):
+        """Place the panel in the window and build its retained widgets"""
+        self.window_size = (width, height)
+        self.panel_x = width - (self.PANEL_WIDTH + self.PADDING) * (self.PANEL_SLOT + 1)
+        self.panel_y = height - self.PADDING
+        self.bar_y = self.panel_y - self.PADDING - self.TITLE_FONT_SIZE - 32
+
+        self.title_text = arcade.Text(
+            self.TITLE,
+            self.panel_x + self.PADDING,
+            self.panel_y - self.PADDING - self.TITLE_FONT_SIZE,
+            arcade.color.ASH_GREY,
+            self.TITLE_FONT_SIZE,
+            font_name=self.FONT_NAME
+        )
+
+        # The first row is centered one item spacing below the capacity bar
+        first_row_y = self.bar_y - self.CAPACITY_BAR_HEIGHT - self.ITEM_SPACING
+        self.empty_text = arcade.Text(
+            "Empty",
+            self.panel_x + self.PADDING,
+            first_row_y,
+            arcade.color.WHITE,
+            self.ITEM_FONT_SIZE,
+            font_name=self.FONT_NAME
+        )
+
+        list_top = first_row_y + self.ITEM_SPACING / 2
+        list_bottom = self.panel_y - self.PANEL_HEIGHT + self.PADDING
+        inventory = self.item_list.inventory if self.item_list else None
+        self.item_list = InventoryList(
+            self.panel_x + self.PADDING,
+            list_top,
+            self.PANEL_WIDTH - self.PADDING * 2,
+            list_top - list_bottom,
+            self.ITEM_SPACING
+        )
+        self.item_list.bind(inventory)
+        self.layout_version += 1
+
+    def update(self):
+        """Follow the shown inventory and the window size - call once per frame before render"""
+        window = arcade.get_window()
+        if (window.width, window.height) != self.window_size:
+            self._layout(window.width, window.height)
+
+        inventory = self.get_inventory()
+        visible = inventory is not None
+        if visible != self.visible:
+            self.visible = visible
+            self.layout_version += 1
+        self.item_list.bind(inventory)
+        self.item_list.update()
+
+    def contains_point(self, x, y):
+        """Check if a point is on the panel"""
+        return (self.panel_x <= x <= self.panel_x + self.PANEL_WIDTH
+                and self.panel_y - self.PANEL_HEIGHT <= y <= self.panel_y)
+
+    def add_hit_target(self, hit_grid):
+        """Put the panel's bounds in the UI hit grid while it is shown"""
+        if self.visible:
+            hit_grid.add(self, self.panel_x, self.panel_y - self.PANEL_HEIGHT, self.PANEL_WIDTH, self.PANEL_HEIGHT)
+
+    def on_click(self, game_state):
+        """Clicks on the panel don't reach the world"""
+
+    def on_scroll(self, scroll_y):
+        """Scroll the item list by whole rows once enough wheel or trackpad delta has built up"""
+        # Turning around drops what was left over from the other direction
+        if scroll_y * self.scroll_remainder < 0:
+            self.scroll_remainder = 0.0
+        self.scroll_remainder += scroll_y
+        rows = int(self.scroll_remainder)
+        if rows:
+            self.scroll_remainder -= rows
+            self.item_list.scroll(rows)
+
     def _draw_capacity_bar(self, x, y, width, current, maximum):
         """Draw the inventory capacity bar
-        
+
         Args:
             x: Left x coordinate
             y: Top y coordinate
@@ -59,10 +147,10 @@ class InventoryUIRenderer:
             self.CAPACITY_BAR_HEIGHT,
             self.CAPACITY_BAR_BG_COLOR
         )
-        
+
         # Calculate fill width based on current/maximum
         fill_width = (current / maximum) * width
-        
+
         # Draw fill
         if fill_width > 0:
             # Calculate blink opacity if near full
@@ -72,10 +160,10 @@ class InventoryUIRenderer:
                 self.blink_time += arcade.get_window().delta_time
                 # Calculate opacity using sine wave (0.5 to 1.0 range)
                 opacity = int(255 * (0.5 + 0.5 * math.sin(self.blink_time * self.BLINK_SPEED * math.pi)))
-            
+
             # Create color with current opacity
             fill_color = (255, 255, 255, opacity)
-            
+
             arcade.draw_lbwh_rectangle_filled(
                 x,
                 y - self.CAPACITY_BAR_HEIGHT,
@@ -83,124 +171,50 @@ class InventoryUIRenderer:
                 self.CAPACITY_BAR_HEIGHT,
                 fill_color
             )
-    
+
     def render(self):
         """Render the inventory UI"""
-        if not self.game_state or not self.game_state.player_entity:
-            print("Cannot render inventory: game_state or player_entity is None")
-            return
-            
-        # Get player's inventory
-        inventory = self.game_state.player_entity.inventory
-        if not inventory:
-            print("Cannot render inventory: player inventory is None")
+        if not self.visible:
             return
-            
-        # Calculate panel position (top-right corner)
-        screen_width = arcade.get_window().width
-        panel_x = screen_width - self.PANEL_WIDTH - self.PADDING
-        panel_y = arcade.get_window().height - self.PADDING
-        
+        inventory = self.item_list.inventory
+
         # Draw panel background
         arcade.draw_lbwh_rectangle_filled(
-            panel_x,
-            panel_y - self.PANEL_HEIGHT,
+            self.panel_x,
+            self.panel_y - self.PANEL_HEIGHT,
             self.PANEL_WIDTH,
             self.PANEL_HEIGHT,
             self.PANEL_COLOR
         )
-        
+
         # Draw inventory title
-        arcade.draw_text(
-            "Mineral Hold",
-            panel_x + self.PADDING,
-            panel_y - self.PADDING - self.TITLE_FONT_SIZE,
-            arcade.color.ASH_GREY,
-            self.TITLE_FONT_SIZE,
-            font_name=self.FONT_NAME
-        )
-        
+        self.title_text.draw()
+
         # Draw inventory capacity bar
-        bar_y = panel_y - self.PADDING - self.TITLE_FONT_SIZE - 32
         self._draw_capacity_bar(
-            panel_x + self.PADDING,
-            bar_y,
+            self.panel_x + self.PADDING,
+            self.bar_y,
             self.PANEL_WIDTH - (self.PADDING * 2),
             inventory.get_total_units(),
             inventory.max_units
         )
-        
+
         # Draw inventory contents
         if not inventory.items:
-            # Draw "Empty" text if inventory is empty
-            arcade.draw_text(
-                "Empty",
-                panel_x + self.PADDING,
-                bar_y - self.CAPACITY_BAR_HEIGHT - self.ITEM_SPACING,
-                arcade.color.WHITE,
-                self.ITEM_FONT_SIZE,
-                font_name=self.FONT_NAME
-            )
+            self.empty_text.draw()
         else:
-            # Draw each item in the inventory
-            y = bar_y - self.CAPACITY_BAR_HEIGHT - self.ITEM_SPACING
-            for item_type, quantity in inventory.items.items():
-                # Draw item icon
-                if item_type in self.item_textures and self.item_textures[item_type]:
-                    arcade.draw_texture_rect(
-                        self.item_textures[item_type],
-                        arcade.XYWH(
-                            panel_x + self.PADDING + self.ICON_SIZE/2,
-                            y,
-                            self.ICON_SIZE,
-                            self.ICON_SIZE,
-                        )
-                    )
-                
-                # Draw item quantity and name
-                name = ORE_NAMES.get(item_type, item_type.name.title())
-                text = f"{quantity} x {name}"
-                arcade.draw_text(
-                    text,
-                    panel_x + self.PADDING + self.ICON_SIZE + 4,
-                    y - 8,
-                    arcade.color.Color(255, 255, 255, 200),  # Semi-transparent white
-                    self.ITEM_FONT_SIZE,
-                    font_name=self.FONT_NAME
-                )
-                
-                y -= self.ITEM_SPACING
-    
-    def _draw_inventory_item(self, item_type: InventoryType, quantity: int, x: float, y: float):
-        """Draw a single inventory item row
-        
-        Args:
-            item_type: Type of inventory item
-            quantity: Amount of the item
-            x: Left x coordinate
-            y: Top y coordinate
-        """
-        # Draw item icon
-        if item_type in self.item_textures and self.item_textures[item_type]:
-            arcade.draw_texture_rect(
-                self.item_textures[item_type],
-                arcade.XYWH(
-                    x + self.ICON_SIZE/2,
-                    y - self.ICON_SIZE/2,
-                    self.ICON_SIZE,
-                    self.ICON_SIZE
-                ),
-                angle=0
-            )
-        
-        # Draw quantity x name
-        name = ORE_NAMES.get(item_type, item_type.name.title())
-        text = f"{quantity} x {name}"
-        arcade.draw_text(
-            text,
-            x + self.ICON_SIZE + 10,
-            y - 10,
-            arcade.color.WHITE,
-            self.ITEM_FONT_SIZE,
-            font_name=self.FONT_NAME
-        ) 
\ No newline at end of file
+            self.item_list.render()
+
+
+class DepotInventoryUIRenderer(InventoryUIRenderer):
+    """Renders the inventory of the selected mobile depot, left of the player's"""
+
+    TITLE = "Mobile Depot"
+    PANEL_SLOT = 1
+
+    def get_inventory(self):
+        """Get the selected depot's inventory (None hides the panel)"""
+        selected = self.game_state.selected_entity if self.game_state else None
+        if isinstance(selected, MobileDepot):
+            return selected.inventory
+        return None
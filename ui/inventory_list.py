@@ -0,0 +1,222 @@
+"""
+Inventory List - scrollable list of inventory items that only draws the visible rows
+
+The list owns one row widget per line that fits in its area, not one per
+item type. Scrolling, or an item type appearing or running out, points the
+rows at other items; a row rebuilds its label only when the item or the
+quantity it shows changes. Icons and display names are cached per item
+type, so a large hold costs no more per frame than a small one.
+"""
+
+import arcade
+from core.texture_cache import get_texture
+from game_state.inventory_types import INVENTORY_ICONS, ORE_NAMES
+
+# Inventory List Constants - Easy to tune
+ROW_HEIGHT = 48
+ICON_SIZE = 48
+ITEM_FONT_SIZE = 16
+ITEM_TEXT_COLOR = (255, 255, 255, 200)   # Semi-transparent white
+FONT_NAME = "EveSansNeue-Regular"
+SCROLLBAR_WIDTH = 4
+SCROLLBAR_TRACK_COLOR = (255, 255, 255, 25)
+SCROLLBAR_THUMB_COLOR = (255, 255, 255, 120)
+
+# Item type -> ItemVisual, shared by every list
+_item_visuals = {}
+
+
+class ItemVisual:
+    """Icon and display name of an item type"""
+
+    __slots__ = ("texture", "name")
+
+    def __init__(self, texture, name):
+        self.texture = texture
+        self.name = name
+
+
+def get_item_visual(item_type):
+    """
+    Get the cached icon and display name of an item type
+
+    Args:
+        item_type: InventoryType
+
+    Returns:
+        ItemVisual: Its icon texture (None if it could not be loaded) and name
+    """
+    visual = _item_visuals.get(item_type)
+    if visual is None:
+        texture = None
+        try:
+            texture = get_texture(INVENTORY_ICONS[item_type])
+        except (KeyError, FileNotFoundError) as e:
+            print(f"Warning: Could not load texture for {item_type}: {e}")
+        visual = ItemVisual(texture, ORE_NAMES.get(item_type, item_type.name.title()))
+        _item_visuals[item_type] = visual
+    return visual
+
+
+class InventoryRow:
+    """One visible line of the list - shows whichever item it is pointed at"""
+
+    def __init__(self, left, center_y):
+        """
+        Initialize an empty row
+
+        Args:
+            left: Left x coordinate of the row
+            center_y: Y coordinate of the row's center line
+        """
+        self.item_type = None
+        self.quantity = None
+        self.icon = None
+        self.icon_rect = arcade.XYWH(left + ICON_SIZE / 2, center_y, ICON_SIZE, ICON_SIZE)
+        self.label = arcade.Text("", left + ICON_SIZE + 4, center_y - 8, ITEM_TEXT_COLOR, ITEM_FONT_SIZE,
+                                 font_name=FONT_NAME)
+
+    def show(self, item_type, quantity):
+        """
+        Point the row at an item
+
+        Args:
+            item_type: InventoryType to show
+            quantity: Its quantity
+
+        Returns:
+            bool: True if the label had to be rebuilt
+        """
+        if item_type is self.item_type and quantity == self.quantity:
+            return False
+        visual = get_item_visual(item_type)
+        self.item_type = item_type
+        self.quantity = quantity
+        self.icon = visual.texture
+        self.label.text = f"{quantity} x {visual.name}"
+        return True
+
+    def render(self):
+        """Draw the row's icon and label"""
+        if self.icon is not None:
+            arcade.draw_texture_rect(self.icon, self.icon_rect)
+        self.label.draw()
+
+
+class InventoryList:
+    """Virtualized, scrollable list of an inventory's items"""
+
+    def __init__(self, left, top, width, height, row_height=ROW_HEIGHT):
+        """
+        Initialize the list and its row widgets
+
+        Args:
+            left: Left x coordinate of the list area
+            top: Top y coordinate of the list area
+            width: Width of the list area
+            height: Height of the list area - as many rows as fit are created
+            row_height: Height of a row in pixels
+        """
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.row_height = row_height
+        self.rows = [InventoryRow(left, top - row_height / 2 - i * row_height)
+                     for i in range(max(1, int(height // row_height)))]
+
+        self.inventory = None
+        self.items = None          # The items dict the order was taken from
+        self.item_types = []       # Display order (insertion order of the inventory)
+        self.order_dirty = True
+        self.first_row = 0         # Index in item_types of the topmost visible row
+        self.shown_count = 0       # Rows currently pointed at an item
+
+    def bind(self, inventory):
+        """
+        Show another inventory (or None for nothing)
+
+        Args:
+            inventory: Inventory to list
+        """
+        if inventory is self.inventory:
+            return
+        if self.inventory is not None:
+            self.inventory.on_items_added.disconnect(self._on_items_added)
+            self.inventory.on_items_removed.disconnect(self._on_items_removed)
+        self.inventory = inventory
+        if inventory is not None:
+            inventory.on_items_added.connect(self._on_items_added)
+            inventory.on_items_removed.connect(self._on_items_removed)
+        self.first_row = 0
+        self.order_dirty = True
+
+    def _on_items_added(self, inventory, item_type, quantity, **kwargs):
+        """A new item type changes the order - other quantity changes are picked up per row"""
+        if inventory.items.get(item_type) == quantity:
+            self.order_dirty = True
+
+    def _on_items_removed(self, inventory, item_type, quantity, **kwargs):
+        """An item type that ran out changes the order"""
+        if item_type not in inventory.items:
+            self.order_dirty = True
+
+    def _relayout(self, items):
+        """Take the display order from the items and point the rows at the visible ones"""
+        self.order_dirty = False
+        self.items = items
+        self.item_types = list(items)
+        self.first_row = min(self.first_row, self.max_first_row())
+        self.shown_count = min(len(self.rows), len(self.item_types) - self.first_row)
+
+    def max_first_row(self):
+        """Index of the topmost row when scrolled all the way down"""
+        return max(0, len(self.item_types) - len(self.rows))
+
+    def update(self):
+        """Bring the visible rows up to date - call once per frame"""
+        inventory = self.inventory
+        if inventory is None:
+            self.shown_count = 0
+            return
+        items = inventory.items
+        # restore_items() replaces the dict without sending signals
+        if self.order_dirty or items is not self.items:
+            self._relayout(items)
+        item_types = self.item_types
+        first_row = self.first_row
+        for index in range(self.shown_count):
+            item_type = item_types[first_row + index]
+            self.rows[index].show(item_type, items.get(item_type, 0))
+
+    def scroll(self, rows):
+        """
+        Scroll by whole rows
+
+        Args:
+            rows: Rows to scroll - positive moves toward the top of the list
+
+        Returns:
+            bool: True if the list moved
+        """
+        first_row = max(0, min(self.first_row - rows, self.max_first_row()))
+        if first_row == self.first_row:
+            return False
+        self.first_row = first_row
+        self.shown_count = min(len(self.rows), len(self.item_types) - first_row)
+        return True
+
+    def render(self):
+        """Draw the visible rows, and a scrollbar if not every item fits"""
+        for index in range(self.shown_count):
+            self.rows[index].render()
+
+        total = len(self.item_types)
+        if total > len(self.rows):
+            bar_left = self.left + self.width - SCROLLBAR_WIDTH
+            bottom = self.top - self.height
+            arcade.draw_lbwh_rectangle_filled(bar_left, bottom, SCROLLBAR_WIDTH, self.height, SCROLLBAR_TRACK_COLOR)
+            thumb_height = self.height * len(self.rows) / total
+            thumb_top = self.top - self.height * self.first_row / total
+            arcade.draw_lbwh_rectangle_filled(bar_left, thumb_top - thumb_height, SCROLLBAR_WIDTH, thumb_height,
+                                              SCROLLBAR_THUMB_COLOR)
@@ -1,16 +1,67 @@
 """
 Module UI - handles module button rendering and interaction
+
+The buttons are a retained widget tree: they are built when the player's
+equipped modules change (PlayerEntity.on_modules_changed), and each button
+keeps its circles as prebuilt shapes, rebuilt only when its module's state
+changes. The cycle progress arc moves nearly every frame while a module
+cycles, so it is drawn directly instead of being rebuilt into a new shape
+buffer each time. Per frame, an idle button costs a state compare and its
+draw calls.
 """
 
 import arcade
 import math
+from arcade.shape_list import ShapeElementList, create_ellipse_filled, create_triangles_strip_filled_with_colors
 from core.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from core.texture_cache import get_texture
+from entities.base_module import STATE_READY, STATE_COOLING_DOWN, STATE_ACTIVE
+
+# Module Button Constants - Easy to tune
+BUTTON_RADIUS = 30
+BUTTON_BORDER_WIDTH = 3
+BUTTON_SEGMENTS = 30            # Segments per circle (what arcade picks for a 30 px radius)
+PROGRESS_ARC_WIDTH = 5
+PROGRESS_ARC_COLOR = arcade.color.DARK_RED   # Remaining cycle (more visible against orange)
+
+# Button fill and border color per module state
+BUTTON_COLORS = {
+    STATE_READY: ((64, 64, 64, 200), (64, 64, 64, 255)),            # Dark gray
+    STATE_COOLING_DOWN: ((255, 165, 0, 200), (255, 165, 0, 255)),   # Orange
+    STATE_ACTIVE: ((0, 255, 0, 200), (0, 255, 0, 255)),             # Green
+}
+
+
+def _create_ring(x, y, inner_radius, outer_radius, color, start_angle=0, end_angle=360, segments=BUTTON_SEGMENTS):
+    """
+    Create a ring (or a section of one) as a triangle strip
+
+    Args:
+        x, y: Center of the ring
+        inner_radius: Inner edge radius
+        outer_radius: Outer edge radius
+        color: Fill color
+        start_angle: Start, in degrees counterclockwise from the +x axis
+        end_angle: End, in the same units
+        segments: Number of segments
+
+    Returns:
+        arcade.shape_list.Shape: The ring
+    """
+    points = []
+    for segment in range(segments + 1):
+        theta = math.radians(start_angle + (end_angle - start_angle) * segment / segments)
+        cos_theta = math.cos(theta)
+        sin_theta = math.sin(theta)
+        points.append((x + inner_radius * cos_theta, y + inner_radius * sin_theta))
+        points.append((x + outer_radius * cos_theta, y + outer_radius * sin_theta))
+    return create_triangles_strip_filled_with_colors(points, [color] * len(points))
 
 
 class ModuleButton:
     """Represents a single module button"""
     
-    def __init__(self, module, x, y, radius=30):
+    def __init__(self, module, x, y, radius=BUTTON_RADIUS, module_index=0):
         """
         Initialize a module button
         
@@ -18,49 +69,80 @@ class ModuleButton:
             module: The module this button represents
             x, y: Center position of the button
             radius: Button radius in pixels
+            module_index: Index of the module on the player's ship
         """
         self.module = module
+        self.module_index = module_index
         self.x = x
         self.y = y
         self.radius = radius
         self.icon_texture = None
+        self.label = None
         self._load_icon()
+
+        # Retained shapes and the module state they were built for
+        self.shapes = None
+        self.drawn_state = None
+        self.refresh()
     
     def _load_icon(self):
-        """Load the module's icon texture"""
+        """Load the module's icon texture, or make the fallback label"""
         if self.module.icon_path:
             try:
-                self.icon_texture = arcade.load_texture(self.module.icon_path)
+                self.icon_texture = get_texture(self.module.icon_path)
             except FileNotFoundError:
                 print(f"Warning: Could not load module icon: {self.module.icon_path}")
                 self.icon_texture = None
+        if self.icon_texture is None:
+            # Fallback: module name initial
+            initial = self.module.name[0].upper() if self.module.name else "?"
+            self.label = arcade.Text(initial, self.x, self.y, arcade.color.WHITE, font_size=16,
+                                     anchor_x="center", anchor_y="center")
     
     def contains_point(self, x, y):
         """Check if a point is inside this button"""
-        distance = math.sqrt((x - self.x) ** 2 + (y - self.y) ** 2)
-        return distance <= self.radius
-    
+        dx = x - self.x
+        dy = y - self.y
+        return dx * dx + dy * dy <= self.radius * self.radius
+
+    def add_hit_target(self, hit_grid):
+        """Put this button's bounds in the UI hit grid"""
+        hit_grid.add(self, self.x - self.radius, self.y - self.radius, self.radius * 2, self.radius * 2)
+
+    def on_click(self, game_state):
+        """Activate this button's module"""
+        if game_state.player_entity:
+            game_state.player_entity.activate_module(self.module_index)
+
+    def refresh(self):
+        """
+        Rebuild the shapes if the module state changed - call once per frame
+
+        Returns:
+            bool: True if the shapes were rebuilt
+        """
+        state = self.module.state
+        if state == self.drawn_state:
+            return False
+        self.drawn_state = state
+        self.shapes = self._build_shapes(state)
+        return True
+
+    def _build_shapes(self, state):
+        """Build the background circle and border for a module state"""
+        button_color, border_color = BUTTON_COLORS.get(state, BUTTON_COLORS[STATE_ACTIVE])
+        shapes = ShapeElementList()
+        shapes.append(create_ellipse_filled(self.x, self.y, self.radius * 2, self.radius * 2, button_color,
+                                            num_segments=BUTTON_SEGMENTS))
+        shapes.append(_create_ring(self.x, self.y, self.radius - BUTTON_BORDER_WIDTH, self.radius, border_color))
+        return shapes
+
     def render(self):
-        """Render the module button"""
-        # Determine button color based on module state
-        if self.module.state == "ready":
-            button_color = (64, 64, 64, 200)  # Dark gray with transparency
-            border_color = (64, 64, 64, 255)  # Solid dark gray border
-        elif self.module.state == "cooling_down":
-            button_color = (255, 165, 0, 200)  # Orange with transparency
-            border_color = (255, 165, 0, 255)  # Solid orange border
-        else:  # active
-            button_color = (0, 255, 0, 200)  # Green with transparency
-            border_color = (0, 255, 0, 255)  # Solid green border
-        
-        # Draw button background circle
-        arcade.draw_circle_filled(self.x, self.y, self.radius, button_color)
-        
-        # Draw button border
-        arcade.draw_circle_outline(self.x, self.y, self.radius, border_color, 3)
+        """Render the module button from its retained shapes"""
+        self.shapes.draw()
         
         # Draw cycle progress arc if not ready
-        if self.module.state != "ready":
+        if self.drawn_state != STATE_READY:
             self._render_cycle_progress()
         
         # Draw module icon
@@ -73,33 +155,20 @@ class ModuleButton:
                 angle=0
             )
         else:
-            # Fallback: draw module name initial
-            initial = self.module.name[0].upper() if self.module.name else "?"
-            arcade.draw_text(
-                initial,
-                self.x, self.y,
-                arcade.color.WHITE,
-                font_size=16,
-                anchor_x="center",
-                anchor_y="center"
-            )
-    
+            self.label.draw()
+
     def _render_cycle_progress(self):
-        """Render cycle progress as a circular arc"""
+        """Render the remaining cycle as an arc, from the top, clockwise"""
         progress = self.module.get_cycle_progress()
-        
-        # Draw progress arc (from top, clockwise)
-        start_angle = 90  # Start at top
-        end_angle = start_angle - (360 * progress)  # Clockwise progress
-
         if progress > 0:
-            # Draw the remaining cycle arc in dark red (more visible against orange)
+            start_angle = 90
+            end_angle = start_angle - 360 * progress
             arcade.draw_arc_outline(
-                self.x, self.y, 
-                self.radius * 2, self.radius * 2,  # width, height
-                arcade.color.DARK_RED,
-                end_angle, start_angle,  # remaining portion
-                5  # line width
+                self.x, self.y,
+                self.radius * 2, self.radius * 2,
+                PROGRESS_ARC_COLOR,
+                end_angle, start_angle,
+                PROGRESS_ARC_WIDTH
             )
 
 
@@ -111,15 +180,49 @@ class ModuleUI:
         self.buttons = []
         self.button_spacing = 80  # Distance between button centers
         self.bottom_margin = 60   # Distance from bottom of screen
+        self.player_entity = None
+        self.layout_dirty = True
+        self.layout_version = 0   # Bumped whenever the buttons are rebuilt
     
     def update(self, player_entity):
-        """Update module buttons based on player's equipped modules"""
-        if not player_entity:
-            self.buttons.clear()
+        """
+        Keep the buttons in sync with the player's equipped modules
+
+        The buttons are only rebuilt after the player (or its modules)
+        changed; otherwise each button just refreshes what moved.
+
+        Args:
+            player_entity: The player, or None
+        """
+        if player_entity is not self.player_entity:
+            self._bind(player_entity)
+        if self.layout_dirty:
+            self._rebuild()
+        for button in self.buttons:
+            button.refresh()
+
+    def _bind(self, player_entity):
+        """Follow another player's module changes"""
+        if self.player_entity is not None:
+            self.player_entity.on_modules_changed.disconnect(self._on_modules_changed)
+        self.player_entity = player_entity
+        if player_entity is not None:
+            player_entity.on_modules_changed.connect(self._on_modules_changed)
+        self.layout_dirty = True
+
+    def _on_modules_changed(self, player_entity, **kwargs):
+        """Rebuild the buttons on the next update"""
+        self.layout_dirty = True
+
+    def _rebuild(self):
+        """Create one button per equipped module"""
+        self.layout_dirty = False
+        self.layout_version += 1
+        self.buttons.clear()
+        if not self.player_entity:
             return
         
-        modules = player_entity.get_equipped_modules()
-        self.buttons.clear()
+        modules = self.player_entity.get_equipped_modules()
         
         # Calculate starting position for centered buttons
         total_width = len(modules) * self.button_spacing - self.button_spacing
@@ -129,7 +232,7 @@ class ModuleUI:
         for i, module in enumerate(modules):
             x = start_x + i * self.button_spacing
             y = self.bottom_margin
-            button = ModuleButton(module, x, y)
+            button = ModuleButton(module, x, y, module_index=i)
             self.buttons.append(button)
     
     def render(self):
@@ -137,21 +240,7 @@ class ModuleUI:
         for button in self.buttons:
             button.render()
     
-    def handle_mouse_click(self, x, y, player_entity):
-        """
-        Handle mouse click events
-        
-        Args:
-            x, y: Mouse click position
-            player_entity: Player entity to activate modules on
-            
-        Returns:
-            bool: True if a button was clicked
-        """
-        for i, button in enumerate(self.buttons):
-            if button.contains_point(x, y):
-                # Activate the corresponding module
-                if player_entity:
-                    success = player_entity.activate_module(i)
-                    return success
-        return False 
\ No newline at end of file
+    def add_hit_targets(self, hit_grid):
+        """Put every button in the UI hit grid"""
+        for button in self.buttons:
+            button.add_hit_target(hit_grid)
@@ -4,9 +4,10 @@ UI Renderer - handles all user interface rendering
 
 import arcade
 from core.constants import *
+from ui.hit_grid import HitGrid
 from ui.module_ui import ModuleUI
 from game_state.game_state import GameState
-from ui.inventory import InventoryUIRenderer
+from ui.inventory import InventoryUIRenderer, DepotInventoryUIRenderer
 
 
 class UIRenderer:
@@ -16,6 +17,12 @@ class UIRenderer:
         """Initialize the UI renderer"""
         self.module_ui = ModuleUI()
         self.inventory_renderer = InventoryUIRenderer(game_state=game_state)
+        self.depot_inventory_renderer = DepotInventoryUIRenderer(game_state=game_state)
+        
+        # Clickable widgets by screen position, rebuilt when a layout changes
+        self.hit_grid = HitGrid()
+        self.hit_grid_version = None
+        self.hovered_widget = None
         
     def render(self, game_state: GameState):
         """Render all UI elements
@@ -26,13 +33,33 @@ class UIRenderer:
         self._render_hud(game_state)
         self._render_controls_hint()
         
-        # Update and render module UI
+        # Bring the retained widgets up to date before hit testing and drawing
         self.module_ui.update(game_state.player_entity)
+        self.inventory_renderer.update()
+        self.depot_inventory_renderer.update()
+        self._update_hit_grid()
+        
+        # Render module UI
         self.module_ui.render()
         
         # Render inventory UI
         self.inventory_renderer.render()
+        self.depot_inventory_renderer.render()
     
+    def _update_hit_grid(self):
+        """Re-add every widget to the hit grid after a layout change"""
+        version = (self.module_ui.layout_version,
+                   self.inventory_renderer.layout_version,
+                   self.depot_inventory_renderer.layout_version)
+        if version == self.hit_grid_version:
+            return
+        self.hit_grid_version = version
+        self.hit_grid.clear()
+        self.inventory_renderer.add_hit_target(self.hit_grid)
+        self.depot_inventory_renderer.add_hit_target(self.hit_grid)
+        self.module_ui.add_hit_targets(self.hit_grid)
+        self.hovered_widget = None
+
     def handle_mouse_click(self, x: float, y: float, game_state: GameState) -> bool:
         """Handle mouse click events
         
@@ -42,13 +69,45 @@ class UIRenderer:
             game_state: Current game state
             
         Returns:
-            bool: True if the click was handled by UI
+            bool: True if the click was on a widget (and shouldn't reach the world)
+        """
+        widget = self.hit_grid.hit(x, y)
+        if widget is None:
+            return False
+        widget.on_click(game_state)
+        return True
+
+    def handle_mouse_motion(self, x: float, y: float) -> bool:
+        """Track the widget under the mouse
+        
+        Args:
+            x: Mouse x coordinate
+            y: Mouse y coordinate
+            
+        Returns:
+            bool: True if the mouse is over a widget
         """
-        # Check if module UI handled the click
-        if game_state.player_entity:
-            return self.module_ui.handle_mouse_click(x, y, game_state.player_entity)
+        self.hovered_widget = self.hit_grid.hit(x, y)
+        return self.hovered_widget is not None
+
+    def handle_mouse_scroll(self, x: float, y: float, scroll_y: float) -> bool:
+        """Scroll the widget under the mouse
         
-        return False
+        Args:
+            x: Mouse x coordinate
+            y: Mouse y coordinate
+            scroll_y: Wheel movement, positive away from the user
+            
+        Returns:
+            bool: True if the mouse is over a widget
+        """
+        widget = self.hit_grid.hit(x, y)
+        if widget is None:
+            return False
+        on_scroll = getattr(widget, "on_scroll", None)
+        if on_scroll is not None:
+            on_scroll(scroll_y)
+        return True
             
     def _render_hud(self, game_state):
         """Render heads-up display elements"""